@@ -0,0 +1,61 @@
+#!/usr/bin/python3
+
+# Only needed if not installed system wide
+import sys
+sys.path.insert(0, '../..')
+
+
+# Program start here
+#
+# Capture the screen (or a region of it) repeatedly with each of the
+# selected display controllers and report the achieved frames per second
+# for both the raw in-memory buffers and the full image targets. The main
+# purpose of this sample is to compare the capturing overhead of the
+# available display control backends on a given system.
+
+
+import time
+import logging
+
+from guibot.controller import *
+
+
+# Parameters to toy with
+BACKENDS = ["autopy", "xdotool", "pyautogui"]  # extra example: ["vncdotool"]
+# capture region as (x, y, width, height) or empty tuple for full screen
+REGION = ()
+DURATION = 5.0
+
+
+# Overall logging setup
+handler = logging.StreamHandler()
+logging.getLogger('').addHandler(handler)
+logging.getLogger('').setLevel(logging.INFO)
+formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+handler.setFormatter(formatter)
+
+
+def measure_fps(capture, duration):
+    """Call a capture function for a fixed duration and return its rate."""
+    frames = 0
+    start_time = time.time()
+    while time.time() - start_time < duration:
+        capture(*REGION)
+        frames += 1
+    return frames / (time.time() - start_time)
+
+
+# Main steps: benchmark each display controller
+for backend in BACKENDS:
+    if backend == "autopy":
+        controller = AutoPyController()
+    elif backend == "xdotool":
+        controller = XDoToolController()
+    elif backend == "vncdotool":
+        controller = VNCDoToolController()
+    elif backend == "pyautogui":
+        controller = PyAutoGUIController()
+    raw_fps = measure_fps(controller.capture_raw, DURATION)
+    image_fps = measure_fps(controller.capture_screen, DURATION)
+    logging.info("Controller %s captures %.2f raw fps and %.2f image fps",
+                 backend, raw_fps, image_fps)
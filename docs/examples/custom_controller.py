@@ -227,8 +227,10 @@ class QemuController(Controller):
 
         See base method for details.
         """
-        xpos, ypos, width, height, filename = self._region_from_args(*args)
+        xpos, ypos, width, height = self._region_from_args(*args)
         # TODO: capture subregion not present - own implementation?
+        with NamedTemporaryFile(prefix='guibot', suffix='.ppm') as f:
+            filename = f.name
         self._backend_obj.screendump(filename=filename, debug=True)
         with PIL.Image.open(filename) as pil_image:
             os.unlink(filename)
@@ -0,0 +1,99 @@
+#!/usr/bin/python3
+
+# Only needed if not installed system wide
+import sys
+sys.path.insert(0, '../..')
+
+
+# Program start here
+#
+# Match a large number of synthetic binary feature descriptors with the
+# ratio and symmetry tests enabled and compare the time of the feature
+# matching stage to the time a naive pure Python filtering of the same
+# matches would take. The main purpose of this sample is to show how the
+# feature matching scales on dense screens with thousands of keypoints.
+
+
+import time
+import logging
+
+import cv2
+import numpy
+
+from guibot.finder import FeatureFinder
+
+
+# Parameters to toy with
+NEEDLE_KEYPOINTS = 5000
+HAYSTACK_KEYPOINTS = 10000
+# fraction of descriptor bits flipped for the needle copies of haystack features
+NOISE = 0.05
+
+
+# Overall logging setup
+handler = logging.StreamHandler()
+logging.getLogger('').addHandler(handler)
+logging.getLogger('').setLevel(logging.INFO)
+formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+handler.setFormatter(formatter)
+
+
+def synthetic_features():
+    """Generate haystack features and noisy needle copies of some of them."""
+    rng = numpy.random.default_rng(0)
+    hdescriptors = rng.integers(0, 256, (HAYSTACK_KEYPOINTS, 32), dtype=numpy.uint8)
+    indices = rng.choice(HAYSTACK_KEYPOINTS, NEEDLE_KEYPOINTS, replace=False)
+    bits = numpy.unpackbits(hdescriptors[indices], axis=1)
+    bits ^= (rng.random(bits.shape) < NOISE).astype(numpy.uint8)
+    ndescriptors = numpy.packbits(bits, axis=1)
+    hkeypoints = [cv2.KeyPoint(float(x), float(y), 31)
+                  for x, y in rng.uniform(0, 3840, (HAYSTACK_KEYPOINTS, 2))]
+    nkeypoints = [cv2.KeyPoint(float(x), float(y), 31)
+                  for x, y in rng.uniform(0, 400, (NEEDLE_KEYPOINTS, 2))]
+    return nkeypoints, ndescriptors, hkeypoints, hdescriptors
+
+
+def naive_filters(nmatches, hmatches, threshold):
+    """Filter matches with per match Python loops as a reference."""
+    def ratio_test(matches):
+        return [m[0] for m in matches
+                if len(m) == 1 or (m[0].distance + 1e-7) / (m[1].distance + 1e-7) < threshold]
+    nmatches = ratio_test(nmatches)
+    hmatches = ratio_test(hmatches)
+    symmetric = []
+    for nm in nmatches:
+        for hm in hmatches:
+            if nm.queryIdx == hm.trainIdx and nm.trainIdx == hm.queryIdx:
+                symmetric.append(nm)
+                break
+    return symmetric
+
+
+# Main steps: time the naive filtering and the actual feature matching stage
+nkeypoints, ndescriptors, hkeypoints, hdescriptors = synthetic_features()
+finder = FeatureFinder()
+finder.params["fmatch"]["ratioTest"].value = True
+finder.params["fmatch"]["symmetryTest"].value = True
+threshold = finder.params["fmatch"]["ratioThreshold"].value
+
+start_time = time.time()
+nmatches = finder.matcher.knnMatch(ndescriptors, hdescriptors, 2)
+hmatches = finder.matcher.knnMatch(hdescriptors, ndescriptors, 2)
+knn_duration = time.time() - start_time
+start_time = time.time()
+naive = naive_filters(nmatches, hmatches, threshold)
+naive_duration = time.time() - start_time
+
+finder.imglog.similarities.append(0.0)
+start_time = time.time()
+mnkp, mhkp = finder._match_features(nkeypoints, ndescriptors, hkeypoints, hdescriptors,
+                                    finder.params["fmatch"]["backend"])
+duration = time.time() - start_time
+
+logging.info("Matched %s of %s needle keypoints to %s haystack keypoints",
+             len(mnkp), NEEDLE_KEYPOINTS, HAYSTACK_KEYPOINTS)
+logging.info("Nearest neighbor search takes %.3f s and naive filtering %.3f s",
+             knn_duration, naive_duration)
+logging.info("Feature matching stage with vectorized filtering takes %.3f s "
+             "(filtering %.3f s)", duration, duration - knn_duration)
+assert len(naive) == len(mnkp)
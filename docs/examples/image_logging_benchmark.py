@@ -0,0 +1,74 @@
+#!/usr/bin/python3
+
+# Only needed if not installed system wide
+import sys
+sys.path.insert(0, '../..')
+
+
+# Program start here
+#
+# Dump the same screen sized image repeatedly with each of the supported
+# image logging formats and report the average encoding time and the size
+# of the written dumps. The main purpose of this sample is to choose an
+# affordable image logging format for verbose logging of large screens.
+
+
+import os
+import time
+import shutil
+import logging
+import tempfile
+
+import numpy
+
+from guibot.config import GlobalConfig
+from guibot.imagelogger import ImageLogger
+
+
+# Parameters to toy with
+FORMATS = ["png", "png-fast", "webp", "npy", "npz"]
+# size of the dumped image as (width, height)
+SIZE = (3840, 2160)
+REPEATS = 10
+
+
+# Overall logging setup
+handler = logging.StreamHandler()
+logging.getLogger('').addHandler(handler)
+logging.getLogger('').setLevel(logging.INFO)
+formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+handler.setFormatter(formatter)
+
+
+def screen_like_image(width, height):
+    """Generate a mostly flat image with many differently colored widgets."""
+    rng = numpy.random.default_rng(0)
+    image = numpy.full((height, width, 3), 230, dtype=numpy.uint8)
+    for _ in range(300):
+        x, y = rng.integers(0, width - 140), rng.integers(0, height - 60)
+        w, h = rng.integers(20, 140), rng.integers(10, 60)
+        image[y:y + h, x:x + w] = rng.integers(0, 255, 3)
+    return image
+
+
+def directory_size(path):
+    """Return the total size of all files in a directory."""
+    return sum(os.path.getsize(os.path.join(path, f)) for f in os.listdir(path))
+
+
+# Main steps: benchmark each image logging format
+hotmap = screen_like_image(*SIZE)
+GlobalConfig.image_logging_level = 10
+for file_format in FORMATS:
+    GlobalConfig.image_logging_destination = tempfile.mkdtemp()
+    GlobalConfig.image_logging_format = file_format
+    imglog = ImageLogger()
+    start_time = time.time()
+    for i in range(REPEATS):
+        imglog.dump_hotmap("imglog%03d-3hotmap.png" % i, hotmap)
+    ImageLogger.flush()
+    duration = (time.time() - start_time) / REPEATS
+    size = directory_size(GlobalConfig.image_logging_destination) / REPEATS
+    logging.info("Format %s takes %.1f ms and %.2f MB per dump",
+                 file_format, duration * 1000, size / 1e6)
+    shutil.rmtree(GlobalConfig.image_logging_destination)
@@ -62,6 +62,18 @@ class GlobalConfig(type):
     _image_logging_destination = "imglog"
     _image_logging_step_width = 3
     _image_quality = 3
+    _image_logging_queue_size = 0
+    _image_logging_queue_policy = "block"
+    _image_logging_ring_steps = 0
+    _image_logging_ring_memory = 256
+    _image_logging_dedup = False
+    _image_logging_format = "png"
+    _feature_cache_size = 100
+    _feature_cache_persist = False
+    _text_index_size = 10
+    _text_index_memory = 4
+    _ocr_cache_size = 1000
+    _ocr_cache_memory = 16
 
     # backends shared between all instances
     _display_control_backend = "autopy"
@@ -202,6 +214,10 @@ class GlobalConfig(type):
 
         :param value: whether to perform an extra needle dump on matching error
         :returns: current value if no argument was passed otherwise None
+
+        .. note:: If image logging steps are kept in memory (see
+            :py:attr:`image_logging_ring_steps`), all of them are dumped on
+            matching error instead.
         """
         if value is None:
             return cls._save_needle_on_error
@@ -290,6 +306,254 @@ class GlobalConfig(type):
         fget=image_logging_destination, fset=image_logging_destination
     )
 
+    def image_logging_queue_size(cls, value: int = None) -> int | None:
+        """
+        Getter/setter for property attribute.
+
+        :param value: maximal number of image dumps waiting to be written by
+                      a background thread or zero to write them synchronously
+        :returns: current value if no argument was passed otherwise None
+        """
+        if value is None:
+            return cls._image_logging_queue_size
+        else:
+            cls._image_logging_queue_size = value
+            return None
+
+    #: maximal number of image dumps waiting to be written by a background thread
+    # or zero to write them synchronously
+    image_logging_queue_size = property(
+        fget=image_logging_queue_size, fset=image_logging_queue_size
+    )
+
+    def image_logging_queue_policy(cls, value: str = None) -> str | None:
+        """
+        Getter/setter for property attribute.
+
+        :param value: policy for image dumps submitted to a full writing queue
+        :returns: current value if no argument was passed otherwise None
+        :raises: :py:class:`ValueError` if value is not among the supported policies
+
+        Supported policies:
+           * block - wait until a queued image dump is written
+           * drop_oldest - discard the oldest queued image dump
+           * drop_newest - discard the submitted image dump
+        """
+        if value is None:
+            return cls._image_logging_queue_policy
+        else:
+            if value not in ["block", "drop_oldest", "drop_newest"]:
+                raise ValueError("Unsupported image logging queue policy '%s'" % value)
+            cls._image_logging_queue_policy = value
+            return None
+
+    #: policy for image dumps submitted to a full writing queue
+    image_logging_queue_policy = property(
+        fget=image_logging_queue_policy, fset=image_logging_queue_policy
+    )
+
+    def image_logging_ring_steps(cls, value: int = None) -> int | None:
+        """
+        Getter/setter for property attribute.
+
+        :param value: number of last image logging steps kept in memory and
+                      written only on failure or zero to write all steps
+        :returns: current value if no argument was passed otherwise None
+        """
+        if value is None:
+            return cls._image_logging_ring_steps
+        else:
+            cls._image_logging_ring_steps = value
+            return None
+
+    #: number of last image logging steps kept in memory and written only on failure
+    # or zero to write all steps
+    image_logging_ring_steps = property(
+        fget=image_logging_ring_steps, fset=image_logging_ring_steps
+    )
+
+    def image_logging_ring_memory(cls, value: int = None) -> int | None:
+        """
+        Getter/setter for property attribute.
+
+        :param value: maximal memory in megabytes for the image logging
+                      steps kept in memory
+        :returns: current value if no argument was passed otherwise None
+        """
+        if value is None:
+            return cls._image_logging_ring_memory
+        else:
+            cls._image_logging_ring_memory = value
+            return None
+
+    #: maximal memory in megabytes for the image logging steps kept in memory
+    image_logging_ring_memory = property(
+        fget=image_logging_ring_memory, fset=image_logging_ring_memory
+    )
+
+    def image_logging_dedup(cls, value: bool = None) -> bool | None:
+        """
+        Getter/setter for property attribute.
+
+        :param value: whether to store identical needle and haystack dumps
+                      only once and reference them from an index file
+        :returns: current value if no argument was passed otherwise None
+        :raises: :py:class:`ValueError` if value is not a boolean
+
+        The per-step files can be restored from the index using
+        :py:func:`imagelogger.ImageLogger.restore_dumps`.
+        """
+        if value is None:
+            return cls._image_logging_dedup
+        elif value is True or value is False:
+            cls._image_logging_dedup = value
+            return None
+        else:
+            raise ValueError
+
+    #: whether to store identical needle and haystack dumps only once
+    image_logging_dedup = property(fget=image_logging_dedup, fset=image_logging_dedup)
+
+    def image_logging_format(cls, value: str = None) -> str | None:
+        """
+        Getter/setter for property attribute.
+
+        :param value: file format for the image logging dumps
+        :returns: current value if no argument was passed otherwise None
+        :raises: :py:class:`ValueError` if value is not among the supported formats
+
+        Supported formats:
+           * png - PNG compressed according to :py:attr:`image_quality`
+           * png-fast - PNG with the fastest run-length compression
+           * webp - lossless WebP with the fastest compression method
+           * npy - uncompressed numpy array per dump
+           * npz - uncompressed numpy arrays batched in a single archive
+                   `imglog.npz` per logging destination
+
+        The numpy formats are the cheapest to write but also the largest and
+        can be read back using :py:func:`imagelogger.ImageLogger.load_dump`.
+        Targets with their own match settings are always dumped as usual.
+        """
+        if value is None:
+            return cls._image_logging_format
+        else:
+            if value not in ["png", "png-fast", "webp", "npy", "npz"]:
+                raise ValueError("Unsupported image logging format '%s'" % value)
+            cls._image_logging_format = value
+            return None
+
+    #: file format for the image logging dumps
+    image_logging_format = property(
+        fget=image_logging_format, fset=image_logging_format
+    )
+
+    def feature_cache_size(cls, value: int = None) -> int | None:
+        """
+        Getter/setter for property attribute.
+
+        :param value: number of needle features (keypoints and descriptors)
+                      kept in memory or zero to always recompute them
+        :returns: current value if no argument was passed otherwise None
+        """
+        if value is None:
+            return cls._feature_cache_size
+        else:
+            cls._feature_cache_size = value
+            return None
+
+    #: number of needle features kept in memory or zero to always recompute them
+    feature_cache_size = property(fget=feature_cache_size, fset=feature_cache_size)
+
+    def feature_cache_persist(cls, value: bool = None) -> bool | None:
+        """
+        Getter/setter for property attribute.
+
+        :param value: whether to also store needle features in a file next
+                      to the needle image for reuse across runs
+        :returns: current value if no argument was passed otherwise None
+        :raises: :py:class:`ValueError` if value is not a boolean
+        """
+        if value is None:
+            return cls._feature_cache_persist
+        elif value is True or value is False:
+            cls._feature_cache_persist = value
+            return None
+        else:
+            raise ValueError
+
+    #: whether to also store needle features in a file next to the needle image
+    feature_cache_persist = property(
+        fget=feature_cache_persist, fset=feature_cache_persist
+    )
+
+    def text_index_size(cls, value: int = None) -> int | None:
+        """
+        Getter/setter for property attribute.
+
+        :param value: number of haystacks whose detected and recognized text
+                      is kept in memory or zero to always redo the OCR
+        :returns: current value if no argument was passed otherwise None
+        """
+        if value is None:
+            return cls._text_index_size
+        else:
+            cls._text_index_size = value
+            return None
+
+    #: number of haystacks whose recognized text is kept in memory for reuse
+    text_index_size = property(fget=text_index_size, fset=text_index_size)
+
+    def text_index_memory(cls, value: int = None) -> int | None:
+        """
+        Getter/setter for property attribute.
+
+        :param value: maximal memory in megabytes for the detected and recognized
+                      text of haystacks kept in memory or zero for no memory limit
+        :returns: current value if no argument was passed otherwise None
+        """
+        if value is None:
+            return cls._text_index_memory
+        else:
+            cls._text_index_memory = value
+            return None
+
+    #: maximal memory in megabytes for the recognized text of haystacks kept in memory
+    text_index_memory = property(fget=text_index_memory, fset=text_index_memory)
+
+    def ocr_cache_size(cls, value: int = None) -> int | None:
+        """
+        Getter/setter for property attribute.
+
+        :param value: number of recognized texts of text regions kept in
+                      memory or zero to always redo the OCR
+        :returns: current value if no argument was passed otherwise None
+        """
+        if value is None:
+            return cls._ocr_cache_size
+        else:
+            cls._ocr_cache_size = value
+            return None
+
+    #: number of recognized texts of text regions kept in memory for reuse
+    ocr_cache_size = property(fget=ocr_cache_size, fset=ocr_cache_size)
+
+    def ocr_cache_memory(cls, value: int = None) -> int | None:
+        """
+        Getter/setter for property attribute.
+
+        :param value: maximal memory in megabytes for the recognized texts
+                      kept in memory or zero for no memory limit
+        :returns: current value if no argument was passed otherwise None
+        """
+        if value is None:
+            return cls._ocr_cache_memory
+        else:
+            cls._ocr_cache_memory = value
+            return None
+
+    #: maximal memory in megabytes for the recognized texts kept in memory
+    ocr_cache_memory = property(fget=ocr_cache_memory, fset=ocr_cache_memory)
+
     def display_control_backend(cls, value: str = None) -> str | None:
         """
         Getter/setter for property attribute.
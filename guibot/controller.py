@@ -29,6 +29,8 @@ import os
 import re
 import time
 import logging
+import threading
+import collections
 import numpy
 import PIL.Image
 from tempfile import NamedTemporaryFile
@@ -36,7 +38,7 @@ from tempfile import NamedTemporaryFile
 from . import inputmap
 from .config import GlobalConfig, LocalConfig
 from .imagelogger import ImageLogger
-from .target import Image
+from .target import Frame
 from .location import Location
 from .errors import *
 
@@ -148,6 +150,17 @@ class Controller(LocalConfig):
 
     mouse_location = property(fget=get_mouse_location)
 
+    def get_frame_id(self) -> int | None:
+        """
+        Getter for readonly attribute.
+
+        :returns: identifier of the latest screen frame or None if screen
+                  changes are not tracked by the controller
+        """
+        return None
+
+    frame_id = property(fget=get_frame_id)
+
     def __configure_backend(
         self, backend: str = None, category: str = "control", reset: bool = False
     ) -> None:
@@ -216,7 +229,7 @@ class Controller(LocalConfig):
         """
         self.__synchronize_backend(backend, category, reset)
 
-    def _region_from_args(self, *args: "Region") -> tuple[int, int, int, int, str]:
+    def _region_from_args(self, *args: "Region") -> tuple[int, int, int, int]:
         if len(args) == 4:
             xpos = args[0]
             ypos = args[1]
@@ -244,26 +257,51 @@ class Controller(LocalConfig):
         if ypos + height > self._height:
             height = self._height - ypos
 
-        # TODO: Switch to in-memory conversion - patch backends or request get_raw() from authors
-        with NamedTemporaryFile(prefix="guibot", suffix=".png") as f:
-            # NOTE: the file can be open twice on unix but only once on windows so simply
-            # use the generated filename to avoid this difference and remove it manually
-            filename = f.name
-        return xpos, ypos, width, height, filename
+        return xpos, ypos, width, height
 
-    def capture_screen(self, *args: "list[int] | Region | None") -> Image:
+    def capture_raw(
+        self, *args: "list[int] | Region | None"
+    ) -> "numpy.typing.NDArray[numpy.uint8]":
         """
-        Get the current screen as image.
+        Get the current screen as a raw in-memory buffer.
 
         :param args: region's (x, y, width, height) or a region object or
-                     nothing to obtain an image of the full screen
-        :returns: image of the current screen
+                     nothing to obtain a buffer of the full screen
+        :returns: RGB pixel array of the current screen with shape (height, width, 3)
         :raises: :py:class:`NotImplementedError` if the base class method is called
+
+        No image files are written or read for the capture - if a dump of
+        the screen is needed for debugging use the image logging instead.
         """
         raise NotImplementedError(
             "Method is not available for this controller implementation"
         )
 
+    def capture_screen(self, *args: "list[int] | Region | None") -> Frame:
+        """
+        Get the current screen as image.
+
+        :param args: region's (x, y, width, height) or a region object or
+                     nothing to obtain an image of the full screen
+        :returns: image of the current screen
+        :raises: :py:class:`NotImplementedError` if the base class method is called
+        """
+        pil_image = PIL.Image.fromarray(self.capture_raw(*args), "RGB")
+        return Frame("", pil_image)
+
+    def region_changed(self, frame_id: int, *args: "list[int] | Region | None") -> bool:
+        """
+        Check whether any part of a screen region changed since a given frame.
+
+        :param frame_id: identifier of the frame to compare against
+        :param args: region's (x, y, width, height) or a region object or
+                     nothing to check the full screen
+        :returns: whether the region might have changed since the frame
+
+        Controllers that do not track screen changes always report a change.
+        """
+        return True
+
     def mouse_move(self, location: Location, smooth: bool = True) -> None:
         """
         Move the mouse to a desired location.
@@ -380,7 +418,7 @@ class Controller(LocalConfig):
             self.imglog.clear()
             return
 
-        self.imglog.hotmaps += [numpy.array(self.capture_screen().pil_image)]
+        self.imglog.hotmaps += [numpy.array(self.capture_raw())]
         self.imglog.draw_locations(
             [self.get_mouse_location().coords],
             self.imglog.hotmaps[-1],
@@ -499,15 +537,17 @@ class AutoPyController(Controller):
         """
         self.__synchronize_backend(backend, category, reset)
 
-    def capture_screen(self, *args: "list[int] | Region | None") -> Image:
+    def capture_raw(
+        self, *args: "list[int] | Region | None"
+    ) -> "numpy.typing.NDArray[numpy.uint8]":
         """
-        Get the current screen as image.
+        Get the current screen as a raw in-memory buffer.
 
         Custom implementation of the base method.
 
         See base method for details.
         """
-        xpos, ypos, width, height, filename = self._region_from_args(*args)
+        xpos, ypos, width, height = self._region_from_args(*args)
 
         # autopy works in points and requires a minimum of one point along a dimension
         xpos, ypos, width, height = (
@@ -527,13 +567,18 @@ class AutoPyController(Controller):
                 ((xpos, ypos), (width, height))
             )
         except ValueError:
-            return Image("", PIL.Image.new("RGB", (1, 1)))
+            return numpy.zeros((1, 1, 3), dtype=numpy.uint8)
+        # NOTE: autopy bitmaps provide no access to their pixel buffer so use
+        # an uncompressed bitmap file as the cheapest available conversion
+        with NamedTemporaryFile(prefix="guibot", suffix=".bmp") as f:
+            # NOTE: the file can be open twice on unix but only once on windows so simply
+            # use the generated filename to avoid this difference and remove it manually
+            filename = f.name
         autopy_bmp.save(filename)
-
         with PIL.Image.open(filename) as f:
-            pil_image = f.convert("RGB")
+            raw_image = numpy.asarray(f.convert("RGB"))
         os.unlink(filename)
-        return Image("", pil_image)
+        return raw_image
 
     def mouse_move(self, location: Location, smooth: bool = True) -> None:
         """
@@ -669,6 +714,10 @@ class XDoToolController(Controller):
         self.params[category] = {}
         self.params[category]["backend"] = "none"
         self.params[category]["binary"] = "xdotool"
+        # screen capture through "xwd" processes or in-process through "xlib"
+        self.params[category]["capture"] = "xwd"
+        # input events via one xdotool "process" each or a persistent "xtest" session
+        self.params[category]["input"] = "process"
 
     def configure_backend(
         self, backend: str = None, category: str = "xdotool", reset: bool = False
@@ -699,17 +748,102 @@ class XDoToolController(Controller):
         import subprocess
 
         class XDoTool(object):
+            # xdotool specific key names and their X11 keysym names
+            key_aliases = {
+                "ctrl": "Control_L",
+                "alt": "Alt_L",
+                "shift": "Shift_L",
+                "meta": "Meta_L",
+                "CtrlR": "Control_R",
+                "AltR": "Alt_R",
+                "ShiftR": "Shift_R",
+                "MetaR": "Meta_R",
+            }
+
             def __init__(self, dc: Controller) -> None:
                 self.dc = dc
+                self.xdisplay = None
+                self.xroot = None
 
             def run(self, command: str, *args: list[str]) -> str:
+                if self.dc.params[category]["input"] == "xtest":
+                    output = self.run_xtest(command, *args)
+                    if output is not None:
+                        return output
                 process = [self.dc.params[category]["binary"]]
                 process += [command]
                 process += args
                 return subprocess.check_output(process, shell=False).decode()
 
+            def run_xtest(self, command: str, *args: list[str]) -> str | None:
+                from Xlib import X
+                from Xlib.ext import xtest
+
+                if command == "mousemove":
+                    xtest.fake_input(
+                        self.xdisplay, X.MotionNotify, x=int(args[0]), y=int(args[1])
+                    )
+                elif command in ("mousedown", "mouseup"):
+                    if command == "mousedown":
+                        event = X.ButtonPress
+                    else:
+                        event = X.ButtonRelease
+                    xtest.fake_input(self.xdisplay, event, int(args[0]))
+                elif command in ("keydown", "keyup"):
+                    keycode = self.keycode(args[0])
+                    if keycode is None:
+                        # keys requiring extra modifiers are left to xdotool
+                        return None
+                    event = X.KeyPress if command == "keydown" else X.KeyRelease
+                    xtest.fake_input(self.xdisplay, event, keycode)
+                elif command == "getmouselocation":
+                    pointer = self.xroot.query_pointer()
+                    return "x:%s y:%s" % (pointer.root_x, pointer.root_y)
+                elif command == "getdisplaygeometry":
+                    screen = self.xdisplay.screen()
+                    return "%s %s" % (screen.width_in_pixels, screen.height_in_pixels)
+                else:
+                    return None
+                # flush the event to the server without waiting for any reply
+                self.xdisplay.flush()
+                return ""
+
+            def keycode(self, key: str) -> int | None:
+                from Xlib import X, XK
+
+                keysym = XK.string_to_keysym(self.key_aliases.get(key, key))
+                if keysym == X.NoSymbol and len(key) == 1:
+                    # Latin-1 characters map directly, other ones via Unicode offset
+                    keysym = ord(key) if ord(key) < 0x100 else 0x01000000 + ord(key)
+                keycode = self.xdisplay.keysym_to_keycode(keysym)
+                # only keys reachable without any modifier are sent directly
+                if keycode == 0:
+                    return None
+                if self.xdisplay.keycode_to_keysym(keycode, 0) != keysym:
+                    return None
+                return keycode
+
         self._backend_obj = XDoTool(self)
 
+        if self.params[category]["capture"] not in ("xwd", "xlib"):
+            raise UnsupportedBackendError(
+                "Capture method '%s' is not supported"
+                % self.params[category]["capture"]
+            )
+        if self.params[category]["input"] not in ("process", "xtest"):
+            raise UnsupportedBackendError(
+                "Input method '%s' is not supported" % self.params[category]["input"]
+            )
+        if (
+            self.params[category]["capture"] == "xlib"
+            or self.params[category]["input"] == "xtest"
+        ):
+            from Xlib import display
+
+            # keep a single connection to the X server for all captures and events
+            self._backend_obj.xdisplay = display.Display()
+            self._backend_obj.xroot = self._backend_obj.xdisplay.screen().root
+
         self._width, self._height = self._backend_obj.run("getdisplaygeometry").split()
         self._width, self._height = int(self._width), int(self._height)
         self._pointer = self.mouse_location
@@ -729,34 +863,68 @@ class XDoToolController(Controller):
         """
         self.__synchronize_backend(backend, category, reset)
 
-    def capture_screen(self, *args: "list[int] | Region | None") -> Image:
+    def capture_raw(
+        self, *args: "list[int] | Region | None"
+    ) -> "numpy.typing.NDArray[numpy.uint8]":
         """
-        Get the current screen as image.
+        Get the current screen as a raw in-memory buffer.
 
         Custom implementation of the base method.
 
         See base method for details.
         """
-        xpos, ypos, width, height, filename = self._region_from_args(*args)
+        xpos, ypos, width, height = self._region_from_args(*args)
+        if self.params["xdotool"]["capture"] == "xlib":
+            return self._capture_xlib(xpos, ypos, width, height)
         import subprocess
 
         with subprocess.Popen(
             ("xwd", "-silent", "-root"), stdout=subprocess.PIPE
         ) as xwd:
-            subprocess.call(
+            # convert directly to raw 8-bit RGB samples on the standard output
+            raw_data = subprocess.check_output(
                 (
                     "convert",
                     "xwd:-",
                     "-crop",
                     "%sx%s+%s+%s" % (width, height, xpos, ypos),
-                    filename,
+                    "+repage",
+                    "-depth",
+                    "8",
+                    "rgb:-",
                 ),
                 stdin=xwd.stdout,
             )
-        with PIL.Image.open(filename) as f:
-            pil_image = f.convert("RGB")
-        os.unlink(filename)
-        return Image("", pil_image)
+        return numpy.frombuffer(raw_data, dtype=numpy.uint8).reshape((height, width, 3))
+
+    def _capture_xlib(
+        self, xpos: int, ypos: int, width: int, height: int
+    ) -> "numpy.typing.NDArray[numpy.uint8]":
+        from Xlib import X
+
+        xdisplay = self._backend_obj.xdisplay
+        # only the pixels of the requested region are transferred by the X server
+        ximage = self._backend_obj.xroot.get_image(
+            xpos, ypos, width, height, X.ZPixmap, 0xFFFFFFFF
+        )
+        bits_per_pixel = None
+        for pixmap_format in xdisplay.info.pixmap_formats:
+            if pixmap_format.depth == ximage.depth:
+                bits_per_pixel = pixmap_format.bits_per_pixel
+        if bits_per_pixel != 32:
+            raise UnsupportedBackendError(
+                "Xlib capture is not supported for %s bits per pixel" % bits_per_pixel
+            )
+
+        # 32 bit scanlines are never padded so each row has exactly the width pixels
+        pixels = numpy.frombuffer(ximage.data, dtype=numpy.uint8)
+        pixels = pixels.reshape((height, width, 4))
+        if xdisplay.info.image_byte_order == X.LSBFirst:
+            # BGRX on little endian servers
+            return pixels[:, :, 2::-1].copy()
+        else:
+            # XRGB on big endian servers
+            return pixels[:, :, 1:].copy()
 
     def mouse_move(self, location: Location, smooth: bool = True) -> None:
         """
@@ -868,6 +1036,12 @@ class VNCDoToolController(Controller):
     def __init__(self, configure: bool = True, synchronize: bool = True) -> None:
         """Build a DC backend using VNCDoTool."""
         super(VNCDoToolController, self).__init__(configure=False, synchronize=False)
+        # framebuffer patched from incremental updates of the server
+        self._framebuffer: "numpy.typing.NDArray[numpy.uint8]" = None
+        self._framebuffer_lock = threading.Lock()
+        self._frame_id = 0
+        # changed rectangles for a limited number of recent frames
+        self._frame_updates = collections.deque(maxlen=100)
         if configure:
             self.__configure_backend(reset=True)
         if synchronize:
@@ -891,6 +1065,8 @@ class VNCDoToolController(Controller):
         self.params[category]["vnc_port"] = 0
         # password for the vnc server
         self.params[category]["vnc_password"] = None
+        # keep a local framebuffer updated with incremental server updates
+        self.params[category]["vnc_incremental"] = False
 
     def configure_backend(
         self, backend: str = None, category: str = "vncdotool", reset: bool = False
@@ -943,12 +1119,12 @@ class VNCDoToolController(Controller):
         logging.getLogger("twisted").setLevel(logging.ERROR)
 
         # screen size
-        with NamedTemporaryFile(prefix="guibot", suffix=".png") as f:
-            filename = f.name
-        screen = self._backend_obj.captureScreen(filename)
-        os.unlink(filename)
-        self._width = screen.width
-        self._height = screen.height
+        self._backend_obj.refreshScreen()
+        self._width, self._height = self._backend_obj.screen.size
+        if self.params[category]["vnc_incremental"]:
+            self._track_framebuffer()
+        else:
+            self._framebuffer = None
 
         # sync pointer
         self.mouse_move(Location(self._width, self._height), smooth=False)
@@ -971,7 +1147,128 @@ class VNCDoToolController(Controller):
         """
         self.__synchronize_backend(backend, category, reset)
 
-    def capture_screen(self, *args: "list[int] | Region | None") -> Image:
+    def get_frame_id(self) -> int | None:
+        """
+        Getter for readonly attribute.
+
+        Custom implementation of the base method.
+
+        See base method for details.
+        """
+        if self._framebuffer is None:
+            return None
+        return self._frame_id
+
+    frame_id = property(fget=get_frame_id)
+
+    def _track_framebuffer(self) -> None:
+        client = self._backend_obj.protocol
+        with self._framebuffer_lock:
+            self._framebuffer = numpy.array(client.screen.convert("RGB"))
+            self._frame_id += 1
+            self._frame_updates.clear()
+
+        commit_update = client.commitUpdate
+
+        def track_update(rectangles: list[tuple[int, int, int, int]] = None) -> None:
+            # called within the reactor thread after each framebuffer update
+            self._patch_framebuffer(client.screen, rectangles or [])
+            commit_update(rectangles)
+            # keep an incremental update request pending at all times
+            client.framebufferUpdateRequest(incremental=1)
+
+        client.commitUpdate = track_update
+        self._backend_obj.framebufferUpdateRequest(incremental=1)
+
+    def _patch_framebuffer(
+        self, screen: PIL.Image.Image, rectangles: list[tuple[int, int, int, int]]
+    ) -> None:
+        with self._framebuffer_lock:
+            if self._framebuffer.shape[:2] != (screen.height, screen.width):
+                # desktop resizes invalidate the complete framebuffer
+                self._framebuffer = numpy.array(screen.convert("RGB"))
+                changed = [(0, 0, screen.width, screen.height)]
+            else:
+                changed = []
+                for xpos, ypos, width, height in rectangles:
+                    # pseudo-encoded rectangles (e.g. cursor) may lie outside
+                    right = min(xpos + width, screen.width)
+                    bottom = min(ypos + height, screen.height)
+                    if right <= xpos or bottom <= ypos:
+                        continue
+                    patch = screen.crop((xpos, ypos, right, bottom)).convert("RGB")
+                    self._framebuffer[ypos:bottom, xpos:right] = numpy.asarray(patch)
+                    changed.append((xpos, ypos, right - xpos, bottom - ypos))
+            if len(changed) == 0:
+                return
+            self._frame_id += 1
+            self._frame_updates.append((self._frame_id, changed))
+            log.log(
+                9, "Framebuffer updated to frame %s with %s", self._frame_id, changed
+            )
+
+    def changed_regions(self, frame_id: int) -> list[tuple[int, int, int, int]]:
+        """
+        Get all screen rectangles that changed since a given frame.
+
+        :param frame_id: identifier of the frame to compare against
+        :returns: list of changed (x, y, width, height) rectangles
+        :raises: :py:class:`UninitializedBackendError` if no incremental
+                 framebuffer is kept by the controller
+        """
+        if self._framebuffer is None:
+            raise UninitializedBackendError(
+                "No incremental framebuffer is available for change tracking"
+            )
+        with self._framebuffer_lock:
+            if frame_id >= self._frame_id:
+                return []
+            oldest_id = self._frame_updates[0][0] if self._frame_updates else None
+            if oldest_id is None or oldest_id > frame_id + 1:
+                # the changes are no longer recorded so consider everything changed
+                height, width = self._framebuffer.shape[:2]
+                return [(0, 0, width, height)]
+            return [
+                rectangle
+                for update_id, rectangles in self._frame_updates
+                if update_id > frame_id
+                for rectangle in rectangles
+            ]
+
+    def region_changed(self, frame_id: int, *args: "list[int] | Region | None") -> bool:
+        """
+        Check whether any part of a screen region changed since a given frame.
+
+        Custom implementation of the base method.
+
+        See base method for details.
+        """
+        if self._framebuffer is None:
+            return True
+        xpos, ypos, width, height = self._region_from_args(*args)
+        for x, y, w, h in self.changed_regions(frame_id):
+            if x < xpos + width and xpos < x + w and y < ypos + height and ypos < y + h:
+                return True
+        return False
+
+    def capture_raw(
+        self, *args: "list[int] | Region | None"
+    ) -> "numpy.typing.NDArray[numpy.uint8]":
+        """
+        Get the current screen as a raw in-memory buffer.
+
+        Custom implementation of the base method.
+
+        See base method for details.
+        """
+        if self._framebuffer is None:
+            return numpy.asarray(self.capture_screen(*args).pil_image)
+        xpos, ypos, width, height = self._region_from_args(*args)
+        right, bottom = xpos + width, ypos + height
+        with self._framebuffer_lock:
+            return self._framebuffer[ypos:bottom, xpos:right].copy()
+
+    def capture_screen(self, *args: "list[int] | Region | None") -> Frame:
         """
         Get the current screen as image.
 
@@ -979,13 +1276,15 @@ class VNCDoToolController(Controller):
 
         See base method for details.
         """
-        xpos, ypos, width, height, _ = self._region_from_args(*args)
+        if self._framebuffer is not None:
+            return super(VNCDoToolController, self).capture_screen(*args)
+        xpos, ypos, width, height = self._region_from_args(*args)
         self._backend_obj.refreshScreen()
         cropped = self._backend_obj.screen.crop(
             (xpos, ypos, xpos + width, ypos + height)
         )
         pil_image = cropped.convert("RGB")
-        return Image("", pil_image)
+        return Frame("", pil_image)
 
     def mouse_move(self, location: Location, smooth: bool = True) -> None:
         """
@@ -1191,7 +1490,19 @@ class PyAutoGUIController(Controller):
         """
         self.__synchronize_backend(backend, category, reset)
 
-    def capture_screen(self, *args: "list[int] | Region | None") -> Image:
+    def capture_raw(
+        self, *args: "list[int] | Region | None"
+    ) -> "numpy.typing.NDArray[numpy.uint8]":
+        """
+        Get the current screen as a raw in-memory buffer.
+
+        Custom implementation of the base method.
+
+        See base method for details.
+        """
+        return numpy.asarray(self.capture_screen(*args).pil_image)
+
+    def capture_screen(self, *args: "list[int] | Region | None") -> Frame:
         """
         Get the current screen as image.
 
@@ -1199,10 +1510,10 @@ class PyAutoGUIController(Controller):
 
         See base method for details.
         """
-        xpos, ypos, width, height, _ = self._region_from_args(*args)
+        xpos, ypos, width, height = self._region_from_args(*args)
 
         pil_image = self._backend_obj.screenshot(region=(xpos, ypos, width, height))
-        return Image("", pil_image)
+        return Frame("", pil_image)
 
     def mouse_move(self, location: Location, smooth: bool = True) -> None:
         """
@@ -25,11 +25,18 @@ INTERFACE
 
 """
 
+import io
 import os
 import sys
 import re
 import copy
 import random
+import hashlib
+import itertools
+import threading
+import collections
+import concurrent.futures
+import queue
 import configparser as config
 import PIL.Image
 from typing import Callable
@@ -47,6 +54,7 @@ log = logging.getLogger("guibot.finder")
 
 __all__ = [
     "CVParameter",
+    "LRUCache",
     "Finder",
     "AutoPyFinder",
     "ContourFinder",
@@ -63,6 +71,9 @@ __all__ = [
 class CVParameter(object):
     """A class for a single parameter used for CV backend configuration."""
 
+    #: source of unique version numbers for all parameter values
+    _versions = itertools.count()
+
     def __init__(
         self,
         value: bool | int | float | str | None,
@@ -153,6 +164,36 @@ class CVParameter(object):
             return NotImplemented
         return repr(self) == repr(other)
 
+    def get_value(self) -> bool | int | float | str | None:
+        """
+        Getter for property attribute.
+
+        :returns: value of the parameter
+        """
+        return self._value
+
+    def set_value(self, value: bool | int | float | str | None) -> None:
+        """
+        Setter for property attribute.
+
+        :param value: value of the parameter
+        """
+        self._value = value
+        self._version = next(CVParameter._versions)
+
+    value = property(fget=get_value, fset=set_value)
+
+    def get_version(self) -> int:
+        """
+        Getter for readonly attribute.
+
+        :returns: number unique among all parameters and changed with every
+                  assignment of the value in order to detect stale backends
+        """
+        return self._version
+
+    version = property(fget=get_version)
+
     @staticmethod
     def from_string(raw: str) -> "CVParameter":
         """
@@ -229,6 +270,93 @@ class CVParameter(object):
             return self.value
 
 
+class LRUCache(object):
+    """
+    Thread-safe cache discarding the least recently used entries once full.
+
+    The number of hits and misses is counted to judge the cache efficiency.
+    """
+
+    def __init__(self, maxsize: int = 100, memory: int = 0) -> None:
+        """
+        Build an LRU cache.
+
+        :param maxsize: maximal number of entries or zero to cache nothing
+        :param memory: maximal memory for the entries in megabytes as estimated
+                       when caching them or zero for no memory limit
+        """
+        self.maxsize = maxsize
+        self.memory = memory
+        self.hits = 0
+        self.misses = 0
+
+        self._entries = collections.OrderedDict()
+        self._nbytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """
+        Provide the number of cached entries.
+
+        :returns: number of cached entries
+        """
+        return len(self._entries)
+
+    def get_nbytes(self) -> int:
+        """
+        Getter for readonly attribute.
+
+        :returns: estimated memory used by the cached entries in bytes
+        """
+        return self._nbytes
+
+    nbytes = property(fget=get_nbytes)
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        """
+        Obtain a cached entry and mark it as recently used.
+
+        :param key: key of the entry
+        :param default: value to return if the entry is not cached
+        :returns: value of the entry or the default value if missing
+        """
+        with self._lock:
+            if key not in self._entries:
+                self.misses += 1
+                return default
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return self._entries[key][0]
+
+    def put(self, key: Any, value: Any, nbytes: int = 0) -> None:
+        """
+        Cache an entry discarding the least recently used ones if full.
+
+        :param key: key of the entry
+        :param value: value of the entry
+        :param nbytes: estimated memory used by the entry in bytes
+        """
+        with self._lock:
+            if key in self._entries:
+                self._nbytes -= self._entries[key][1]
+            self._entries[key] = (value, nbytes)
+            self._entries.move_to_end(key)
+            self._nbytes += nbytes
+            while len(self._entries) > max(self.maxsize, 0) or (
+                self.memory > 0 and self._nbytes > self.memory * 1024 * 1024
+            ):
+                _, (_, discarded) = self._entries.popitem(last=False)
+                self._nbytes -= discarded
+
+    def clear(self) -> None:
+        """Remove all cached entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+            self.hits = 0
+            self.misses = 0
+
+
 class Finder(LocalConfig):
     """
     Base for all image matching functionality and backends.
@@ -240,6 +368,10 @@ class Finder(LocalConfig):
     all be manually adjusted or automatically calibrated.
     """
 
+    #: whether each match depends only on the haystack pixels it covers so
+    #: that a haystack can be rescanned just around its changed areas
+    local_matching = False
+
     @staticmethod
     def from_match_file(filename: str) -> "Finder":
         """
@@ -322,6 +454,19 @@ class Finder(LocalConfig):
         :param finder: match configuration to save
         :param filename: match filename for the configuration
         """
+        if not filename.endswith(".match"):
+            filename += ".match"
+        with open(filename, "w") as configfile:
+            configfile.write(Finder.to_match_string(finder))
+
+    @staticmethod
+    def to_match_string(finder: "Finder") -> str:
+        """
+        Render the configuration in the format of a match file.
+
+        :param finder: match configuration to render
+        :returns: contents of a match file with the configuration
+        """
         parser = config.RawConfigParser()
         # preserve case sensitivity
         parser.optionxform = str
@@ -335,11 +480,10 @@ class Finder(LocalConfig):
                 log.log(9, "%s %s", section, option)
                 parser.set(section, option, finder.params[section][option])
 
-        if not filename.endswith(".match"):
-            filename += ".match"
-        with open(filename, "w") as configfile:
-            configfile.write("# IMAGE MATCH DATA\n")
-            parser.write(configfile)
+        configfile = io.StringIO()
+        configfile.write("# IMAGE MATCH DATA\n")
+        parser.write(configfile)
+        return configfile.getvalue()
 
     def __init__(self, configure: bool = True, synchronize: bool = True) -> None:
         """Build a finder and its CV backend settings."""
@@ -487,7 +631,9 @@ class Finder(LocalConfig):
 
         return acopy
 
-    def find(self, needle: "Target | list[Target]", haystack: "Image") -> "list[Match]":
+    def find(
+        self, needle: "Target | list[Target]", haystack: "Image"
+    ) -> "list[MatchRecord]":
         """
         Find all needle targets in a haystack image.
 
@@ -532,6 +678,8 @@ class Finder(LocalConfig):
 class AutoPyFinder(Finder):
     """Simple matching backend provided by AutoPy."""
 
+    local_matching = True
+
     def __init__(self, configure: bool = True, synchronize: bool = True) -> None:
         """Build a CV backend using AutoPy."""
         super(AutoPyFinder, self).__init__(configure=False, synchronize=False)
@@ -568,7 +716,7 @@ class AutoPyFinder(Finder):
         """
         self.__configure_backend(backend, category, reset)
 
-    def find(self, needle: "Image", haystack: "Image") -> "list[Match]":
+    def find(self, needle: "Image", haystack: "Image") -> "list[MatchRecord]":
         """
         Find all needle targets in a haystack image.
 
@@ -588,7 +736,7 @@ class AutoPyFinder(Finder):
         self.imglog.haystack = haystack
         self.imglog.dump_matched_images()
         # prepare a canvas solely for image logging
-        self.imglog.hotmaps.append(haystack.pil_image.copy())
+        self.imglog.hotmaps.append(self.imglog.canvas(haystack.pil_image))
 
         # class-specific dependencies
         from autopy import bitmap, screen
@@ -627,14 +775,15 @@ class AutoPyFinder(Finder):
             x, y = coord
             w, h = needle.width, needle.height
             dx, dy = needle.center_offset.x, needle.center_offset.y
-            from .match import Match
+            from .match import MatchRecord
 
-            matches = [Match(x, y, w, h, dx, dy, similarity)]
-            from PIL import ImageDraw
+            matches = [MatchRecord(x, y, w, h, dx, dy, similarity)]
+            if self.imglog.is_enabled(30):
+                from PIL import ImageDraw
 
-            draw = ImageDraw.Draw(self.imglog.hotmaps[-1])
-            draw.rectangle((x, y, x + w, y + h), outline=(0, 0, 255))
-            del draw
+                draw = ImageDraw.Draw(self.imglog.hotmaps[-1])
+                draw.rectangle((x, y, x + w, y + h), outline=(0, 0, 255))
+                del draw
         else:
             matches = []
         self.imglog.log(30)
@@ -701,6 +850,9 @@ class ContourFinder(Finder):
             self.params[category]["contoursMatch"] = CVParameter(
                 1, 1, 3, enumerated=True
             )
+            # maximal distance of matched contours from the first one in needle
+            # sizes (any distance if zero) to group only nearby haystack contours
+            self.params[category]["groupExtent"] = CVParameter(0.0, 0.0, None, 1.0)
         elif category == "threshold":
             # 1 normal, 2 median, 3 gaussian, 4 none
             self.params[category]["blurType"] = CVParameter(4, 1, 4, enumerated=True)
@@ -775,7 +927,7 @@ class ContourFinder(Finder):
         """
         self.__configure(threshold_filter, reset)
 
-    def find(self, needle: "Image", haystack: "Image") -> "list[Match]":
+    def find(self, needle: "Image", haystack: "Image") -> "list[MatchRecord]":
         """
         Find all needle targets in a haystack image.
 
@@ -807,73 +959,53 @@ class ContourFinder(Finder):
         countours_needle = thresh_needle.copy()
         needle_contours = self._extract_contours(countours_needle, log=False)
 
-        orig_haystack = numpy.array(haystack.pil_image)
-        thresh_haystack = self._binarize_image(orig_haystack, log=True)
+        from .target import Frame
+
+        frame = Frame.from_image(haystack)
+        # binarized frames can be reused for the same threshold configuration
+        thresh_haystack = frame.view(
+            ("binarized", repr(self.params["threshold"])),
+            lambda: self._binarize_image(frame.rgb, log=False),
+        )
+        self.imglog.hotmaps.append(thresh_haystack)
         countours_haystack = thresh_haystack.copy()
         haystack_contours = self._extract_contours(countours_haystack, log=True)
 
-        self.imglog.hotmaps.append(numpy.array(haystack.pil_image))
+        self.imglog.hotmaps.append(self.imglog.canvas(frame.rgb))
 
-        distances = numpy.ones((len(haystack_contours), len(needle_contours)))
-        for i, hcontour in enumerate(haystack_contours):
-            if cv2.contourArea(hcontour) < self.params["contour"]["minArea"].value:
-                continue
-            for j, ncontour in enumerate(needle_contours):
-                if cv2.contourArea(ncontour) < self.params["contour"]["minArea"].value:
-                    continue
-                distances[i, j] = cv2.matchShapes(
-                    hcontour, ncontour, self.params["contour"]["contoursMatch"].value, 0
-                )
-                assert distances[i, j] >= 0.0
+        distances = self._shape_distances(haystack_contours, needle_contours)
 
-        from .match import Match
+        from .match import MatchRecord
 
         matches = []
         nx, ny, nw, nh = cv2.boundingRect(numpy.concatenate(needle_contours, axis=0))
-        while True:
-            matching_haystack_contours = []
-            matching_haystack_distances = numpy.zeros(len(needle_contours))
-            for j in range(len(needle_contours)):
-                matching_haystack_distances[j] = numpy.min(distances[:, j])
-                index = numpy.where(distances[:, j] == matching_haystack_distances[j])
-                # we don't allow collapsing into the same needle contour, i.e.
-                # the map from the needle to the haystack contours is injective
-                # -> so here we cross the entire row rather than one value in it
-                distances[index[0][0], :] = (
-                    1.1  # like this works even for similarity 0.0
-                )
-                matching_haystack_contours.append(haystack_contours[index[0][0]])
-            average_distance = numpy.average(matching_haystack_distances)
-            required_distance = 1.0 - self.params["find"]["similarity"].value
-            logging.debug(
-                "Average distance to next needle shape is %s of max allowed %s",
-                average_distance,
-                required_distance,
+        required_distance = 1.0 - self.params["find"]["similarity"].value
+        for rows, average_distance in self._assign_contours(
+            distances, haystack_contours, needle_contours, required_distance
+        ):
+            matching_haystack_contours = [haystack_contours[i] for i in rows]
+            shape = numpy.concatenate(matching_haystack_contours, axis=0)
+            x, y, w, h = cv2.boundingRect(shape)
+            # calculate needle upleft and downright points to return its (0,0) location
+            needle_upleft = (
+                max(int((x - nx) * float(w) / nw), 0),
+                max(int((y - ny) * float(h) / nh), 0),
             )
-            if average_distance > required_distance:
-                break
-            else:
-                shape = numpy.concatenate(matching_haystack_contours, axis=0)
-                x, y, w, h = cv2.boundingRect(shape)
-                # calculate needle upleft and downright points to return its (0,0) location
-                needle_upleft = (
-                    max(int((x - nx) * float(w) / nw), 0),
-                    max(int((y - ny) * float(h) / nh), 0),
-                )
-                needle_downright = (
-                    min(
-                        int(needle_upleft[0] + needle.width * float(w) / nw),
-                        haystack.width,
-                    ),
-                    min(
-                        int(needle_upleft[1] + needle.height * float(h) / nh),
-                        haystack.height,
-                    ),
-                )
-                needle_center_offset = (
-                    needle.center_offset.x * float(w) / nw,
-                    needle.center_offset.y * float(h) / nh,
-                )
+            needle_downright = (
+                min(
+                    int(needle_upleft[0] + needle.width * float(w) / nw),
+                    haystack.width,
+                ),
+                min(
+                    int(needle_upleft[1] + needle.height * float(h) / nh),
+                    haystack.height,
+                ),
+            )
+            needle_center_offset = (
+                needle.center_offset.x * float(w) / nw,
+                needle.center_offset.y * float(h) / nh,
+            )
+            if self.imglog.is_enabled(30):
                 cv2.rectangle(
                     self.imglog.hotmaps[-1],
                     needle_upleft,
@@ -888,26 +1020,201 @@ class ContourFinder(Finder):
                     (255, 255, 255),
                     1,
                 )
-                # NOTE: to extract the region of interest just do:
-                # roi = thresh_haystack[y:y+h,x:x+w]
-                similarity = 1.0 - average_distance
-                self.imglog.similarities.append(similarity)
-                self.imglog.locations.append(needle_upleft)
-                matches.append(
-                    Match(
-                        needle_upleft[0],
-                        needle_upleft[1],
-                        needle_downright[0] - needle_upleft[0],
-                        needle_downright[1] - needle_upleft[1],
-                        needle_center_offset[0],
-                        needle_center_offset[1],
-                        similarity,
-                    )
+            # NOTE: to extract the region of interest just do:
+            # roi = thresh_haystack[y:y+h,x:x+w]
+            similarity = 1.0 - average_distance
+            self.imglog.similarities.append(similarity)
+            self.imglog.locations.append(needle_upleft)
+            matches.append(
+                MatchRecord(
+                    needle_upleft[0],
+                    needle_upleft[1],
+                    needle_downright[0] - needle_upleft[0],
+                    needle_downright[1] - needle_upleft[1],
+                    needle_center_offset[0],
+                    needle_center_offset[1],
+                    similarity,
                 )
+            )
 
         self.imglog.log(30)
         return matches
 
+    def _assign_contours(
+        self,
+        distances: "Matlike",
+        haystack_contours: list["Matlike"],
+        needle_contours: list["Matlike"],
+        required_distance: float,
+    ) -> list[tuple[list[int], float]]:
+        """
+        Assign haystack contours to the needle contours for each needle match.
+
+        :param distances: shape distances between haystack and needle contours
+        :param haystack_contours: contours from the haystack image
+        :param needle_contours: contours from the needle image
+        :param required_distance: maximal average distance of a needle match
+        :returns: haystack contour indices for each needle contour together
+                  with their average distance for all acceptable needle matches
+
+        Each needle contour is greedily assigned its closest haystack contour
+        that is not assigned yet, i.e. the map from the needle to the haystack
+        contours is injective. The haystack contours are visited in sorted
+        order of distance for each needle contour so that no distance is
+        considered more than once. If the contour parameter `groupExtent` is
+        set, the first needle contour is assigned first and all others are
+        then only assigned haystack contours nearby it looked up from a grid.
+        """
+        import cv2
+        import numpy
+
+        nrows, ncols = distances.shape
+        if nrows == 0 or ncols == 0:
+            return []
+        # like this works even for similarity 0.0
+        exhausted_distance = 1.1
+        used = numpy.zeros(nrows, dtype=bool)
+        order = numpy.argsort(distances, axis=0, kind="stable")
+        pointers = numpy.zeros(ncols, dtype=numpy.int64)
+
+        def next_best(j: int) -> int | None:
+            while pointers[j] < nrows and used[order[pointers[j], j]]:
+                pointers[j] += 1
+            return order[pointers[j], j] if pointers[j] < nrows else None
+
+        extent = self.params["contour"]["groupExtent"].value
+        if extent > 0.0:
+            _, _, nw, nh = cv2.boundingRect(numpy.concatenate(needle_contours, axis=0))
+            cell = (max(extent * nw, 1.0), max(extent * nh, 1.0))
+            centers = numpy.array(
+                [
+                    (x + w / 2.0, y + h / 2.0)
+                    for x, y, w, h in map(cv2.boundingRect, haystack_contours)
+                ]
+            )
+            cells = numpy.floor(centers / cell).astype(numpy.int64)
+            grid = {}
+            for i, key in enumerate(map(tuple, cells)):
+                grid.setdefault(key, []).append(i)
+
+        assignments = []
+        while True:
+            rows, row_distances = [], []
+            anchor = next_best(0)
+            if anchor is None:
+                break
+            rows.append(anchor)
+            row_distances.append(distances[anchor, 0])
+            used[anchor] = True
+            if extent > 0.0:
+                cx, cy = cells[anchor]
+                nearby = [
+                    i
+                    for dx in (-1, 0, 1)
+                    for dy in (-1, 0, 1)
+                    for i in grid.get((cx + dx, cy + dy), [])
+                ]
+                nearby = numpy.array(nearby, dtype=numpy.int64)
+                offsets = numpy.abs(centers[nearby] - centers[anchor])
+                nearby = nearby[(offsets <= cell).all(axis=1)]
+            for j in range(1, ncols):
+                if extent > 0.0:
+                    candidates = nearby[~used[nearby]]
+                    if len(candidates) == 0:
+                        row_distances.append(exhausted_distance)
+                        continue
+                    i = candidates[numpy.argmin(distances[candidates, j])]
+                else:
+                    i = next_best(j)
+                    if i is None:
+                        row_distances.append(exhausted_distance)
+                        continue
+                rows.append(i)
+                row_distances.append(distances[i, j])
+                used[i] = True
+
+            average_distance = numpy.average(row_distances)
+            log.debug(
+                "Average distance to next needle shape is %s of max allowed %s",
+                average_distance,
+                required_distance,
+            )
+            if average_distance <= required_distance:
+                assignments.append((rows, average_distance))
+            # without grouping the next assignments can only be worse
+            elif extent == 0.0 or distances[anchor, 0] / ncols > required_distance:
+                break
+            else:
+                # a worse anchor could still have better contours nearby
+                used[rows[1:]] = False
+        return assignments
+
+    def _shape_distances(
+        self, haystack_contours: list["Matlike"], needle_contours: list["Matlike"]
+    ) -> "Matlike":
+        """
+        Compute the shape distances between all haystack and needle contours.
+
+        :param haystack_contours: contours from the haystack image
+        :param needle_contours: contours from the needle image
+        :returns: matrix of distances with a row for each haystack contour
+                  and a column for each needle contour
+
+        The distances are the same as the ones of OpenCV's `matchShapes` for
+        the configured `contoursMatch` method but are computed from the Hu
+        moments of each contour at once for all pairs. Contours with an area
+        smaller than the minimal one have the maximal distance of one.
+        """
+        import cv2
+        import numpy
+
+        min_area = self.params["contour"]["minArea"].value
+        method = self.params["contour"]["contoursMatch"].value
+        distances = numpy.ones((len(haystack_contours), len(needle_contours)))
+
+        def hu_logs(contours: list["Matlike"]) -> "tuple[Matlike, Matlike, Matlike]":
+            areas = numpy.array([cv2.contourArea(c) for c in contours])
+            indices = numpy.flatnonzero(areas >= min_area)
+            hu = numpy.zeros((len(indices), 7))
+            for k, i in enumerate(indices):
+                hu[k] = cv2.HuMoments(cv2.moments(contours[i])).flatten()
+            # moments too close to zero are ignored just like in OpenCV
+            valid = numpy.abs(hu) > 1e-5
+            logs = numpy.sign(hu) * numpy.log10(numpy.where(valid, numpy.abs(hu), 1.0))
+            return indices, valid, logs
+
+        hindices, hvalid, hlogs = hu_logs(haystack_contours)
+        nindices, nvalid, nlogs = hu_logs(needle_contours)
+        if len(hindices) == 0 or len(nindices) == 0:
+            return distances
+
+        # pairs of moments with shape (haystack, needle, moment)
+        valid = hvalid[:, None, :] & nvalid[None, :, :]
+        ha, nb = hlogs[:, None, :], nlogs[None, :, :]
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            if method == 1:
+                pairwise = numpy.abs(1.0 / nb - 1.0 / ha)
+            elif method == 2:
+                pairwise = numpy.abs(nb - ha)
+            elif method == 3:
+                pairwise = numpy.abs((ha - nb) / ha)
+            else:
+                raise ValueError(
+                    "Unsupported contour match method %s - use 1, 2, or 3" % method
+                )
+        pairwise = numpy.where(valid, pairwise, 0.0)
+        if method == 3:
+            result = pairwise.max(axis=2)
+        else:
+            result = pairwise.sum(axis=2)
+        # shapes with only negligible moments are infinitely far from others
+        degenerate = hvalid.any(axis=1)[:, None] != nvalid.any(axis=1)[None, :]
+        result[degenerate] = sys.float_info.max
+
+        distances[numpy.ix_(hindices, nindices)] = result
+        assert (distances >= 0.0).all()
+        return distances
+
     def _binarize_image(self, image: "Matlike", log: bool = False) -> "Matlike":
         import cv2
 
@@ -1019,6 +1326,8 @@ class ContourFinder(Finder):
 class TemplateFinder(Finder):
     """Template matching backend provided by OpenCV."""
 
+    local_matching = True
+
     def __init__(self, configure: bool = True, synchronize: bool = True) -> None:
         """Build a CV backend using OpenCV's template matching."""
         super(TemplateFinder, self).__init__(configure=False, synchronize=False)
@@ -1057,6 +1366,13 @@ class TemplateFinder(Finder):
         self.params[category] = {}
         self.params[category]["backend"] = backend
         self.params[category]["nocolor"] = CVParameter(False)
+        # coarse-to-fine matching on downscaled images (no pyramid if zero levels)
+        # where coarse candidates may lose some similarity on each level
+        self.params[category]["pyramidLevels"] = CVParameter(0, 0, 4, 1.0)
+        self.params[category]["pyramidSimilarityDrop"] = CVParameter(
+            0.1, 0.0, 1.0, 0.1, 0.01
+        )
+        self.params[category]["pyramidFallback"] = CVParameter(True)
         log.log(9, "%s %s\n", category, self.params[category])
 
     def configure_backend(
@@ -1071,7 +1387,7 @@ class TemplateFinder(Finder):
         """
         self.__configure_backend(backend, category, reset)
 
-    def find(self, needle: "Image", haystack: "Image") -> "list[Match]":
+    def find(self, needle: "Image", haystack: "Image") -> "list[MatchRecord]":
         """
         Find all needle targets in a haystack image.
 
@@ -1118,103 +1434,95 @@ class TemplateFinder(Finder):
             result = 1.0 - result
 
         import cv2
-        import numpy
 
-        universal_hotmap = result * 255.0
-        final_hotmap = numpy.array(self.imglog.haystack.pil_image)
-        if self.params["template"]["nocolor"].value:
-            final_hotmap = cv2.cvtColor(final_hotmap, cv2.COLOR_RGB2GRAY)
+        from .target import Frame
 
-        # extract maxima once for each needle size region
         similarity = self.params["find"]["similarity"].value
-        from .match import Match
+        peaks = self._extract_peaks(result, similarity, needle.width, needle.height)
+        log.debug("A total of %i matches found", len(peaks))
 
-        matches = []
-        while True:
+        from .match import MatchRecord
 
-            minVal, maxVal, minLoc, maxLoc = cv2.minMaxLoc(result)
-            # rectify to the [0,1] interval to avoid negative values in some methods
-            maxVal = min(max(maxVal, 0.0), 1.0)
-            log.debug(
-                "Next best match with value %s (similarity %s) and location (x,y) %s",
-                str(maxVal),
-                similarity,
-                str(maxLoc),
-            )
-
-            if maxVal < similarity:
-                if len(matches) == 0:
-                    self.imglog.similarities.append(maxVal)
-                    self.imglog.locations.append(maxLoc)
-                    current_hotmap = numpy.copy(universal_hotmap)
-                    cv2.circle(
-                        current_hotmap,
-                        (maxLoc[0], maxLoc[1]),
-                        int(30 * maxVal),
-                        (255, 255, 255),
-                    )
-                    self.imglog.hotmaps.append(current_hotmap)
-                    self.imglog.hotmaps.append(final_hotmap)
+        w, h = needle.width, needle.height
+        dx, dy = needle.center_offset.x, needle.center_offset.y
+        matches = [MatchRecord(x, y, w, h, dx, dy, value) for x, y, value in peaks]
+        # hotmaps are only rendered if they are going to be logged while
+        # accumulated logging might still be processed by a calling finder
+        if not self.imglog.is_enabled(30) and not ImageLogger.accumulate_logging:
+            return matches
 
-                log.debug("Next best match is not acceptable")
-                break
-            else:
-                self.imglog.similarities.append(maxVal)
-                self.imglog.locations.append(maxLoc)
-                current_hotmap = numpy.copy(universal_hotmap)
-                cv2.circle(
-                    current_hotmap,
-                    (maxLoc[0], maxLoc[1]),
-                    int(30 * maxVal),
-                    (255, 255, 255),
-                )
-                x, y = maxLoc
-                w, h = needle.width, needle.height
-                dx, dy = needle.center_offset.x, needle.center_offset.y
+        frame = Frame.from_image(haystack)
+        universal_hotmap = result * 255.0
+        if self.params["template"]["nocolor"].value:
+            final_hotmap = self.imglog.canvas(frame.gray)
+        else:
+            final_hotmap = self.imglog.canvas(frame.rgb)
+        if len(peaks) == 0:
+            # log the best unacceptable match
+            _, max_val, _, max_loc = cv2.minMaxLoc(result)
+            peaks = [(max_loc[0], max_loc[1], min(max(max_val, 0.0), 1.0))]
+        for x, y, value in peaks:
+            self.imglog.similarities.append(value)
+            self.imglog.locations.append((x, y))
+            current_hotmap = self.imglog.canvas(universal_hotmap)
+            if self.imglog.is_enabled(30):
+                cv2.circle(current_hotmap, (x, y), int(30 * value), (255, 255, 255))
+            self.imglog.hotmaps.append(current_hotmap)
+            if len(matches) > 0 and self.imglog.is_enabled(30):
                 cv2.rectangle(final_hotmap, (x, y), (x + w, y + h), (0, 0, 0), 2)
                 cv2.rectangle(final_hotmap, (x, y), (x + w, y + h), (255, 255, 255), 1)
-                self.imglog.hotmaps.append(current_hotmap)
-                log.debug("Next best match is acceptable")
-                matches.append(Match(x, y, w, h, dx, dy, maxVal))
-                if similarity == 0.0:
-                    # return just one match if no similarity requirement
-                    break
-
-            res_w = haystack.width - needle.width + 1
-            res_h = haystack.height - needle.height + 1
-            match_x0 = max(maxLoc[0] - int(0.5 * needle.width), 0)
-            match_x1 = min(maxLoc[0] + int(0.5 * needle.width), res_w)
-            match_y0 = max(maxLoc[1] - int(0.5 * needle.height), 0)
-            match_y1 = min(maxLoc[1] + int(0.5 * needle.height), res_h)
-
-            # log this only if performing deep internal debugging
-            log.log(
-                9,
-                "Wipe image matches in x [%s, %s]/[%s, %s]",
-                match_x0,
-                match_x1,
-                0,
-                res_w,
-            )
-            log.log(
-                9,
-                "Wipe image matches in y [%s, %s]/[%s, %s]",
-                match_y0,
-                match_y1,
-                0,
-                res_h,
-            )
-
-            # clean found image to look for next safe distance match
-            result[match_y0:match_y1, match_x0:match_x1] = 0.0
-
-            log.log(9, "Total maxima up to the point are %i", len(matches))
-        log.debug("A total of %i matches found", len(matches))
         self.imglog.hotmaps.append(final_hotmap)
         self.imglog.log(30)
 
         return matches
 
+    def _extract_peaks(
+        self, result: "Matlike", similarity: float, width: int, height: int
+    ) -> list[tuple[int, int, float]]:
+        """
+        EXTRA DOCSTRING: Template matching backend - peak extraction.
+
+        Extract all local maxima of a template matching result above the
+        required similarity sorted by value, suppressing any maxima closer
+        than half of the needle size to a better one.
+        """
+        import cv2
+        import numpy
+
+        # rectify to the [0,1] interval to avoid negative values in some methods
+        result = numpy.clip(result, 0.0, 1.0)
+        if similarity == 0.0:
+            # return just one match if no similarity requirement
+            _, max_val, _, max_loc = cv2.minMaxLoc(result)
+            return [(max_loc[0], max_loc[1], max_val)]
+
+        # candidates are the acceptable maxima within their suppression window
+        radius_x, radius_y = max(int(0.5 * width), 1), max(int(0.5 * height), 1)
+        kernel = numpy.ones((2 * radius_y - 1, 2 * radius_x - 1), numpy.uint8)
+        peaks = (result >= similarity) & (result >= cv2.dilate(result, kernel))
+        ys, xs = numpy.nonzero(peaks)
+        values = result[ys, xs]
+        order = numpy.argsort(-values, kind="stable")
+        xs, ys, values = xs[order], ys[order], values[order]
+
+        # non-maximum suppression of neighbouring maxima where equal maxima
+        # (e.g. plateaus of flat or saturated results) are taken in row order
+        suppressed = numpy.zeros(result.shape, dtype=bool)
+        keep = numpy.zeros(len(values), dtype=bool)
+        for i, (x, y) in enumerate(zip(xs, ys)):
+            if suppressed[y, x]:
+                continue
+            keep[i] = True
+            suppressed[
+                max(y - radius_y + 1, 0) : y + radius_y,
+                max(x - radius_x + 1, 0) : x + radius_x,
+            ] = True
+        log.log(9, "Suppressed %i of %i maxima", len(keep) - keep.sum(), len(keep))
+        return [
+            (int(x), int(y), float(value))
+            for x, y, value in zip(xs[keep], ys[keep], values[keep])
+        ]
+
     def _match_template(
         self, needle: "Image", haystack: "Image", nocolor: str, method: str
     ) -> "Matlike | None":
@@ -1249,17 +1557,92 @@ class TemplateFinder(Finder):
         if method not in methods.keys():
             raise UnsupportedBackendError("Supported algorithms are in conflict")
 
-        numpy_needle = numpy.array(needle.pil_image)
-        numpy_haystack = numpy.array(haystack.pil_image)
+        from .target import Frame
+
+        needle, haystack = Frame.from_image(needle), Frame.from_image(haystack)
+        levels = self.params["template"]["pyramidLevels"].value
+        # the needle should retain some detail at the coarsest level
+        while levels > 0 and min(needle.width, needle.height) >> levels < 4:
+            levels -= 1
+        if levels > 0:
+            match = self._match_template_pyramid(
+                needle, haystack, nocolor, methods[method], levels
+            )
+            if match is not None:
+                return match
+            if not self.params["template"]["pyramidFallback"].value:
+                # worst possible matching value everywhere
+                worst = 1.0 if method.startswith("sqdiff") else 0.0
+                return numpy.full(
+                    (
+                        haystack.height - needle.height + 1,
+                        haystack.width - needle.width + 1,
+                    ),
+                    worst,
+                    numpy.float32,
+                )
+            log.debug("No coarse candidates found, matching at full resolution")
+
         if nocolor:
-            gray_needle = cv2.cvtColor(numpy_needle, cv2.COLOR_RGB2GRAY)
-            gray_haystack = cv2.cvtColor(numpy_haystack, cv2.COLOR_RGB2GRAY)
-            match = cv2.matchTemplate(gray_haystack, gray_needle, methods[method])
+            match = cv2.matchTemplate(haystack.gray, needle.gray, methods[method])
         else:
-            match = cv2.matchTemplate(numpy_haystack, numpy_needle, methods[method])
+            match = cv2.matchTemplate(haystack.rgb, needle.rgb, methods[method])
 
         return match
 
+    def _match_template_pyramid(
+        self,
+        needle: "Frame",
+        haystack: "Frame",
+        nocolor: bool,
+        method: int,
+        levels: int,
+    ) -> "Matlike | None":
+        """
+        EXTRA DOCSTRING: Template matching backend - coarse-to-fine wrapper.
+
+        Match the needle on a downscaled pyramid level of both images and
+        refine the matching at full resolution only around coarse candidates.
+        """
+        import cv2
+        import numpy
+
+        coarse = cv2.matchTemplate(
+            haystack.pyramid(levels, nocolor), needle.pyramid(levels, nocolor), method
+        )
+        sqdiff = method in (cv2.TM_SQDIFF, cv2.TM_SQDIFF_NORMED)
+        if sqdiff:
+            coarse = 1.0 - coarse
+        similarity = self.params["find"]["similarity"].value
+        drop = self.params["template"]["pyramidSimilarityDrop"].value
+        candidates = (coarse >= similarity - drop * levels).astype(numpy.uint8)
+        log.log(
+            9,
+            "Found %i coarse candidates at pyramid level %i",
+            numpy.count_nonzero(candidates),
+            levels,
+        )
+        if not candidates.any():
+            return None
+
+        # refine each connected candidate area with a margin of one coarse pixel
+        scale = 1 << levels
+        res_w = haystack.width - needle.width + 1
+        res_h = haystack.height - needle.height + 1
+        result = numpy.full((res_h, res_w), 1.0 if sqdiff else 0.0, numpy.float32)
+        himg = haystack.gray if nocolor else haystack.rgb
+        nimg = needle.gray if nocolor else needle.rgb
+        _, _, stats, _ = cv2.connectedComponentsWithStats(candidates)
+        for x, y, w, h, _ in stats[1:]:
+            x0, y0 = max((x - 1) * scale, 0), max((y - 1) * scale, 0)
+            x1 = min((x + w + 1) * scale, res_w)
+            y1 = min((y + h + 1) * scale, res_h)
+            if x1 <= x0 or y1 <= y0:
+                continue
+            roi = himg[y0 : y1 + needle.height - 1, x0 : x1 + needle.width - 1]
+            result[y0:y1, x0:x1] = cv2.matchTemplate(roi, nimg, method)
+        return result
+
     def log(self, lvl: int) -> None:
         """
         Log images with an arbitrary logging level.
@@ -1309,6 +1692,9 @@ class FeatureFinder(Finder):
         by default in newer OpenCV versions (>3.0).
     """
 
+    #: needle keypoints and descriptors shared by all feature finders
+    feature_cache = LRUCache(GlobalConfig.feature_cache_size)
+
     def __init__(self, configure: bool = True, synchronize: bool = True) -> None:
         """Build a CV backend using OpenCV's feature matching."""
         super(FeatureFinder, self).__init__(configure=False, synchronize=False)
@@ -1344,6 +1730,8 @@ class FeatureFinder(Finder):
         self.detector = None
         self.extractor = None
         self.matcher = None
+        # parameter versions the above backend objects were last synchronized with
+        self._synced_versions = {}
 
         # additional preparation
         if configure:
@@ -1392,6 +1780,12 @@ class FeatureFinder(Finder):
             self.params[category]["similarityRatio"] = CVParameter(
                 1, 0, 1, enumerated=True
             )
+            # return all needle instances by clustering the matched features
+            # around their voted needle positions (within a radius of needle size)
+            self.params[category]["multipleInstances"] = CVParameter(False)
+            self.params[category]["clusterRadius"] = CVParameter(
+                0.5, 0.05, 1.0, 0.25, 0.05
+            )
         elif category == "fdetect":
             self.params[category]["nzoom"] = CVParameter(1.0, 1.0, 10.0, 2.5)
             self.params[category]["hzoom"] = CVParameter(1.0, 1.0, 10.0, 2.5)
@@ -1548,7 +1942,11 @@ class FeatureFinder(Finder):
         if category == "feature":
             # nothing to sync
             return
-        elif category == "fdetect":
+        # backend objects are rebuilt only if their configuration has changed
+        if self._synced_versions.get(category) == self._get_versions(category):
+            return
+
+        if category == "fdetect":
             import cv2
 
             feature_detector_create = getattr(cv2, "%s_create" % backend)
@@ -1568,6 +1966,7 @@ class FeatureFinder(Finder):
             # are extracted from the matcher interface although
             # the API supports it - skip fmatch for now
             self.matcher = backend_obj
+            self._synced_versions[category] = self._get_versions(category)
             return
 
         for attribute in dir(backend_obj):
@@ -1591,6 +1990,13 @@ class FeatureFinder(Finder):
             self.extractor = backend_obj
         elif category == "fmatch":
             self.matcher = backend_obj
+        self._synced_versions[category] = self._get_versions(category)
+
+    def _get_versions(self, category: str) -> tuple[Any, ...]:
+        params = self.params[category]
+        return (params["backend"],) + tuple(
+            p.version for p in params.values() if isinstance(p, CVParameter)
+        )
 
     def synchronize_backend(
         self, backend: str = None, category: str = "feature", reset: bool = False
@@ -1635,7 +2041,7 @@ class FeatureFinder(Finder):
         """
         self.__synchronize(feature_detect, feature_extract, feature_match, reset)
 
-    def find(self, needle: "Image", haystack: "Image") -> "list[Match]":
+    def find(self, needle: "Image", haystack: "Image") -> "list[MatchRecord]":
         """
         Find all needle targets in a haystack image.
 
@@ -1645,8 +2051,9 @@ class FeatureFinder(Finder):
 
         See base method for details.
 
-        .. warning:: Finding multiple matches is currently not supported
-                     and this will currently only return a single match.
+        .. note:: Finding multiple matches is only supported if the feature
+                  parameter `multipleInstances` is enabled and will otherwise
+                  only return a single match.
 
         Available methods are: a combination of feature detector,
         extractor, and matcher.
@@ -1657,15 +2064,18 @@ class FeatureFinder(Finder):
         self.imglog.haystack = haystack
         self.imglog.dump_matched_images()
 
-        import cv2
         import numpy
 
-        ngray = cv2.cvtColor(numpy.array(needle.pil_image), cv2.COLOR_RGB2GRAY)
-        hgray = cv2.cvtColor(numpy.array(haystack.pil_image), cv2.COLOR_RGB2GRAY)
-        self.imglog.hotmaps.append(numpy.array(haystack.pil_image))
-        self.imglog.hotmaps.append(numpy.array(haystack.pil_image))
-        self.imglog.hotmaps.append(numpy.array(haystack.pil_image))
-        self.imglog.hotmaps.append(numpy.array(haystack.pil_image))
+        from .target import Frame
+
+        frame = Frame.from_image(haystack)
+        ngray = Frame.from_image(needle).gray
+        hgray = frame.gray
+        # hotmaps for the detection, matching, filtering, and projection stages
+        self.imglog.hotmaps.append(self.imglog.canvas(frame.rgb, 10))
+        self.imglog.hotmaps.append(self.imglog.canvas(frame.rgb, 10))
+        self.imglog.hotmaps.append(self.imglog.canvas(frame.rgb, 20))
+        self.imglog.hotmaps.append(self.imglog.canvas(frame.rgb, 30))
 
         # project more points for debugging purposes and image logging
         npoints = []
@@ -1680,14 +2090,30 @@ class FeatureFinder(Finder):
         npoints.append((needle.width / 2, needle.height / 2))
 
         similarity = self.params["find"]["similarity"].value
-        hpoints = self._project_features(npoints, ngray, hgray, similarity)
+        if self.params["feature"]["multipleInstances"].value:
+            from .match import MatchRecord
+
+            instances = self._project_instances(
+                npoints, ngray, hgray, similarity, needle.filename
+            )
+            matches = []
+            for hpoints, instance_similarity in instances:
+                x, y = hpoints[0]
+                w, h = tuple(numpy.abs(numpy.subtract(hpoints[3], hpoints[0])))
+                matches.append(MatchRecord(x, y, w, h, 0, 0, instance_similarity))
+            self.imglog.log(30 if len(matches) > 0 else 40)
+            return matches
+
+        hpoints = self._project_features(
+            npoints, ngray, hgray, similarity, needle.filename
+        )
         if hpoints is not None and len(hpoints) > 0:
-            from .match import Match
+            from .match import MatchRecord
 
             x, y = hpoints[0]
             w, h = tuple(numpy.abs(numpy.subtract(hpoints[3], hpoints[0])))
             # TODO: projecting offset requires more effort
-            matches = [Match(x, y, w, h, 0, 0, self.imglog.similarities[-1])]
+            matches = [MatchRecord(x, y, w, h, 0, 0, self.imglog.similarities[-1])]
             self.imglog.log(30)
             return matches
         self.imglog.log(40)
@@ -1699,6 +2125,7 @@ class FeatureFinder(Finder):
         ngray: "Matlike",
         hgray: "Matlike",
         similarity: float,
+        nfile: str = "",
     ) -> list[tuple[int, int]] | None:
         """
         EXTRA DOCSTRING: Feature matching backend - wrapper.
@@ -1725,6 +2152,7 @@ class FeatureFinder(Finder):
             hgray,
             self.params["fdetect"]["backend"],
             self.params["fextract"]["backend"],
+            nfile,
         )
 
         min_features = self.params["feature"]["minDetectedFeatures"].value
@@ -1777,23 +2205,182 @@ class FeatureFinder(Finder):
                 )
             return locations_in_haystack
 
+    def _project_instances(
+        self,
+        locations_in_needle: list[tuple[int, int]],
+        ngray: "Matlike",
+        hgray: "Matlike",
+        similarity: float,
+        nfile: str = "",
+    ) -> list[tuple[list[tuple[int, int]], float]]:
+        """
+        EXTRA DOCSTRING: Feature matching backend - multiple instances wrapper.
+
+        Variant of the feature projection wrapper which clusters the matched
+        keypoints by the needle position they vote for and projects the needle
+        locations separately for each cluster with enough matched features.
+
+        The returned instances are pairs of projected locations and similarity
+        sorted starting from the most similar one.
+        """
+        # default logging in case no match is found (further overridden by match stages)
+        self.imglog.locations.append((0, 0))
+        self.imglog.similarities.append(0.0)
+
+        nkp, ndc, hkp, hdc = self._detect_features(
+            ngray,
+            hgray,
+            self.params["fdetect"]["backend"],
+            self.params["fextract"]["backend"],
+            nfile,
+        )
+        min_features = self.params["feature"]["minDetectedFeatures"].value
+        if len(nkp) < min_features or len(hkp) < min_features:
+            log.debug(
+                "No acceptable instances after feature detection: "
+                "only %s\\%s needle and %s\\%s haystack features detected",
+                len(nkp),
+                min_features,
+                len(hkp),
+                min_features,
+            )
+            return []
+
+        mnkp, mhkp = self._match_features(
+            nkp, ndc, hkp, hdc, self.params["fmatch"]["backend"]
+        )
+
+        radius = self.params["feature"]["clusterRadius"].value
+        radius *= min(ngray.shape[0], ngray.shape[1])
+        clusters = self._cluster_matches(mnkp, mhkp, max(radius, 1.0))
+        min_features = self.params["feature"]["minMatchedFeatures"].value
+        instances = []
+        for cluster in clusters:
+            if len(cluster) < min_features:
+                continue
+            # the match similarity of a single instance
+            self.imglog.similarities[-1] = min(1.0, float(len(cluster)) / len(nkp))
+            if self.imglog.similarities[-1] < similarity:
+                continue
+            locations_in_haystack = self._project_locations(
+                locations_in_needle,
+                [mnkp[i] for i in cluster],
+                [mhkp[i] for i in cluster],
+            )
+            if self.imglog.similarities[-1] < similarity:
+                continue
+            instances.append((locations_in_haystack, self.imglog.similarities[-1]))
+
+        log.debug(
+            "Found %i instances from %i clusters of matched features",
+            len(instances),
+            len(clusters),
+        )
+        instances = sorted(instances, key=lambda x: x[1], reverse=True)
+        self.imglog.similarities[-1] = instances[0][1] if instances else 0.0
+        if len(instances) > 0 and 30 >= self.imglog.logging_level:
+            self.imglog.draw_locations(
+                self.imglog.locations,
+                self.imglog.hotmaps[-1],
+                3,
+                0,
+                0,
+                255,
+            )
+        return instances
+
+    def _cluster_matches(
+        self, mnkp: list[Any], mhkp: list[Any], radius: float
+    ) -> list[list[int]]:
+        """
+        EXTRA DOCSTRING: Feature matching backend - clustering stage.
+
+        Group the matches by the position of the needle origin in the haystack
+        that each of them votes for, returning the match indices of each group.
+
+        The votes account for the relative scale and rotation of the matched
+        keypoints and are grouped around their modes found by mean shift with
+        a flat kernel of the given radius starting from the densest votes.
+        Votes within the radius of no mode are returned as separate (sparse)
+        groups that cannot provide enough matches for an instance.
+        """
+        assert len(mnkp) == len(mhkp)
+        if len(mnkp) == 0:
+            return []
+
+        import numpy
+
+        npoints = numpy.array([kp.pt for kp in mnkp])
+        hpoints = numpy.array([kp.pt for kp in mhkp])
+        nsizes = numpy.array([kp.size for kp in mnkp])
+        hsizes = numpy.array([kp.size for kp in mhkp])
+        scales = numpy.where(
+            (nsizes > 0) & (hsizes > 0), hsizes / numpy.maximum(nsizes, 1e-6), 1.0
+        )
+        # detectors without orientation provide negative keypoint angles
+        nangles = numpy.array([kp.angle for kp in mnkp])
+        hangles = numpy.array([kp.angle for kp in mhkp])
+        angles = numpy.where(
+            (nangles >= 0) & (hangles >= 0), numpy.radians(hangles - nangles), 0.0
+        )
+        cos, sin = scales * numpy.cos(angles), scales * numpy.sin(angles)
+        votes = hpoints - numpy.stack(
+            [
+                cos * npoints[:, 0] - sin * npoints[:, 1],
+                sin * npoints[:, 0] + cos * npoints[:, 1],
+            ],
+            axis=1,
+        )
+
+        # count the votes within the radius of each vote in bounded memory
+        radius2 = radius * radius
+        density = numpy.zeros(len(votes), dtype=numpy.int64)
+        for k in range(0, len(votes), 256):
+            distances = ((votes[k : k + 256, None] - votes[None]) ** 2).sum(axis=2)
+            density[k : k + 256] = (distances <= radius2).sum(axis=1)
+        unassigned = numpy.ones(len(votes), dtype=bool)
+        clusters = []
+        for i in numpy.argsort(-density, kind="stable"):
+            if not unassigned[i]:
+                continue
+            if density[i] == 1:
+                unassigned[i] = False
+                clusters.append([int(i)])
+                continue
+            # shift the window from the vote to the local mode of the votes
+            center, window = votes[i], numpy.zeros(len(votes), dtype=bool)
+            for _ in range(10):
+                shifted_window = ((votes - center) ** 2).sum(axis=1) <= radius2
+                if not shifted_window.any():
+                    break
+                window = shifted_window
+                shifted = votes[window].mean(axis=0)
+                if numpy.allclose(shifted, center, atol=0.5):
+                    break
+                center = shifted
+            window[i] = True
+            members = numpy.flatnonzero(window & unassigned)
+            unassigned[members] = False
+            clusters.append(members.tolist())
+        return clusters
+
     def _detect_features(
-        self, ngray: int, hgray: int, detect: str, extract: str
+        self, ngray: int, hgray: int, detect: str, extract: str, nfile: str = ""
     ) -> tuple[list[Any], list[Any], list[Any], list[Any]]:
         """
         EXTRA DOCSTRING: Feature matching backend - detection/extraction stage (1).
 
         Detect all keypoints and calculate their respective decriptors.
+
+        The needle keypoints and descriptors are reused from the feature cache
+        (and from a file next to the needle image `nfile` if persisted) for
+        the same needle contents and detection and extraction parameters.
         """
-        nfactor = self.params["fdetect"]["nzoom"].value
         hfactor = self.params["fdetect"]["hzoom"].value
 
         # zoom in if explicitly set
         import cv2
 
-        if nfactor > 1.0:
-            log.debug("Zooming x%i needle", nfactor)
-            ngray = cv2.resize(ngray, None, fx=nfactor, fy=nfactor)
         if hfactor > 1.0:
             log.debug("Zooming x%i haystack", hfactor)
             hgray = cv2.resize(hgray, None, fx=hfactor, fy=hfactor)
@@ -1806,12 +2393,10 @@ class FeatureFinder(Finder):
             self.synchronize_backend(category="fdetect")
             self.synchronize_backend(category="fextract")
 
-            # keypoints
-            nkeypoints = self.detector.detect(ngray)
-            hkeypoints = self.detector.detect(hgray)
+            nkeypoints, ndescriptors = self._detect_needle_features(ngray, nfile)
 
-            # feature vectors (descriptors)
-            (nkeypoints, ndescriptors) = self.extractor.compute(ngray, nkeypoints)
+            # keypoints and feature vectors (descriptors)
+            hkeypoints = self.detector.detect(hgray)
             (hkeypoints, hdescriptors) = self.extractor.compute(hgray, hkeypoints)
 
         else:
@@ -1821,11 +2406,6 @@ class FeatureFinder(Finder):
             )
 
         # reduce keypoint coordinates to the original image size
-        for nkeypoint in nkeypoints:
-            nkeypoint.pt = (
-                int(nkeypoint.pt[0] / nfactor),
-                int(nkeypoint.pt[1] / nfactor),
-            )
         for hkeypoint in hkeypoints:
             hkeypoint.pt = (
                 int(hkeypoint.pt[0] / hfactor),
@@ -1848,7 +2428,92 @@ class FeatureFinder(Finder):
                 0,
             )
 
-        return (nkeypoints, ndescriptors, hkeypoints, hdescriptors)
+        return (nkeypoints, ndescriptors, hkeypoints, hdescriptors)
+
+    def _detect_needle_features(
+        self, ngray: "Matlike", nfile: str = ""
+    ) -> tuple[list[Any], Any]:
+        """
+        EXTRA DOCSTRING: Feature matching backend - needle detection/extraction.
+
+        Detect all needle keypoints and calculate their respective descriptors
+        unless they were already cached for the same needle and parameters.
+        """
+        import cv2
+        import numpy
+
+        # cache both in memory and on disk using the needle contents and parameters
+        digest = hashlib.blake2b(ngray.tobytes(), digest_size=16)
+        digest.update(str(ngray.shape).encode())
+        for category in ["fdetect", "fextract"]:
+            for name, param in self.params[category].items():
+                value = param.value if isinstance(param, CVParameter) else param
+                digest.update(("%s.%s=%s;" % (category, name, value)).encode())
+        key = digest.hexdigest()
+        FeatureFinder.feature_cache.maxsize = GlobalConfig.feature_cache_size
+        persist = GlobalConfig.feature_cache_persist is True and nfile != ""
+        cache_file = os.path.splitext(nfile)[0] + ".features.npz"
+
+        features = FeatureFinder.feature_cache.get(key)
+        if features is None and persist and os.path.exists(cache_file):
+            with numpy.load(cache_file) as cached:
+                if key + "_keypoints" in cached.files:
+                    keypoints = cached[key + "_keypoints"]
+                    descriptors = cached[key + "_descriptors"]
+                    nkeypoints = [
+                        cv2.KeyPoint(x, y, size, angle, response, int(octave), int(cid))
+                        for x, y, size, angle, response, octave, cid in keypoints
+                    ]
+                    ndescriptors = descriptors if descriptors.size > 0 else None
+                    features = (nkeypoints, ndescriptors)
+                    FeatureFinder.feature_cache.put(key, features)
+        if features is not None:
+            log.log(9, "Reusing cached needle features %s", key)
+            return features
+
+        nfactor = self.params["fdetect"]["nzoom"].value
+        if nfactor > 1.0:
+            log.debug("Zooming x%i needle", nfactor)
+            ngray = cv2.resize(ngray, None, fx=nfactor, fy=nfactor)
+        nkeypoints = self.detector.detect(ngray)
+        (nkeypoints, ndescriptors) = self.extractor.compute(ngray, nkeypoints)
+        # reduce keypoint coordinates to the original image size
+        for nkeypoint in nkeypoints:
+            nkeypoint.pt = (
+                int(nkeypoint.pt[0] / nfactor),
+                int(nkeypoint.pt[1] / nfactor),
+            )
+
+        features = (nkeypoints, ndescriptors)
+        FeatureFinder.feature_cache.put(key, features)
+        if persist:
+            try:
+                cached = {}
+                if os.path.exists(cache_file):
+                    with numpy.load(cache_file) as previous:
+                        cached = dict(previous)
+                cached[key + "_keypoints"] = numpy.array(
+                    [
+                        (*kp.pt, kp.size, kp.angle, kp.response, kp.octave, kp.class_id)
+                        for kp in nkeypoints
+                    ],
+                    dtype=numpy.float64,
+                ).reshape(-1, 7)
+                cached[key + "_descriptors"] = (
+                    ndescriptors
+                    if ndescriptors is not None
+                    else numpy.empty((0, 0), dtype=numpy.uint8)
+                )
+                # write atomically since the same needles might be used in parallel
+                temp_file = cache_file + ".%s.tmp.npz" % os.getpid()
+                numpy.savez(temp_file, **cached)
+                os.replace(temp_file, cache_file)
+            except OSError as error:
+                # the features remain cached in memory for unwritable needle paths
+                log.warning(
+                    "Could not store needle features in %s: %s", cache_file, error
+                )
+        return features
 
     def _match_features(
         self,
@@ -1875,21 +2540,16 @@ class FeatureFinder(Finder):
             Therefore these matches are ignored and thus only matches of
             greater probabilty are returned.
             """
-            matches2 = []
-            for m in matches:
-
-                if len(m) > 1:
-                    # smooth to make 0/0 case also defined as 1.0
-                    smooth_dist1 = m[0].distance + 0.0000001
-                    smooth_dist2 = m[1].distance + 0.0000001
-
-                    if (
-                        smooth_dist1 / smooth_dist2
-                        < self.params["fmatch"]["ratioThreshold"].value
-                    ):
-                        matches2.append(m[0])
-                else:
-                    matches2.append(m[0])
+            import numpy
+
+            matches = [m for m in matches if len(m) > 0]
+            single = numpy.array([len(m) == 1 for m in matches], dtype=bool)
+            # smooth to make 0/0 case also defined as 1.0
+            dist1 = numpy.array([m[0].distance for m in matches]) + 0.0000001
+            dist2 = numpy.array([m[-1].distance for m in matches]) + 0.0000001
+            ratios = dist1 / dist2
+            passed = single | (ratios < self.params["fmatch"]["ratioThreshold"].value)
+            matches2 = [matches[i][0] for i in numpy.flatnonzero(passed)]
 
             log.log(9, "Ratio test result is %i/%i", len(matches2), len(matches))
             return matches2
@@ -1904,16 +2564,18 @@ class FeatureFinder(Finder):
             The two keypoints must be best feature matching of each other
             to ensure the error by accepting the match is not too large.
             """
-            import cv2
-
-            matches2 = []
-            for nm in nmatches:
-                for hm in hmatches:
-
-                    if nm.queryIdx == hm.trainIdx and nm.trainIdx == hm.queryIdx:
-                        m = cv2.DMatch(nm.queryIdx, nm.trainIdx, nm.distance)
-                        matches2.append(m)
-                        break
+            import numpy
+
+            nquery = numpy.array([m.queryIdx for m in nmatches], dtype=numpy.int64)
+            ntrain = numpy.array([m.trainIdx for m in nmatches], dtype=numpy.int64)
+            hquery = numpy.array([m.queryIdx for m in hmatches], dtype=numpy.int64)
+            htrain = numpy.array([m.trainIdx for m in hmatches], dtype=numpy.int64)
+            # index the needle keypoint matched by each haystack keypoint (if any)
+            size = max(ntrain.max(initial=-1), hquery.max(initial=-1)) + 1
+            backward = numpy.full(size, -1, dtype=numpy.int64)
+            backward[hquery] = htrain
+            symmetric = backward[ntrain] == nquery
+            matches2 = [nmatches[i] for i in numpy.flatnonzero(symmetric)]
 
             log.log(9, "Symmetry test result is %i/%i", len(matches2), len(matches))
             return matches2
@@ -1940,6 +2602,20 @@ class FeatureFinder(Finder):
                 self.params["fmatch"]["variants_k"].value,
                 self.params["fmatch"]["variants_ratio"].value,
             )
+        elif self.params["feature"]["multipleInstances"].value:
+            import cv2
+
+            # a needle keypoint has a single best match among all instances
+            # so match each haystack keypoint to the needle ones instead
+            if self.params["fmatch"]["ratioTest"].value:
+                hmatches = self.matcher.knnMatch(hdescriptors, ndescriptors, 2)
+                hmatches = ratio_test(hmatches)
+            else:
+                hmatches = self.matcher.knnMatch(hdescriptors, ndescriptors, 1)
+                hmatches = [hm[0] for hm in hmatches if len(hm) > 0]
+            matches = [
+                cv2.DMatch(hm.trainIdx, hm.queryIdx, hm.distance) for hm in hmatches
+            ]
         else:
             if self.params["fmatch"]["ratioTest"].value:
                 matches = self.matcher.knnMatch(ndescriptors, hdescriptors, 2)
@@ -1977,7 +2653,10 @@ class FeatureFinder(Finder):
                 0,
             )
 
-        match_similarity = float(len(match_nkeypoints)) / float(len(nkeypoints))
+        # haystack keypoints of multiple instances could match the same needle ones
+        match_similarity = min(
+            1.0, float(len(match_nkeypoints)) / float(len(nkeypoints))
+        )
         # update the current achieved similarity if matching similarity is used:
         # won't be updated anymore if self.params["feature"]["similarityRatio"].value == 0
         self.imglog.similarities[-1] = match_similarity
@@ -2183,7 +2862,7 @@ class CascadeFinder(Finder):
         """
         self.__configure_backend(backend, category, reset)
 
-    def find(self, needle: "Pattern", haystack: "Image") -> "list[Match]":
+    def find(self, needle: "Pattern", haystack: "Image") -> "list[MatchRecord]":
         """
         Find all needle targets in a haystack image.
 
@@ -2200,17 +2879,17 @@ class CascadeFinder(Finder):
         self.imglog.dump_matched_images()
 
         import cv2
-        import numpy
 
         needle_cascade = cv2.CascadeClassifier(needle.data_file)
         if needle_cascade.empty():
             raise Exception("Could not load the cascade classifier properly")
-        gray_haystack = cv2.cvtColor(
-            numpy.array(haystack.pil_image), cv2.COLOR_RGB2GRAY
-        )
-        canvas = numpy.array(haystack.pil_image)
+        from .target import Frame
 
-        from .match import Match
+        frame = Frame.from_image(haystack)
+        gray_haystack = frame.gray
+        canvas = self.imglog.canvas(frame.rgb)
+
+        from .match import MatchRecord
 
         matches = []
         rects = needle_cascade.detectMultiScale(
@@ -2228,10 +2907,11 @@ class CascadeFinder(Finder):
             ),
         )
         for x, y, w, h in rects:
-            cv2.rectangle(canvas, (x, y), (x + w, y + h), (0, 0, 0), 2)
-            cv2.rectangle(canvas, (x, y), (x + w, y + h), (255, 0, 0), 1)
+            if self.imglog.is_enabled(30):
+                cv2.rectangle(canvas, (x, y), (x + w, y + h), (0, 0, 0), 2)
+                cv2.rectangle(canvas, (x, y), (x + w, y + h), (255, 0, 0), 1)
             dx, dy = needle.center_offset.x, needle.center_offset.y
-            matches.append(Match(x, y, w, h, dx, dy))
+            matches.append(MatchRecord(x, y, w, h, dx, dy))
 
         self.imglog.similarities.append(self.params["find"]["similarity"].value)
         self.imglog.locations = [(loc.x, loc.y) for loc in matches]
@@ -2254,6 +2934,11 @@ class TextFinder(ContourFinder):
     Neumann L., Matas J.: Real-Time Scene Text Localization and Recognition, CVPR 2012
     """
 
+    #: index of the detected and recognized text on recent haystacks
+    text_index = LRUCache(GlobalConfig.text_index_size, GlobalConfig.text_index_memory)
+    #: recognized text of recently seen (preprocessed) text region images
+    ocr_cache = LRUCache(GlobalConfig.ocr_cache_size, GlobalConfig.ocr_cache_memory)
+
     def __init__(self, configure: bool = True, synchronize: bool = True) -> None:
         """Build a CV backend using OpenCV's text matching options."""
         super(TextFinder, self).__init__(configure=False, synchronize=False)
@@ -2292,6 +2977,9 @@ class TextFinder(ContourFinder):
         self.erc2 = None
         self.erf2 = None
         self.ocr = None
+        # OCR instances for concurrent recognition (the first one being the above)
+        self._ocr_pool = []
+        self._ocr_factory = None
 
         # additional preparation
         if configure:
@@ -2467,6 +3155,9 @@ class TextFinder(ContourFinder):
                 # perform custom image thresholding if set to true or leave it to the OCR
                 self.params[category]["binarize_text"] = CVParameter(True)
             self.params[category]["min_confidence"] = CVParameter(0, 0, 100, 25.0)
+            # number of text regions recognized concurrently (only used by the
+            # pytesseract and tesserocr backends which are safe to run in parallel)
+            self.params[category]["workers"] = CVParameter(4, 1, None)
             # zoom factor for improved OCR processing due to higher resolution
             self.params[category]["zoom_factor"] = CVParameter(1.0, 1.0, 100.0, 25.0)
             # border size to wrap around text field to improve recognition rate
@@ -2638,6 +3329,7 @@ class TextFinder(ContourFinder):
             return
 
         elif category == "ocr":
+            self._ocr_factory = None
             if backend == "pytesseract":
                 import pytesseract
 
@@ -2664,14 +3356,20 @@ class TextFinder(ContourFinder):
                     "oem": self.params["ocr"]["oem"].value,
                     "psm": self.params["ocr"]["psmode"].value,
                 }
-                if tessdata_path:
-                    self.ocr = PyTessBaseAPI(path=tessdata_path, **kwargs)
-                else:
-                    self.ocr = PyTessBaseAPI(**kwargs)
-                self.ocr.SetVariable(
-                    "tessedit_char_whitelist",
-                    self.params["ocr"]["char_whitelist"].value,
-                )
+                whitelist = self.params["ocr"]["char_whitelist"].value
+
+                def create_ocr() -> "PyTessBaseAPI":
+                    if tessdata_path:
+                        ocr = PyTessBaseAPI(path=tessdata_path, **kwargs)
+                    else:
+                        ocr = PyTessBaseAPI(**kwargs)
+                    ocr.SetVariable("tessedit_char_whitelist", whitelist)
+                    return ocr
+
+                self.ocr = create_ocr()
+                # the API instances cannot be shared across threads so more of
+                # them are created on demand for concurrent recognition
+                self._ocr_factory = create_ocr
             elif backend == "tesseract":
                 kwargs = {
                     "language": self.params["ocr"]["language"].value,
@@ -2732,6 +3430,8 @@ class TextFinder(ContourFinder):
             else:
                 raise ValueError("Invalid OCR backend '%s'" % backend)
 
+            self._ocr_pool = [self.ocr]
+
     def synchronize_backend(
         self, backend: str = None, category: str = "text", reset: bool = False
     ) -> None:
@@ -2791,7 +3491,7 @@ class TextFinder(ContourFinder):
             reset,
         )
 
-    def find(self, needle: "Text", haystack: "Image") -> "list[Match]":
+    def find(self, needle: "Text", haystack: "Image") -> "list[MatchRecord]":
         """
         Find all needle targets in a haystack image.
 
@@ -2808,11 +3508,75 @@ class TextFinder(ContourFinder):
         self.imglog.dump_matched_images()
 
         import cv2
-        import numpy
+
+        from .target import Frame
 
         text_needle = needle.value
-        img_haystack = numpy.array(haystack.pil_image)
-        final_hotmap = numpy.array(haystack.pil_image)
+        haystack = Frame.from_image(haystack)
+        final_hotmap = self.imglog.canvas(haystack.rgb)
+
+        text_regions, outputs = self._index_text(haystack)
+        from .match import MatchRecord
+
+        matches = []
+        for i, (text_box, output) in enumerate(zip(text_regions, outputs)):
+            log.debug("OCR output %s = '%s'", i + 1, output)
+
+            similarity = 1.0 - float(needle.distance_to(output)) / max(
+                len(output), len(text_needle)
+            )
+            log.debug("Similarity = '%s'", similarity)
+            self.imglog.similarities.append(similarity)
+            if similarity >= self.params["find"]["similarity"].value:
+                log.debug("Text at (%s, %s) is acceptable", text_box[0], text_box[1])
+                self.imglog.locations.append((text_box[0], text_box[1]))
+                x, y, w, h = text_box
+                dx, dy = needle.center_offset.x, needle.center_offset.y
+                if self.imglog.is_enabled(30):
+                    cv2.rectangle(final_hotmap, (x, y), (x + w, y + h), (0, 0, 0), 2)
+                    cv2.rectangle(
+                        final_hotmap, (x, y), (x + w, y + h), (255, 255, 255), 1
+                    )
+                matches.append(MatchRecord(x, y, w, h, dx, dy, similarity))
+        matches = sorted(matches, key=lambda x: x.similarity, reverse=True)
+
+        self.imglog.hotmaps.append(final_hotmap)
+        self.imglog.log(30)
+        return matches
+
+    def _index_text(self, haystack: "Frame") -> tuple[list[list[int]], list[str]]:
+        """
+        Detect and recognize all text in a haystack image.
+
+        :param haystack: image to detect and recognize text in
+        :returns: detected text regions and the recognized text of each
+
+        The result is an index of all text on the haystack which is reused for
+        any text needle on haystacks with the same contents and the same text
+        detection and recognition parameters. It is not reused if images are
+        logged since the image logging of the detection has to be redone.
+        """
+        import cv2
+        import numpy
+
+        key = hashlib.blake2b(haystack.digest.encode(), digest_size=16)
+        for category in sorted(self.params.keys()):
+            if category == "find":
+                continue
+            for name, param in sorted(self.params[category].items()):
+                value = param.value if isinstance(param, CVParameter) else param
+                key.update(("%s.%s=%s;" % (category, name, value)).encode())
+        key = key.hexdigest()
+        TextFinder.text_index.maxsize = GlobalConfig.text_index_size
+        TextFinder.text_index.memory = GlobalConfig.text_index_memory
+        if not self.imglog.is_enabled(30):
+            index = TextFinder.text_index.get(key)
+            if index is not None:
+                log.debug(
+                    "Reusing text index %s of %i text regions", key, len(index[0])
+                )
+                return index
+        img_haystack = haystack.rgb
 
         # detect characters and group them into detected text
         backend = self.params["tdetect"]["backend"]
@@ -2835,9 +3599,6 @@ class TextFinder(ContourFinder):
         # perform optical character recognition on the final regions
         backend = self.params["ocr"]["backend"]
         log.debug("Recognizing text with %s", backend)
-        from .match import Match
-
-        matches = []
 
         def binarize_step(threshold: str, text_img: "Matlike") -> "Matlike":
             if self.params["ocr"]["binarize_text"].value:
@@ -2851,7 +3612,8 @@ class TextFinder(ContourFinder):
             else:
                 return cv2.cvtColor(text_img, cv2.COLOR_RGB2GRAY)
 
-        for i, text_box in enumerate(text_regions):
+        text_imgs = []
+        for text_box in text_regions:
 
             # main OCR preprocessing stage
             border = self.params["ocr"]["border_size"].value
@@ -2890,81 +3652,174 @@ class TextFinder(ContourFinder):
                 if self.params["ocr"]["erode_dilate"].value in [1, 2]:
                     text_img = cv2.dilate(text_img, element)
             self.imglog.hotmaps.append(text_img)
+            text_imgs.append(text_img)
 
-            # BUG: we hit segfault when using the BeamSearch OCR backend so disallow it
-            if backend == "beamSearch":
-                raise NotImplementedError(
-                    "Current version of BeamSearch segfaults so it's not yet available"
-                )
-            # TODO: we can do this now with pytesseract/tesserocr but have to evaluate its usefulness
-            # vector<Rect> boxes;
-            # vector<string> words;
-            # vector<float> confidences;
-            # output = ocr.run(group_img, &boxes, &words, &confidences, cv2.text.OCR_LEVEL_WORD)
-            # redirection of tesseract's streams can only be done on the file descriptor level
-            # sys.stdout = open(os.devnull, 'w')
-            if backend == "pytesseract":
-                output = self.ocr.image_to_string(
-                    text_img,
-                    lang=self.params["ocr"]["language"].value,
-                    config=self.ocr_config,
-                )
-                logging.debug(
-                    "Running pytesseract with extra command line %s", self.ocr_config
-                )
-            elif backend == "tesserocr":
-                self.ocr.SetImage(PIL.Image.fromarray(text_img))
-                output = self.ocr.GetUTF8Text()
-            else:
-                stdout_fd = sys.stdout.fileno() if hasattr(sys.stdout, "fileno") else 1
-                stderr_fd = sys.stderr.fileno() if hasattr(sys.stderr, "fileno") else 2
-                null_fo = open(os.devnull, "wb")
-                with os.fdopen(os.dup(stdout_fd), "wb") as cpout_fo:
-                    with os.fdopen(os.dup(stderr_fd), "wb") as cperr_fo:
-                        sys.stdout.flush()
-                        sys.stderr.flush()
-                        os.dup2(null_fo.fileno(), stdout_fd)
-                        os.dup2(null_fo.fileno(), stderr_fd)
-                        output = self.ocr.run(
-                            text_img,
-                            text_img,
-                            self.params["ocr"]["min_confidence"].value,
-                            self.params["ocr"]["component_level"].value,
-                        )
-                        sys.stdout.flush()
-                        sys.stderr.flush()
-                        os.dup2(cpout_fo.fileno(), stdout_fd)
-                        os.dup2(cperr_fo.fileno(), stderr_fd)
-                null_fo.close()
-            if self.params["ocr"]["component_level"].value == 1:
-                # strip of the new line character which is never useful
-                output = output.rstrip()
-            log.debug("OCR output %s = '%s'", i + 1, output)
+        outputs = self._recognize_texts(text_imgs)
 
-            similarity = 1.0 - float(needle.distance_to(output)) / max(
-                len(output), len(text_needle)
+        nbytes = sys.getsizeof(key) + sys.getsizeof(text_regions)
+        for text_box, output in zip(text_regions, outputs):
+            nbytes += sys.getsizeof(text_box) + sys.getsizeof(output)
+        TextFinder.text_index.put(key, (text_regions, outputs), nbytes)
+        return text_regions, outputs
+
+    def _recognize_texts(self, text_imgs: list["Matlike"]) -> list[str]:
+        """
+        Recognize the text in preprocessed images of text regions.
+
+        :param text_imgs: preprocessed images of the text regions
+        :returns: recognized text of each image in the same order
+
+        Images with the same contents and recognition parameters as recently
+        recognized ones reuse their cached text instead of running the OCR.
+        """
+        backend = self.params["ocr"]["backend"]
+        # BUG: we hit segfault when using the BeamSearch OCR backend so disallow it
+        if backend == "beamSearch" and len(text_imgs) > 0:
+            raise NotImplementedError(
+                "Current version of BeamSearch segfaults so it's not yet available"
             )
-            log.debug("Similarity = '%s'", similarity)
-            self.imglog.similarities.append(similarity)
-            if similarity >= self.params["find"]["similarity"].value:
-                log.debug("Text at (%s, %s) is acceptable", text_box[0], text_box[1])
-                self.imglog.locations.append((text_box[0], text_box[1]))
-                x, y, w, h = text_box
-                dx, dy = needle.center_offset.x, needle.center_offset.y
-                cv2.rectangle(final_hotmap, (x, y), (x + w, y + h), (0, 0, 0), 2)
-                cv2.rectangle(final_hotmap, (x, y), (x + w, y + h), (255, 255, 255), 1)
-                matches.append(Match(x, y, w, h, dx, dy, similarity))
-        matches = sorted(matches, key=lambda x: x.similarity, reverse=True)
 
-        self.imglog.hotmaps.append(final_hotmap)
-        self.imglog.log(30)
-        return matches
+        # only parameters used by the recognition itself (rather than the
+        # preprocessing reflected in the images) can change the cached text
+        params = hashlib.blake2b(digest_size=16)
+        params.update(self.params["text"]["datapath"].value.encode())
+        for name, param in sorted(self.params["ocr"].items()):
+            if name in [
+                "backend",
+                "language",
+                "char_whitelist",
+                "oem",
+                "psmode",
+                "extra_configs",
+                "component_level",
+                "classifier",
+                "min_confidence",
+            ]:
+                value = param.value if isinstance(param, CVParameter) else param
+                params.update(("%s=%s;" % (name, value)).encode())
+        keys = []
+        for text_img in text_imgs:
+            key = params.copy()
+            key.update(text_img.tobytes())
+            key.update(("%s%s" % (text_img.shape, text_img.dtype)).encode())
+            keys.append(key.hexdigest())
+        TextFinder.ocr_cache.maxsize = GlobalConfig.ocr_cache_size
+        TextFinder.ocr_cache.memory = GlobalConfig.ocr_cache_memory
+        outputs = [TextFinder.ocr_cache.get(key) for key in keys]
+        missing = [i for i, output in enumerate(outputs) if output is None]
+        log.debug(
+            "Reusing cached text for %i of %i text regions",
+            len(outputs) - len(missing),
+            len(outputs),
+        )
+
+        for i, output in zip(missing, self._run_ocr([text_imgs[i] for i in missing])):
+            outputs[i] = output
+            nbytes = sys.getsizeof(keys[i]) + sys.getsizeof(output)
+            TextFinder.ocr_cache.put(keys[i], output, nbytes)
+        return outputs
+
+    def _run_ocr(self, text_imgs: list["Matlike"]) -> list[str]:
+        """
+        Run the OCR on preprocessed images of text regions.
+
+        :param text_imgs: preprocessed images of the text regions
+        :returns: recognized text of each image in the same order
+
+        The pytesseract and tesserocr backends recognize multiple images
+        concurrently with up to the configured number of OCR workers.
+        """
+        backend = self.params["ocr"]["backend"]
+        workers = min(self.params["ocr"]["workers"].value, len(text_imgs))
+        if backend not in ["pytesseract", "tesserocr"] or workers <= 1:
+            return [self._recognize_text(text_img, self.ocr) for text_img in text_imgs]
+
+        engines = queue.Queue()
+        if backend == "tesserocr":
+            while len(self._ocr_pool) < workers:
+                self._ocr_pool.append(self._ocr_factory())
+            for ocr in self._ocr_pool[:workers]:
+                engines.put(ocr)
+        else:
+            # each pytesseract call runs its own tesseract process
+            for _ in range(workers):
+                engines.put(self.ocr)
+
+        def recognize(text_img: "Matlike") -> str:
+            ocr = engines.get()
+            try:
+                return self._recognize_text(text_img, ocr)
+            finally:
+                engines.put(ocr)
+
+        log.debug(
+            "Recognizing %i text regions with %i workers", len(text_imgs), workers
+        )
+        with concurrent.futures.ThreadPoolExecutor(workers) as executor:
+            # the outputs are collected in order of the text regions
+            return list(executor.map(recognize, text_imgs))
+
+    def _recognize_text(self, text_img: "Matlike", ocr: Any) -> str:
+        """
+        Recognize the text in a preprocessed image of a text region.
+
+        :param text_img: preprocessed image of the text region
+        :param ocr: OCR backend object to use for the recognition
+        :returns: recognized text
+        """
+        backend = self.params["ocr"]["backend"]
+        # TODO: we can do this now with pytesseract/tesserocr but have to evaluate its usefulness
+        # vector<Rect> boxes;
+        # vector<string> words;
+        # vector<float> confidences;
+        # output = ocr.run(group_img, &boxes, &words, &confidences, cv2.text.OCR_LEVEL_WORD)
+        # redirection of tesseract's streams can only be done on the file descriptor level
+        # sys.stdout = open(os.devnull, 'w')
+        if backend == "pytesseract":
+            output = ocr.image_to_string(
+                text_img,
+                lang=self.params["ocr"]["language"].value,
+                config=self.ocr_config,
+            )
+            logging.debug(
+                "Running pytesseract with extra command line %s", self.ocr_config
+            )
+        elif backend == "tesserocr":
+            ocr.SetImage(PIL.Image.fromarray(text_img))
+            output = ocr.GetUTF8Text()
+        else:
+            stdout_fd = sys.stdout.fileno() if hasattr(sys.stdout, "fileno") else 1
+            stderr_fd = sys.stderr.fileno() if hasattr(sys.stderr, "fileno") else 2
+            null_fo = open(os.devnull, "wb")
+            with os.fdopen(os.dup(stdout_fd), "wb") as cpout_fo:
+                with os.fdopen(os.dup(stderr_fd), "wb") as cperr_fo:
+                    sys.stdout.flush()
+                    sys.stderr.flush()
+                    os.dup2(null_fo.fileno(), stdout_fd)
+                    os.dup2(null_fo.fileno(), stderr_fd)
+                    output = ocr.run(
+                        text_img,
+                        text_img,
+                        self.params["ocr"]["min_confidence"].value,
+                        self.params["ocr"]["component_level"].value,
+                    )
+                    sys.stdout.flush()
+                    sys.stderr.flush()
+                    os.dup2(cpout_fo.fileno(), stdout_fd)
+                    os.dup2(cperr_fo.fileno(), stderr_fd)
+            null_fo.close()
+        if self.params["ocr"]["component_level"].value == 1:
+            # strip of the new line character which is never useful
+            output = output.rstrip()
+        return output
 
     def _detect_text_boxes(self, haystack: "Image") -> list[list[int]]:
         import cv2
-        import numpy
 
-        detection_img = numpy.array(haystack.pil_image)
+        from .target import Frame
+
+        frame = Frame.from_image(haystack)
+        detection_img = frame.rgb
         if self.params["tdetect"]["binarize_detection"].value:
             detection_img = self._binarize_image(detection_img)
 
@@ -2992,7 +3847,7 @@ class TextFinder(ContourFinder):
         )
 
         char_canvas = detection_img
-        text_canvas = numpy.array(haystack.pil_image)
+        text_canvas = self.imglog.canvas(frame.rgb)
         self.imglog.hotmaps.append(char_canvas)
         self.imglog.hotmaps.append(text_canvas)
 
@@ -3044,8 +3899,9 @@ class TextFinder(ContourFinder):
                 logging.debug(
                     "Found text '%s' with tesseract-provided box %s", text, (x, y, w, h)
                 )
-                cv2.rectangle(text_canvas, (x, y), (x + w, y + h), (0, 0, 0), 2)
-                cv2.rectangle(text_canvas, (x, y), (x + w, y + h), (0, 255, 0), 1)
+                if self.imglog.is_enabled(30):
+                    cv2.rectangle(text_canvas, (x, y), (x + w, y + h), (0, 0, 0), 2)
+                    cv2.rectangle(text_canvas, (x, y), (x + w, y + h), (0, 255, 0), 1)
                 text_regions.append([x, y, w, h])
 
         return text_regions
@@ -3056,9 +3912,13 @@ class TextFinder(ContourFinder):
         import cv2
         import numpy
 
-        img = numpy.array(haystack.pil_image)
-        char_canvas = cv2.cvtColor(numpy.array(haystack.pil_image), cv2.COLOR_RGB2GRAY)
-        text_canvas = numpy.array(haystack.pil_image)
+        from .target import Frame
+
+        frame = Frame.from_image(haystack)
+        img = frame.rgb
+        log_hotmaps = self.imglog.is_enabled(30)
+        char_canvas: "Matlike" = self.imglog.canvas(frame.gray)
+        text_canvas = self.imglog.canvas(frame.rgb)
         self.imglog.hotmaps.append(char_canvas)
         self.imglog.hotmaps.append(text_canvas)
 
@@ -3081,9 +3941,10 @@ class TextFinder(ContourFinder):
         # the output probabilities and the text bounding box coordinates
         output_layers = ["feature_fusion/Conv_7/Sigmoid", "feature_fusion/concat_3"]
         probability, geometry = self.east_net.forward(output_layers)
-        char_canvas[:] = cv2.resize(
-            probability[0, 0] * 255.0, (char_canvas.shape[1], char_canvas.shape[0])
-        )
+        if log_hotmaps:
+            char_canvas[:] = cv2.resize(
+                probability[0, 0] * 255.0, (char_canvas.shape[1], char_canvas.shape[0])
+            )
 
         rects = []
         for row in range(0, probability.shape[2]):
@@ -3115,20 +3976,21 @@ class TextFinder(ContourFinder):
                 x1, y1 = x2 - w, y2 - h
 
                 rect = (int(x1), int(y1), int(w), int(h))
-                cv2.rectangle(
-                    char_canvas,
-                    (rect[0], rect[1]),
-                    (rect[0] + rect[2], rect[1] + rect[3]),
-                    (0, 0, 0),
-                    2,
-                )
-                cv2.rectangle(
-                    char_canvas,
-                    (rect[0], rect[1]),
-                    (rect[0] + rect[2], rect[1] + rect[3]),
-                    (255, 255, 255),
-                    1,
-                )
+                if log_hotmaps:
+                    cv2.rectangle(
+                        char_canvas,
+                        (rect[0], rect[1]),
+                        (rect[0] + rect[2], rect[1] + rect[3]),
+                        (0, 0, 0),
+                        2,
+                    )
+                    cv2.rectangle(
+                        char_canvas,
+                        (rect[0], rect[1]),
+                        (rect[0] + rect[2], rect[1] + rect[3]),
+                        (255, 255, 255),
+                        1,
+                    )
                 rects.append(rect)
                 # TODO: needed for outsourced nonmaxima supression
                 # confidences.append(row_scores[x])
@@ -3169,32 +4031,36 @@ class TextFinder(ContourFinder):
                     r2pair[1] = False
             # first region is now merged with all intersecting regions
             text_regions.append(r1)
-        for rect in text_regions:
-            cv2.rectangle(
-                text_canvas,
-                (rect[0], rect[1]),
-                (rect[0] + rect[2], rect[1] + rect[3]),
-                (0, 0, 0),
-                2,
-            )
-            cv2.rectangle(
-                text_canvas,
-                (rect[0], rect[1]),
-                (rect[0] + rect[2], rect[1] + rect[3]),
-                (0, 0, 255),
-                1,
-            )
+        if log_hotmaps:
+            for rect in text_regions:
+                cv2.rectangle(
+                    text_canvas,
+                    (rect[0], rect[1]),
+                    (rect[0] + rect[2], rect[1] + rect[3]),
+                    (0, 0, 0),
+                    2,
+                )
+                cv2.rectangle(
+                    text_canvas,
+                    (rect[0], rect[1]),
+                    (rect[0] + rect[2], rect[1] + rect[3]),
+                    (0, 0, 255),
+                    1,
+                )
 
         logging.debug("A total of %s final text regions found", len(text_regions))
         return text_regions
 
     def _detect_text_erstat(self, haystack: "Image") -> list[tuple[int, int, int, int]]:
         import cv2
-        import numpy
 
-        img = numpy.array(haystack.pil_image)
-        char_canvas = numpy.array(haystack.pil_image)
-        text_canvas = numpy.array(haystack.pil_image)
+        from .target import Frame
+
+        frame = Frame.from_image(haystack)
+        img = frame.rgb
+        log_hotmaps = self.imglog.is_enabled(30)
+        char_canvas = self.imglog.canvas(frame.rgb)
+        text_canvas = self.imglog.canvas(frame.rgb)
         self.imglog.hotmaps.append(char_canvas)
         self.imglog.hotmaps.append(text_canvas)
 
@@ -3221,21 +4087,22 @@ class TextFinder(ContourFinder):
                 i,
             )
             rects = [cv2.boundingRect(p.reshape(-1, 1, 2)) for p in regions]
-            for rect in rects:
-                cv2.rectangle(
-                    char_canvas,
-                    (rect[0], rect[1]),
-                    (rect[0] + rect[2], rect[1] + rect[3]),
-                    (0, 0, 0),
-                    2,
-                )
-                cv2.rectangle(
-                    char_canvas,
-                    (rect[0], rect[1]),
-                    (rect[0] + rect[2], rect[1] + rect[3]),
-                    (0, 0, 255),
-                    1,
-                )
+            if log_hotmaps:
+                for rect in rects:
+                    cv2.rectangle(
+                        char_canvas,
+                        (rect[0], rect[1]),
+                        (rect[0] + rect[2], rect[1] + rect[3]),
+                        (0, 0, 0),
+                        2,
+                    )
+                    cv2.rectangle(
+                        char_canvas,
+                        (rect[0], rect[1]),
+                        (rect[0] + rect[2], rect[1] + rect[3]),
+                        (0, 0, 255),
+                        1,
+                    )
 
             if len(regions) == 0:
                 continue
@@ -3248,21 +4115,22 @@ class TextFinder(ContourFinder):
                 len(region_groups),
                 i,
             )
-            for rect in region_groups:
-                cv2.rectangle(
-                    text_canvas,
-                    (rect[0], rect[1]),
-                    (rect[0] + rect[2], rect[1] + rect[3]),
-                    (0, 0, 0),
-                    2,
-                )
-                cv2.rectangle(
-                    text_canvas,
-                    (rect[0], rect[1]),
-                    (rect[0] + rect[2], rect[1] + rect[3]),
-                    (0, 255, 0),
-                    1,
-                )
+            if log_hotmaps:
+                for rect in region_groups:
+                    cv2.rectangle(
+                        text_canvas,
+                        (rect[0], rect[1]),
+                        (rect[0] + rect[2], rect[1] + rect[3]),
+                        (0, 0, 0),
+                        2,
+                    )
+                    cv2.rectangle(
+                        text_canvas,
+                        (rect[0], rect[1]),
+                        (rect[0] + rect[2], rect[1] + rect[3]),
+                        (0, 255, 0),
+                        1,
+                    )
 
             char_regions.extend(regions)
             text_regions.extend(region_groups)
@@ -3302,15 +4170,21 @@ class TextFinder(ContourFinder):
         self, haystack: "Image"
     ) -> list[tuple[int, int, int, int]]:
         import cv2
-        import numpy
 
-        img = numpy.array(haystack.pil_image)
-        char_canvas = numpy.array(haystack.pil_image)
-        text_canvas = numpy.array(haystack.pil_image)
+        from .target import Frame
+
+        frame = Frame.from_image(haystack)
+        img = frame.rgb
+        log_hotmaps = self.imglog.is_enabled(30)
+        char_canvas = self.imglog.canvas(frame.rgb)
+        text_canvas = self.imglog.canvas(frame.rgb)
         self.imglog.hotmaps.append(char_canvas)
         self.imglog.hotmaps.append(text_canvas)
 
-        thresh_haystack = self._binarize_image(img)
+        thresh_haystack = frame.view(
+            ("binarized", repr(self.params["threshold"])),
+            lambda: self._binarize_image(img),
+        )
         countours_haystack = thresh_haystack.copy()
         haystack_contours = self._extract_contours(countours_haystack)
 
@@ -3339,8 +4213,9 @@ class TextFinder(ContourFinder):
                 )
                 continue
             else:
-                cv2.rectangle(char_canvas, (x, y), (x + w, y + h), (0, 0, 0), 2)
-                cv2.rectangle(char_canvas, (x, y), (x + w, y + h), (0, 0, 255), 1)
+                if log_hotmaps:
+                    cv2.rectangle(char_canvas, (x, y), (x + w, y + h), (0, 0, 0), 2)
+                    cv2.rectangle(char_canvas, (x, y), (x + w, y + h), (0, 0, 255), 1)
                 char_regions.append((x, y, w, h))
         char_regions = sorted(char_regions, key=lambda x: x[0])
 
@@ -3394,8 +4269,9 @@ class TextFinder(ContourFinder):
                 )
                 continue
             x, y, w, h = region1
-            cv2.rectangle(text_canvas, (x, y), (x + w, y + h), (0, 0, 0), 2)
-            cv2.rectangle(text_canvas, (x, y), (x + w, y + h), (0, 255, 0), 1)
+            if log_hotmaps:
+                cv2.rectangle(text_canvas, (x, y), (x + w, y + h), (0, 0, 0), 2)
+                cv2.rectangle(text_canvas, (x, y), (x + w, y + h), (0, 255, 0), 1)
             text_regions.append(region1)
             char_regions[i] = None
 
@@ -3405,11 +4281,13 @@ class TextFinder(ContourFinder):
         self, haystack: "Image"
     ) -> list[tuple[int, int, int, int]]:
         import cv2
-        import numpy
 
-        img = numpy.array(haystack.pil_image)
-        char_canvas = numpy.array(haystack.pil_image)
-        text_canvas = numpy.array(haystack.pil_image)
+        from .target import Frame
+
+        frame = Frame.from_image(haystack)
+        img = frame.rgb
+        char_canvas = frame.rgb.copy()
+        text_canvas = frame.rgb.copy()
         self.imglog.hotmaps.append(char_canvas)
         self.imglog.hotmaps.append(text_canvas)
 
@@ -3523,8 +4401,12 @@ class TemplateFeatureFinder(TemplateFinder, FeatureFinder):
     A separate (usually lower) front similarity is used for the first
     stage template matching in order to remove a lot of noise that
     would otherwise be distracting for the second stage feature matching.
+    The template matches are verified with feature matching concurrently
+    and optionally only until enough of them are verified.
     """
 
+    local_matching = False
+
     def __init__(self, configure: bool = True, synchronize: bool = True) -> None:
         """Build a CV backend using OpenCV's template and feature matching."""
         super(TemplateFeatureFinder, self).__init__(configure=False, synchronize=False)
@@ -3532,6 +4414,10 @@ class TemplateFeatureFinder(TemplateFinder, FeatureFinder):
         self.categories["tempfeat"] = "tempfeat_matchers"
         self.algorithms["tempfeat_matchers"] = ("mixed",)
 
+        # other attributes
+        # finders verifying template candidates concurrently with own backend objects
+        self._verifiers = []
+
         if configure:
             self.__configure(reset=True)
         if synchronize:
@@ -3571,6 +4457,10 @@ class TemplateFeatureFinder(TemplateFinder, FeatureFinder):
         self.params[category] = {}
         self.params[category]["backend"] = backend
         self.params[category]["front_similarity"] = CVParameter(0.7, 0.0, 1.0)
+        # number of template candidates verified concurrently by feature matching
+        self.params[category]["workers"] = CVParameter(4, 1, None)
+        # stop verifying candidates once that many matches are found (zero for all)
+        self.params[category]["maxMatches"] = CVParameter(0, 0, None)
 
     def configure_backend(
         self, backend: str = None, category: str = "tempfeat", reset: bool = False
@@ -3642,7 +4532,7 @@ class TemplateFeatureFinder(TemplateFinder, FeatureFinder):
             reset=False,
         )
 
-    def find(self, needle: "Image", haystack: "Image") -> "list[Match]":
+    def find(self, needle: "Image", haystack: "Image") -> "list[MatchRecord]":
         """
         Find all needle targets in a haystack image.
 
@@ -3668,7 +4558,6 @@ class TemplateFeatureFinder(TemplateFinder, FeatureFinder):
 
         # class-specific dependencies
         import cv2
-        import numpy
 
         self.params["find"]["similarity"].value = template_similarity
         # call specifically the template find variant here
@@ -3677,14 +4566,17 @@ class TemplateFeatureFinder(TemplateFinder, FeatureFinder):
         self.params["find"]["similarity"].value = feature_similarity
         # dump correct matching settings
         self.imglog.dump_matched_images()
-        ngray = cv2.cvtColor(numpy.array(needle.pil_image), cv2.COLOR_RGB2GRAY)
-        hgray = cv2.cvtColor(numpy.array(haystack.pil_image), cv2.COLOR_RGB2GRAY)
-        final_hotmap = numpy.array(haystack.pil_image)
+        from .target import Frame
+
+        frame = Frame.from_image(haystack)
+        ngray = Frame.from_image(needle).gray
+        hgray = frame.gray
+        log_hotmaps = self.imglog.is_enabled(30)
+        final_hotmap: "Matlike" = self.imglog.canvas(frame.rgb)
 
         frame_points = [(0, 0)]
-        feature_maxima = []
-        is_feature_poor = False
-        for i, upleft in enumerate(template_maxima):
+        regions = []
+        for upleft in template_maxima:
             up = upleft.y
             down = min(haystack.height, up + needle.height)
             left = upleft.x
@@ -3695,26 +4587,96 @@ class TemplateFeatureFinder(TemplateFinder, FeatureFinder):
                 (up, down),
                 (left, right),
             )
-
-            haystack_region = hgray[up:down, left:right]
-            haystack_region = haystack_region.copy()
-            hotmap_region = final_hotmap[up:down, left:right]
-            hotmap_region = hotmap_region.copy()
+            regions.append((up, down, left, right))
+
+        def verify(
+            verifier: "TemplateFeatureFinder", region: tuple[int, int, int, int]
+        ) -> "tuple[list[tuple[int, int]] | None, list[Any], list[float], list[Any]]":
+            up, down, left, right = region
+            # the haystack region is only read while the hotmap region is drawn on
+            hotmap_region = verifier.imglog.canvas(final_hotmap[up:down, left:right])
             # four smaller hotmaps for the feature matching stages (draw on same image here)
-            self.imglog.hotmaps.append(hotmap_region)
-            self.imglog.hotmaps.append(hotmap_region)
-            self.imglog.hotmaps.append(hotmap_region)
-            self.imglog.hotmaps.append(hotmap_region)
-
-            res = self._project_features(
-                frame_points, ngray, haystack_region, feature_similarity
+            verifier.imglog.hotmaps = [hotmap_region] * 4
+            verifier.imglog.similarities = []
+            verifier.imglog.locations = []
+            res = verifier._project_features(
+                frame_points,
+                ngray,
+                hgray[up:down, left:right],
+                feature_similarity,
+                needle.filename,
             )
-            # if the feature matching succeeded or is worse than satisfactory template matching
-            if res is not None or (
-                self.imglog.similarities[-1] > 0.0
-                and self.imglog.similarities[-1] < self.imglog.similarities[i]
-                and self.imglog.similarities[i] > feature_similarity
-            ):
+            # the logging lists are rebound for each candidate and thus safe to return
+            imglog = verifier.imglog
+            return res, imglog.hotmaps, imglog.similarities, imglog.locations
+
+        def accepted(i: int, result: Any) -> bool:
+            # the feature matching succeeded or is worse than satisfactory template matching
+            res, _, similarities, _ = result
+            template_similarity = template_maxima[i].similarity
+            return res is not None or (
+                similarities[-1] > 0.0
+                and similarities[-1] < template_similarity
+                and template_similarity > feature_similarity
+            )
+
+        # verify candidates concurrently in order of template similarity where
+        # each verifier (and its image logging state) is used by one thread at a time
+        max_matches = self.params["tempfeat"]["maxMatches"].value
+        workers = min(self.params["tempfeat"]["workers"].value, len(regions))
+        verifiers = queue.Queue()
+        for verifier in self._get_verifiers(workers):
+            verifiers.put(verifier)
+
+        verified = [False] * len(regions)
+        verified_lock = threading.Lock()
+
+        def verify_next(i: int) -> Any:
+            # candidates are skipped once enough better ones are verified
+            with verified_lock:
+                if max_matches > 0 and sum(verified[:i]) >= max_matches:
+                    return None
+            verifier = verifiers.get()
+            try:
+                result = verify(verifier, regions[i])
+            finally:
+                verifiers.put(verifier)
+            if accepted(i, result):
+                with verified_lock:
+                    verified[i] = True
+            return result
+
+        results = []
+        if workers > 0:
+            with concurrent.futures.ThreadPoolExecutor(workers) as executor:
+                results = list(executor.map(verify_next, range(len(regions))))
+        # only the first candidates up to enough verified ones are considered
+        # regardless of which further candidates were verified concurrently
+        candidate_num = len(results)
+        if max_matches > 0:
+            for i in range(len(results)):
+                if sum(verified[:i]) >= max_matches:
+                    log.debug(
+                        "Verified %i matches, skipped %i candidates",
+                        max_matches,
+                        len(results) - i,
+                    )
+                    candidate_num = i
+                    break
+        # image logging of the skipped candidates is dropped as well
+        del self.imglog.hotmaps[candidate_num : len(results)]
+        del self.imglog.similarities[candidate_num : len(results)]
+        del self.imglog.locations[candidate_num : len(results)]
+
+        feature_maxima = []
+        is_feature_poor = False
+        for i, result in enumerate(results[:candidate_num]):
+            res, hotmaps, similarities, locations = result
+            up, down, left, right = regions[i]
+            self.imglog.hotmaps.extend(hotmaps)
+            self.imglog.similarities.extend(similarities)
+            self.imglog.locations.extend(locations)
+            if accepted(i, result):
                 # take the template matching location rather than the feature one
                 # for stability (they should ultimately be the same)
                 log.debug(
@@ -3732,8 +4694,9 @@ class TemplateFeatureFinder(TemplateFinder, FeatureFinder):
                         self.imglog.locations[-1],
                     ]
                 )
-                # stitch back for a better final image logging
-                final_hotmap[up:down, left:right] = hotmap_region
+                if log_hotmaps:
+                    # stitch back for a better final image logging
+                    final_hotmap[up:down, left:right] = self.imglog.hotmaps[-1]
 
             # if similarity is not zero but we have no result, we failed the comparison
             elif self.imglog.similarities[-1] == 0.0:
@@ -3748,7 +4711,9 @@ class TemplateFeatureFinder(TemplateFinder, FeatureFinder):
             # NOTE: the needle can only be feature poor if there is at lease one
             # template matching
             feature_maxima = []
-            for i, _ in enumerate(template_maxima):
+            for i in range(candidate_num):
+                if max_matches > 0 and len(feature_maxima) >= max_matches:
+                    break
                 # test the template match also against the actual required similarity
                 if self.imglog.similarities[i] >= feature_similarity:
                     feature_maxima.append(
@@ -3770,12 +4735,8 @@ class TemplateFeatureFinder(TemplateFinder, FeatureFinder):
                 # NOTE: handle cases when the matching failed at the feature stage, i.e. dump
                 # a hotmap for debugging also in this case
                 self.imglog.hotmaps.append(final_hotmap)
-                self.imglog.similarities.append(
-                    self.imglog.similarities[len(template_maxima)]
-                )
-                self.imglog.locations.append(
-                    self.imglog.locations[len(template_maxima)]
-                )
+                self.imglog.similarities.append(self.imglog.similarities[candidate_num])
+                self.imglog.locations.append(self.imglog.locations[candidate_num])
             elif len(self.imglog.similarities) == 1:
                 # NOTE: we are only interested in the template hotmap on template failure
                 self.imglog.hotmaps.append(self.imglog.hotmaps[0])
@@ -3783,7 +4744,7 @@ class TemplateFeatureFinder(TemplateFinder, FeatureFinder):
             return []
 
         matches = []
-        from .match import Match
+        from .match import MatchRecord
 
         maxima = sorted(feature_maxima, key=lambda x: x[1], reverse=True)
         for maximum in maxima:
@@ -3791,21 +4752,22 @@ class TemplateFeatureFinder(TemplateFinder, FeatureFinder):
             x, y = maximum[2]
             w, h = needle.width, needle.height
             dx, dy = needle.center_offset.x, needle.center_offset.y
-            cv2.rectangle(
-                final_hotmap,
-                (x, y),
-                (x + needle.width, y + needle.height),
-                (0, 0, 0),
-                2,
-            )
-            cv2.rectangle(
-                final_hotmap,
-                (x, y),
-                (x + needle.width, y + needle.height),
-                (0, 0, 255),
-                1,
-            )
-            matches.append(Match(x, y, w, h, dx, dy, similarity))
+            if log_hotmaps:
+                cv2.rectangle(
+                    final_hotmap,
+                    (x, y),
+                    (x + needle.width, y + needle.height),
+                    (0, 0, 0),
+                    2,
+                )
+                cv2.rectangle(
+                    final_hotmap,
+                    (x, y),
+                    (x + needle.width, y + needle.height),
+                    (0, 0, 255),
+                    1,
+                )
+            matches.append(MatchRecord(x, y, w, h, dx, dy, similarity))
         self.imglog.hotmaps.append(final_hotmap)
         # log one best match for final hotmap filename
         best_acceptable = maxima[0]
@@ -3815,6 +4777,29 @@ class TemplateFeatureFinder(TemplateFinder, FeatureFinder):
         self.imglog.log(30)
         return matches
 
+    def _get_verifiers(self, count: int) -> "list[TemplateFeatureFinder]":
+        """
+        Obtain finders for the concurrent feature verification of candidates.
+
+        :param count: number of verifiers to obtain
+        :returns: verifiers sharing the configuration of this finder
+
+        The verifiers have their own feature backend objects and image logger
+        so that they can be used from different threads at the same time. They
+        are kept for reuse and only synchronize on configuration changes.
+        """
+        while len(self._verifiers) < count:
+            verifier = copy.copy(self)
+            verifier._verifiers = []
+            verifier._synced_versions = {}
+            verifier.detector = verifier.extractor = verifier.matcher = None
+            self._verifiers.append(verifier)
+        verifiers = self._verifiers[:count]
+        for verifier in verifiers:
+            verifier.params = self.params
+            verifier.imglog = ImageLogger()
+        return verifiers
+
     def log(self, lvl: int) -> None:
         """
         Log images with an arbitrary logging level.
@@ -4032,7 +5017,7 @@ class DeepFinder(Finder):
         """
         self.__synchronize_backend(backend, category, reset)
 
-    def find(self, needle: "Pattern", haystack: "Image") -> "list[Match]":
+    def find(self, needle: "Pattern", haystack: "Image") -> "list[MatchRecord]":
         """
         Find all needle targets in a haystack image.
 
@@ -4048,9 +5033,10 @@ class DeepFinder(Finder):
         self.imglog.haystack = haystack
         self.imglog.dump_matched_images()
         # prepare a canvas solely for image logging
-        full_hotmap = haystack.pil_image.copy()
-        filtered_hotmap = haystack.pil_image.copy()
-        final_hotmap = haystack.pil_image.copy()
+        log_hotmaps = self.imglog.is_enabled(30)
+        full_hotmap = self.imglog.canvas(haystack.pil_image)
+        filtered_hotmap = self.imglog.canvas(haystack.pil_image)
+        final_hotmap = self.imglog.canvas(haystack.pil_image)
         needle_class = needle.id
         similarity = self.params["find"]["similarity"].value
         backend = self.params["deep"]["backend"]
@@ -4091,7 +5077,7 @@ class DeepFinder(Finder):
             pred = self.net([img])
 
         matches = []
-        from .match import Match
+        from .match import MatchRecord
 
         for i in range(len(pred[0]["labels"])):
             label = classes(pred[0]["labels"][i].cpu().item())
@@ -4101,9 +5087,10 @@ class DeepFinder(Finder):
 
             from PIL import ImageDraw
 
-            draw = ImageDraw.Draw(full_hotmap)
-            draw.rectangle(rect, outline=(255, 0, 0))
-            draw.text((rect[0], rect[1]), label, fill=(255, 0, 0, 0))
+            if log_hotmaps:
+                draw = ImageDraw.Draw(full_hotmap)
+                draw.rectangle(rect, outline=(255, 0, 0))
+                draw.text((rect[0], rect[1]), label, fill=(255, 0, 0, 0))
             if score < similarity:
                 logging.debug(
                     "Found %s has a low confidence score %s<%s, skipping",
@@ -4112,22 +5099,24 @@ class DeepFinder(Finder):
                     similarity,
                 )
                 continue
-            draw = ImageDraw.Draw(filtered_hotmap)
-            draw.rectangle(rect, outline=(0, 255, 0))
-            draw.text((rect[0], rect[1]), label, fill=(0, 255, 0, 0))
+            if log_hotmaps:
+                draw = ImageDraw.Draw(filtered_hotmap)
+                draw.rectangle(rect, outline=(0, 255, 0))
+                draw.text((rect[0], rect[1]), label, fill=(0, 255, 0, 0))
             if label != needle_class:
                 logging.debug("Found %s is not %s, skipping", label, needle_class)
                 continue
             logging.debug(
                 "Found %s with sufficient confidence %s at (%s, %s)", label, score, x, y
             )
-            draw = ImageDraw.Draw(final_hotmap)
-            draw.rectangle(rect, outline=(0, 0, 255))
+            if log_hotmaps:
+                draw = ImageDraw.Draw(final_hotmap)
+                draw.rectangle(rect, outline=(0, 0, 255))
 
             self.imglog.locations.append((x, y))
             self.imglog.similarities.append(score)
             dx, dy = needle.center_offset.x, needle.center_offset.y
-            matches.append(Match(*rect, dx, dy, score))
+            matches.append(MatchRecord(*rect, dx, dy, score))
 
         self.imglog.hotmaps.append(full_hotmap)
         self.imglog.hotmaps.append(filtered_hotmap)
@@ -4286,7 +5275,7 @@ class HybridFinder(Finder):
         """
         self.__synchronize_backend(backend, category, reset)
 
-    def find(self, needle: "Image", haystack: "Image") -> "list[Match]":
+    def find(self, needle: "Image", haystack: "Image") -> "list[MatchRecord]":
         """
         Find all needle targets in a haystack image.
 
@@ -153,6 +153,21 @@ class GuiBotProxy(GuiBot):
             proxified.append(self._proxify(match))
         return proxified
 
+    def find_any(self, *args: tuple[type, ...], **kwargs: dict[str, type]) -> list[str]:
+        """See :py:class:`guibot.guibot.GuiBot` and its inherited :py:class:`guibot.region.Region` for details."""
+        matches = super(GuiBotProxy, self).find_any(*args, **kwargs)
+        return [self._proxify(match) for match in matches]
+
+    def find_each(
+        self, *args: tuple[type, ...], **kwargs: dict[str, type]
+    ) -> list[list[str]]:
+        """See :py:class:`guibot.guibot.GuiBot` and its inherited :py:class:`guibot.region.Region` for details."""
+        matches = super(GuiBotProxy, self).find_each(*args, **kwargs)
+        return [
+            [self._proxify(match) for match in target_matches]
+            for target_matches in matches
+        ]
+
     def sample(self, *args: tuple[type, ...], **kwargs: dict[str, type]) -> str:
         """See :py:class:`guibot.guibot.GuiBot` and its inherited :py:class:`guibot.region.Region` for details."""
         return self._proxify(super(GuiBotProxy, self).sample(*args, **kwargs))
@@ -88,6 +88,18 @@ def find_all(*args: tuple[type, ...], **kwargs: dict[str, type]) -> list[Match]:
     return guibot.find_all(*args, **kwargs)
 
 
+def find_any(*args: tuple[type, ...], **kwargs: dict[str, type]) -> list[Match | None]:
+    """See :py:class:`guibot.guibot.GuiBot` and its inherited :py:class:`guibot.region.Region` for details."""
+    check_initialized()
+    return guibot.find_any(*args, **kwargs)
+
+
+def find_each(*args: tuple[type, ...], **kwargs: dict[str, type]) -> list[list[Match]]:
+    """See :py:class:`guibot.guibot.GuiBot` and its inherited :py:class:`guibot.region.Region` for details."""
+    check_initialized()
+    return guibot.find_each(*args, **kwargs)
+
+
 def sample(*args: tuple[type, ...], **kwargs: dict[str, type]) -> float:
     """See :py:class:`guibot.guibot.GuiBot` and its inherited :py:class:`guibot.region.Region` for details."""
     check_initialized()
@@ -26,13 +26,283 @@ INTERFACE
 """
 
 import os
+import copy
+import json
+import hashlib
 import shutil
+import atexit
+import logging
+import zlib
+import zipfile
+import threading
+import collections
+from typing import Any, Callable
+
 import PIL.Image
 import numpy
 
 from .config import GlobalConfig
 
 
+log = logging.getLogger("guibot.imagelogger")
+
+
+class ImageWriter(object):
+    """
+    Background writer for image logging dumps using a bounded queue.
+
+    The dumps are submitted as writing jobs and are encoded and written
+    by a separate thread in order to keep the image matching fast. Once the
+    queue is full, the backpressure policy decides whether to wait for a free
+    slot (`block`), discard the oldest queued dump (`drop_oldest`), or discard
+    the newly submitted dump (`drop_newest`).
+    """
+
+    def __init__(self, maxsize: int = 100, policy: str = "block") -> None:
+        """
+        Build and start an image writer.
+
+        :param maxsize: maximal number of queued dumps
+        :param policy: backpressure policy for a full queue
+        :raises: :py:class:`ValueError` if the policy is not supported
+        """
+        if policy not in ["block", "drop_oldest", "drop_newest"]:
+            raise ValueError("Unsupported image logging queue policy '%s'" % policy)
+        self.maxsize = maxsize
+        self.policy = policy
+
+        # counters for the submitted dumps
+        self.submitted = 0
+        self.written = 0
+        self.dropped = 0
+        self.failed = 0
+
+        self._jobs = collections.deque()
+        self._busy = False
+        self._closed = False
+        self._condition = threading.Condition()
+        self._thread = threading.Thread(
+            target=self._run, name="guibot-imagewriter", daemon=True
+        )
+        self._thread.start()
+        # queued dumps should not be lost at exit
+        atexit.register(self.close)
+
+    def get_queued(self) -> int:
+        """
+        Getter for readonly attribute.
+
+        :returns: number of dumps waiting to be written
+        """
+        return len(self._jobs)
+
+    queued = property(fget=get_queued)
+
+    def submit(self, job: Callable[[], None]) -> bool:
+        """
+        Queue a dump according to the backpressure policy.
+
+        :param job: function without arguments writing a single dump
+        :returns: whether the dump was queued
+        :raises: :py:class:`RuntimeError` if the writer was already closed
+        """
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Cannot submit dumps to a closed image writer")
+            if len(self._jobs) >= self.maxsize:
+                if self.policy == "drop_newest":
+                    self.dropped += 1
+                    return False
+                elif self.policy == "drop_oldest":
+                    self._jobs.popleft()
+                    self.dropped += 1
+                else:
+                    self._condition.wait_for(lambda: len(self._jobs) < self.maxsize)
+            self._jobs.append(job)
+            self.submitted += 1
+            self._condition.notify_all()
+        return True
+
+    def flush(self, timeout: float = None) -> bool:
+        """
+        Wait for all queued dumps to be written.
+
+        :param timeout: maximal time to wait or no limit if unset
+        :returns: whether all queued dumps were written within the timeout
+        """
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: len(self._jobs) == 0 and not self._busy, timeout
+            )
+
+    def close(self, timeout: float = None) -> None:
+        """
+        Write all queued dumps and stop the writer.
+
+        :param timeout: maximal time to wait or no limit if unset
+        """
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._thread.join(timeout)
+        atexit.unregister(self.close)
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: len(self._jobs) > 0 or self._closed)
+                if len(self._jobs) == 0:
+                    return
+                job = self._jobs.popleft()
+                self._busy = True
+                self._condition.notify_all()
+            try:
+                job()
+                success = True
+            except Exception as error:
+                log.error("Could not write image logging dump: %s", error)
+                success = False
+            with self._condition:
+                if success:
+                    self.written += 1
+                else:
+                    self.failed += 1
+                self._busy = False
+                self._condition.notify_all()
+
+
+def _nbytes(image: "PIL.Image.Image | numpy.typing.NDArray[Any] | None") -> int:
+    if isinstance(image, numpy.ndarray):
+        return image.nbytes
+    elif isinstance(image, PIL.Image.Image):
+        return image.width * image.height * len(image.getbands())
+    return 0
+
+
+class ImageRing(object):
+    """
+    In-memory ring buffer for the image logging dumps of the last few steps.
+
+    The dumps are kept as writing jobs grouped by logging step and the
+    oldest steps are discarded once more steps or more memory than allowed
+    are used. Only the most recent step is kept regardless of its size.
+    """
+
+    def __init__(self, steps: int = 10, memory: int = 256) -> None:
+        """
+        Build an image ring buffer.
+
+        :param steps: maximal number of logging steps to keep
+        :param memory: maximal memory for the buffered images in megabytes
+        """
+        self.steps = steps
+        self.memory = memory
+
+        self._dumps = collections.OrderedDict()
+        self._nbytes = 0
+        self._lock = threading.Lock()
+
+    def get_nbytes(self) -> int:
+        """
+        Getter for readonly attribute.
+
+        :returns: estimated memory used by the buffered images in bytes
+        """
+        return self._nbytes
+
+    nbytes = property(fget=get_nbytes)
+
+    def append(self, step: int, job: Callable[[], None], nbytes: int = 0) -> None:
+        """
+        Buffer a dump from a given logging step.
+
+        :param step: logging step the dump belongs to
+        :param job: function without arguments writing the dump
+        :param nbytes: estimated memory used by the dump in bytes
+        """
+        with self._lock:
+            if step not in self._dumps:
+                self._dumps[step] = []
+            self._dumps[step].append((job, nbytes))
+            self._nbytes += nbytes
+            while len(self._dumps) > 1 and (
+                len(self._dumps) > self.steps
+                or self._nbytes > self.memory * 1024 * 1024
+            ):
+                _, dumps = self._dumps.popitem(last=False)
+                self._nbytes -= sum(nbytes for _, nbytes in dumps)
+
+    def pop_all(self) -> list[Callable[[], None]]:
+        """
+        Remove all buffered dumps.
+
+        :returns: writing jobs of all buffered dumps in order of submission
+        """
+        with self._lock:
+            jobs = [job for dumps in self._dumps.values() for job, _ in dumps]
+            self._dumps.clear()
+            self._nbytes = 0
+        return jobs
+
+
+#: file extension of the dumps for each image logging format
+_EXTENSIONS = {
+    "png": ".png",
+    "png-fast": ".png",
+    "webp": ".webp",
+    "npy": ".npy",
+    "npz": ".npz",
+}
+_archive_lock = threading.Lock()
+
+
+def _save_dump(
+    image: "PIL.Image.Image | numpy.typing.NDArray[Any]",
+    path: str,
+    file_format: str,
+    quality: int,
+) -> None:
+    if file_format in ["npy", "npz"]:
+        array: "numpy.typing.NDArray[Any]" = (
+            image if isinstance(image, numpy.ndarray) else numpy.asarray(image)
+        )
+        if file_format == "npy":
+            with open(path, "wb") as f:
+                numpy.lib.format.write_array(f, array)
+            return
+        # all dumps are batched as separate members of the same archive
+        archive, name = os.path.split(path)
+        archive = os.path.join(archive, "imglog.npz")
+        name = os.path.splitext(name)[0] + ".npy"
+        with _archive_lock, zipfile.ZipFile(archive, "a") as zf:
+            with zf.open(name, "w", force_zip64=True) as f:
+                numpy.lib.format.write_array(f, array)
+        return
+
+    if isinstance(image, PIL.Image.Image):
+        pil_image = image
+    else:
+        # numpy or other array
+        pil_image = PIL.Image.fromarray(image)
+        # NOTE: some modes cannot be saved unless converted to RGB
+        if pil_image.mode != "RGB":
+            pil_image = pil_image.convert("RGB")
+    if file_format == "webp":
+        pil_image.save(path, "WEBP", lossless=True, method=0)
+    elif file_format == "png-fast":
+        # run-length encoding suits the large flat areas of screenshots
+        pil_image.save(path, compress_level=1, compress_type=zlib.Z_RLE)
+    else:
+        pil_image.save(path, compress_level=quality)
+
+
+def _dump_path(path: str, file_format: str) -> str:
+    root, extension = os.path.splitext(path)
+    if extension == ".png":
+        path = root
+    return path + _EXTENSIONS[file_format]
+
+
 class ImageLogger(object):
     """
     Logger for the image matching process with the help of images.
@@ -59,6 +329,13 @@ class ImageLogger(object):
     logging_destination: str = GlobalConfig.image_logging_destination
     #: number of digits for the counter of logged steps
     step_width: int = GlobalConfig.image_logging_step_width
+    #: background writer for the dumps (dumps are written synchronously if unset)
+    writer: ImageWriter | None = None
+    #: in-memory buffer for the dumps (dumps are written at once if unset)
+    ring: ImageRing | None = None
+    #: whether old dumps are to be removed before writing the buffered ones
+    _stale_destination = False
+    _index_lock = threading.Lock()
 
     def __init__(self) -> None:
         """Build an imagelogger object."""
@@ -76,6 +353,24 @@ class ImageLogger(object):
         # NOTE: the executing code decides when to clean this directory
         ImageLogger.logging_destination = GlobalConfig.image_logging_destination
         ImageLogger.step_width = GlobalConfig.image_logging_step_width
+        queue_size: int = GlobalConfig.image_logging_queue_size
+        queue_policy = GlobalConfig.image_logging_queue_policy
+        writer = ImageLogger.writer
+        if writer is not None and (
+            writer.maxsize != queue_size or writer.policy != queue_policy
+        ):
+            writer.close()
+            ImageLogger.writer = writer = None
+        if writer is None and queue_size > 0:
+            ImageLogger.writer = ImageWriter(queue_size, queue_policy)
+        ring_steps = GlobalConfig.image_logging_ring_steps
+        if ring_steps == 0:
+            ImageLogger.ring = None
+        else:
+            if ImageLogger.ring is None:
+                ImageLogger.ring = ImageRing()
+            ImageLogger.ring.steps = ring_steps
+            ImageLogger.ring.memory = GlobalConfig.image_logging_ring_memory
 
     def get_printable_step(self) -> str:
         """
@@ -98,6 +393,33 @@ class ImageLogger(object):
             "has to implement this itself"
         )
 
+    def is_enabled(self, lvl: int) -> bool:
+        """
+        Check whether images logged with a given logging level are written.
+
+        :param lvl: logging level for the images
+        :returns: whether images with this level are logged
+        """
+        return lvl >= ImageLogger.logging_level
+
+    def canvas(
+        self, image: "PIL.Image.Image | Matlike", lvl: int = 30
+    ) -> "PIL.Image.Image | Matlike":
+        """
+        Obtain a canvas for a hotmap based on an image.
+
+        :param image: image to use as a background for the hotmap
+        :param lvl: logging level of anything drawn on the canvas
+        :returns: copy of the image if drawing on it would be logged or
+                  else only a reference to the image that must not be drawn on
+
+        The image is not copied unless needed in order to avoid allocating
+        full-sized hotmaps that are never going to be written.
+        """
+        if self.is_enabled(lvl):
+            return image.copy()
+        return image
+
     def debug(self) -> None:
         """Log images with a DEBUG logging level."""
         self.log(10)
@@ -149,27 +471,59 @@ class ImageLogger(object):
 
         The current needle and haystack (matched images) are stored
         as `needle` and `haystack` attributes.
+
+        If deduplication is enabled, identical images are stored only once
+        and the per-step files are referenced in an index file instead. The
+        own match settings of a target are always written next to its dump.
         """
         if ImageLogger.logging_level > 30:
             return
-        if not os.path.exists(ImageLogger.logging_destination):
-            os.mkdir(ImageLogger.logging_destination)
+        # buffered dumps only need a destination once they are written
+        if ImageLogger.ring is None:
+            if not os.path.exists(ImageLogger.logging_destination):
+                os.mkdir(ImageLogger.logging_destination)
+            elif ImageLogger.step == 1:
+                ImageLogger.flush()
+                shutil.rmtree(ImageLogger.logging_destination)
+                os.mkdir(ImageLogger.logging_destination)
         elif ImageLogger.step == 1:
-            shutil.rmtree(ImageLogger.logging_destination)
-            os.mkdir(ImageLogger.logging_destination)
+            ImageLogger._stale_destination = True
 
         needle_name = "imglog%s-1needle-%s" % (self.printable_step, str(self.needle))
         needle_path = os.path.join(ImageLogger.logging_destination, needle_name)
-        self.needle.save(needle_path)
-
         haystack_name = "imglog%s-2haystack-%s" % (
             self.printable_step,
             str(self.haystack),
         )
         haystack_path = os.path.join(ImageLogger.logging_destination, haystack_name)
-        self.haystack.save(haystack_path)
-
-    def dump_hotmap(self, name: str, hotmap: PIL.Image.Image | numpy.ndarray) -> None:
+        buffered = ImageLogger.writer is not None or ImageLogger.ring is not None
+        for target, name, path in [
+            (self.needle, needle_name, needle_path),
+            (self.haystack, haystack_name, haystack_path),
+        ]:
+            pil_image = getattr(target, "pil_image", None)
+            if not isinstance(pil_image, PIL.Image.Image):
+                # other targets are saved together with their own data files
+                if buffered and target.use_own_settings:
+                    self._write(self._settings_job(target.match_settings, path), 0)
+                    target = copy.copy(target)
+                    target.use_own_settings = False
+                elif buffered:
+                    target = copy.copy(target)
+                self._write(lambda t=target, p=path: t.save(p), 0)
+                continue
+            if target.use_own_settings:
+                self._write(self._settings_job(target.match_settings, path), 0)
+            if GlobalConfig.image_logging_dedup is True:
+                self._write(self._dedup_job(pil_image, name), _nbytes(pil_image))
+            else:
+                if os.path.splitext(path)[-1] != ".png":
+                    path += ".png"
+                self._write(self._format_job(pil_image, path), _nbytes(pil_image))
+
+    def dump_hotmap(
+        self, name: str, hotmap: "PIL.Image.Image | numpy.typing.NDArray[Any]"
+    ) -> None:
         """
         Write a file the given hotmap.
 
@@ -178,19 +532,193 @@ class ImageLogger(object):
         """
         if ImageLogger.logging_level > 30:
             return
-        if not os.path.exists(ImageLogger.logging_destination):
+        if ImageLogger.ring is None and not os.path.exists(
+            ImageLogger.logging_destination
+        ):
             os.mkdir(ImageLogger.logging_destination)
         path = os.path.join(ImageLogger.logging_destination, name)
 
-        if isinstance(hotmap, PIL.Image.Image):
-            pil_image = hotmap
+        if ImageLogger.writer is not None or ImageLogger.ring is not None:
+            # only read-only buffers are safe from further drawing before being written
+            if isinstance(hotmap, PIL.Image.Image):
+                hotmap = hotmap.copy()
+            elif not isinstance(hotmap, numpy.ndarray) or hotmap.flags.writeable:
+                hotmap = numpy.array(hotmap)
+        self._write(self._format_job(hotmap, path), _nbytes(hotmap))
+
+    def _format_job(
+        self, image: "PIL.Image.Image | numpy.typing.NDArray[Any]", path: str
+    ) -> Callable[[], None]:
+        file_format: str = GlobalConfig.image_logging_format
+        quality: int = GlobalConfig.image_quality
+        # the default format keeps the dump names exactly as they were given
+        if file_format != "png":
+            path = _dump_path(path, file_format)
+        return lambda: _save_dump(image, path, file_format, quality)
+
+    def _settings_job(self, finder: "Finder", path: str) -> Callable[[], None]:
+        # the settings could change before being written so they are rendered here
+        settings = finder.to_match_string(finder)
+        path = os.path.splitext(path)[0] + ".match"
+
+        def store() -> None:
+            with open(path, "w") as f:
+                f.write(settings)
+
+        return store
+
+    def _dedup_job(self, image: PIL.Image.Image, name: str) -> Callable[[], None]:
+        destination = ImageLogger.logging_destination
+        step = ImageLogger.step
+        # objects are restored as separate files so they cannot be archived
+        file_format: str = GlobalConfig.image_logging_format
+        file_format = "npy" if file_format == "npz" else file_format
+        name = _dump_path(name, file_format)
+        extension = _EXTENSIONS[file_format]
+        quality: int = GlobalConfig.image_quality
+
+        def store() -> None:
+            # hashing is done by the writer to keep it out of the matching
+            digest = hashlib.blake2b(image.tobytes(), digest_size=16)
+            digest.update(("%s%s" % (image.mode, image.size)).encode())
+            object_name = digest.hexdigest() + extension
+            objects_dir = os.path.join(destination, "objects")
+            object_path = os.path.join(objects_dir, object_name)
+            if not os.path.exists(object_path):
+                os.makedirs(objects_dir, exist_ok=True)
+                _save_dump(image, object_path, file_format, quality)
+            record = {"step": step, "name": name, "object": object_name}
+            with ImageLogger._index_lock:
+                with open(os.path.join(destination, "index.jsonl"), "a") as f:
+                    f.write(json.dumps(record) + "\n")
+
+        return store
+
+    def _write(self, job: Callable[[], None], nbytes: int) -> None:
+        if ImageLogger.ring is not None:
+            ImageLogger.ring.append(ImageLogger.step, job, nbytes)
+        elif ImageLogger.writer is not None:
+            ImageLogger.writer.submit(job)
         else:
-            # numpy or other array
-            pil_image = PIL.Image.fromarray(hotmap)
-            # NOTE: some modes cannot be saved unless converted to RGB
-            if pil_image.mode != "RGB":
-                pil_image = pil_image.convert("RGB")
-        pil_image.save(path, compress_level=GlobalConfig.image_quality)
+            job()
+
+    @staticmethod
+    def dump_buffered() -> None:
+        """Write all dumps buffered in memory to the logging destination."""
+        if ImageLogger.ring is None:
+            return
+        jobs = ImageLogger.ring.pop_all()
+        log.info("Writing %s buffered image logging dumps", len(jobs))
+        if len(jobs) == 0:
+            return
+        if not os.path.exists(ImageLogger.logging_destination):
+            os.mkdir(ImageLogger.logging_destination)
+        elif ImageLogger._stale_destination:
+            # dumps from previous runs are only cleaned once there are new ones
+            ImageLogger.flush()
+            shutil.rmtree(ImageLogger.logging_destination)
+            os.mkdir(ImageLogger.logging_destination)
+        ImageLogger._stale_destination = False
+        for job in jobs:
+            if ImageLogger.writer is not None:
+                ImageLogger.writer.submit(job)
+            else:
+                job()
+
+    @staticmethod
+    def dump_failure(haystack: "Image", needle: "Target") -> None:
+        """
+        Write the image logging dumps relevant for a failed matching.
+
+        :param haystack: image that was searched for the needle
+        :param needle: target that was (not) found
+
+        All dumps buffered in memory are written if there are any or else
+        just the last haystack and needle if configured to save them on error.
+        """
+        if ImageLogger.ring is not None:
+            ImageLogger.dump_buffered()
+            return
+        if GlobalConfig.save_needle_on_error is not True:
+            return
+        if not os.path.exists(ImageLogger.logging_destination):
+            os.mkdir(ImageLogger.logging_destination)
+        dump_path = GlobalConfig.image_logging_destination
+        haystack.save(os.path.join(dump_path, "last_finderror_haystack.png"))
+        needle.save(os.path.join(dump_path, "last_finderror_needle.png"))
+
+    @staticmethod
+    def restore_dumps(destination: str = None) -> list[str]:
+        """
+        Restore the per-step files of deduplicated needle and haystack dumps.
+
+        :param destination: image logging directory or the configured one if unset
+        :returns: paths of all restored (or already present) per-step files
+
+        Each file is linked to its stored image where possible and copied
+        otherwise so that the image logs can be browsed step by step as usual.
+        """
+        ImageLogger.flush()
+        if destination is None:
+            destination = ImageLogger.logging_destination
+        index_path = os.path.join(destination, "index.jsonl")
+        if not os.path.exists(index_path):
+            return []
+        restored = []
+        with open(index_path) as f:
+            for line in f:
+                record = json.loads(line)
+                path = os.path.join(destination, record["name"])
+                if not os.path.exists(path):
+                    source = os.path.join(destination, "objects", record["object"])
+                    try:
+                        os.link(source, path)
+                    except OSError:
+                        shutil.copyfile(source, path)
+                restored.append(path)
+        return restored
+
+    @staticmethod
+    def load_dump(path: str, name: str = None) -> PIL.Image.Image:
+        """
+        Read an image logging dump written in any of the supported formats.
+
+        :param path: path to the dump or to the archive containing it
+        :param name: name of the dump within an archive (without extension)
+        :returns: image of the dump
+        """
+        extension = os.path.splitext(path)[-1]
+        if extension == ".npz":
+            with numpy.load(path) as archive:
+                return PIL.Image.fromarray(archive[name])
+        elif extension == ".npy":
+            return PIL.Image.fromarray(numpy.load(path))
+        image = PIL.Image.open(path)
+        image.load()
+        return image
+
+    @staticmethod
+    def flush(timeout: float = None) -> bool:
+        """
+        Wait for all dumps queued for background writing to be written.
+
+        :param timeout: maximal time to wait or no limit if unset
+        :returns: whether all queued dumps were written within the timeout
+        """
+        if ImageLogger.writer is None:
+            return True
+        return ImageLogger.writer.flush(timeout)
+
+    @staticmethod
+    def close(timeout: float = None) -> None:
+        """
+        Write all queued dumps and stop any background writing.
+
+        :param timeout: maximal time to wait or no limit if unset
+        """
+        if ImageLogger.writer is not None:
+            ImageLogger.writer.close(timeout)
+            ImageLogger.writer = None
 
     def clear(self) -> None:
         """Clear all accumulated logging including hotmaps, similarities, and locations."""
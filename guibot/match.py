@@ -31,6 +31,99 @@ from .controller import Controller
 from .finder import Finder
 
 
+class MatchRecord(object):
+    """
+    Lightweight record of a match as obtained by a finder.
+
+    It only contains the geometry and similarity of the match relative to
+    the searched haystack and does not require any display control or
+    computer vision backends. It can be promoted to a full match on demand.
+    """
+
+    __slots__ = ("x", "y", "width", "height", "dx", "dy", "similarity")
+
+    def __init__(
+        self,
+        xpos: int,
+        ypos: int,
+        width: int,
+        height: int,
+        dx: int = 0,
+        dy: int = 0,
+        similarity: float = 0.0,
+    ) -> None:
+        """
+        Build a match record.
+
+        :param xpos: x coordinate of the upleft vertex of the match region
+        :param ypos: y coordinate of the upleft vertex of the match region
+        :param width: x distance from upleft to downright vertex of the match region
+        :param height: y distance from upleft to downright vertex of the match region
+        :param dx: x offset from the center of the match region
+        :param dy: y offset from the center of the match region
+        :param similarity: attained similarity of the match region
+        """
+        self.x = xpos
+        self.y = ypos
+        self.width = width
+        self.height = height
+        self.dx = dx
+        self.dy = dy
+        self.similarity = similarity
+
+    def __repr__(self) -> str:
+        """Provide a compact representation of the match record."""
+        return "MatchRecord(%s, %s, %s, %s, %s, %s, %s)" % (
+            self.x,
+            self.y,
+            self.width,
+            self.height,
+            self.dx,
+            self.dy,
+            self.similarity,
+        )
+
+    def get_target(self) -> Location:
+        """
+        Getter for readonly attribute.
+
+        :returns: target location to click on if clicking on the match
+        """
+        xpos = self.x + int(self.width / 2) + self.dx
+        ypos = self.y + int(self.height / 2) + self.dy
+        return Location(xpos, ypos)
+
+    target = property(fget=get_target)
+
+    def promote(
+        self,
+        xoffset: int = 0,
+        yoffset: int = 0,
+        dc: Controller = None,
+        cv: "Finder" = None,
+    ) -> "Match":
+        """
+        Promote the record to a full match.
+
+        :param xoffset: x offset of the searched region to make the match absolute
+        :param yoffset: y offset of the searched region to make the match absolute
+        :param dc: DC backend used for any display control
+        :param cv: CV backend used for any target finding
+        :returns: full match object with the given backends
+        """
+        return Match(
+            self.x + xoffset,
+            self.y + yoffset,
+            self.width,
+            self.height,
+            self.dx,
+            self.dy,
+            self.similarity,
+            dc=dc,
+            cv=cv,
+        )
+
+
 class Match(Region):
     """Wrapper around region which adds data necessary for manipulation of matches on a screen."""
 
@@ -30,8 +30,9 @@ INTERFACE
 """
 
 import time
-import os
 import logging
+import concurrent.futures
+from typing import Any
 
 # interconnected classes - carefully avoid circular reference
 from .config import GlobalConfig
@@ -129,20 +130,35 @@ class Region(object):
         if self.dc_backend.width != 0 and self.dc_backend.height != 0:
             self._ensure_screen_clipping()
 
-        mouse_map = self.dc_backend.mousemap
-        for mouse_button in dir(mouse_map):
-            if mouse_button.endswith("_BUTTON"):
-                setattr(self, mouse_button, getattr(mouse_map, mouse_button))
+    def __getattr__(self, name: str) -> Any:
+        """
+        Provide key, modifier, and mouse button constants of the DC backend.
 
-        key_map = self.dc_backend.keymap
-        for key in dir(key_map):
-            if not key.startswith("__") and key != "to_string":
-                setattr(self, key, getattr(key_map, key))
+        :param name: name of the mouse button, modifier, or key constant
+        :returns: value of the constant in the respective input map
+        :raises: :py:class:`AttributeError` if no such constant is available
 
-        mod_map = self.dc_backend.modmap
-        for modifier_key in dir(mod_map):
-            if modifier_key.startswith("MOD_"):
-                setattr(self, modifier_key, getattr(mod_map, modifier_key))
+        The input maps are shared with the DC backend and looked up only on
+        access instead of being copied into the attributes of each region.
+        """
+        # private attributes and the backend itself are never delegated
+        # (e.g. during copying or before the region is fully initialized)
+        if name.startswith("_") or "dc_backend" not in self.__dict__:
+            raise AttributeError(name)
+        dc_backend = self.__dict__["dc_backend"]
+        if name.endswith("_BUTTON"):
+            input_map = dc_backend.mousemap
+        elif name.startswith("MOD_"):
+            input_map = dc_backend.modmap
+        elif name != "to_string":
+            input_map = dc_backend.keymap
+        else:
+            input_map = None
+        if input_map is None or not hasattr(input_map, name):
+            raise AttributeError(
+                "'%s' object has no attribute '%s'" % (type(self).__name__, name)
+            )
+        return getattr(input_map, name)
 
     def _ensure_screen_clipping(self) -> None:
         screen_width = self.dc_backend.width
@@ -448,6 +464,16 @@ class Region(object):
 
         This method is similar the one above but allows for more than one match.
         """
+        return self._find_all(target, timeout, allow_zero)
+
+    def _find_all(
+        self,
+        target: str | Target,
+        timeout: int,
+        allow_zero: bool,
+        dump_failure: bool = True,
+    ) -> "list[Match]":
+        # expected failures like internal retries don't write any failure dumps
         if isinstance(target, str):
             target = self._target_from_string(target)
         log.debug("Looking for targets %s", target)
@@ -456,32 +482,38 @@ class Region(object):
 
         # TODO: decide about updating the last_match attribute
         last_matches = []
+        relative_matches = []
         moving_targets = True
+        frame_id = None
+        screen_capture = None
         timeout_limit = time.time() + timeout
         while True:
-            screen_capture = dc_backend.capture_screen(self)
+            # rescanning a region without matches is pointless if it didn't change
+            if (
+                frame_id is None
+                or len(relative_matches) > 0
+                or dc_backend.region_changed(frame_id, self)
+            ):
+                frame_id = dc_backend.frame_id
+                last_capture = screen_capture if len(relative_matches) == 0 else None
+                screen_capture = dc_backend.capture_screen(self)
+                relative_matches = self._find_in_changes(
+                    target, cv_backend, screen_capture, last_capture
+                )
+            else:
+                log.log(9, "Region unchanged since frame %s, skipping rescan", frame_id)
 
-            relative_matches = cv_backend.find(target, screen_capture)
             if len(relative_matches) > 0:
-                from .match import Match
-
                 for i, match in enumerate(relative_matches):
-                    absolute_x, absolute_y = match.x + self.x, match.y + self.y
-                    new_match = Match(
-                        absolute_x,
-                        absolute_y,
-                        match.width,
-                        match.height,
-                        match.dx,
-                        match.dy,
-                        match.similarity,
-                        dc=dc_backend,
-                        cv=cv_backend,
+                    # finders return lightweight records that are promoted
+                    # to full matches with the backends of this region only here
+                    new_match = match.promote(
+                        self.x, self.y, dc=dc_backend, cv=cv_backend
                     )
                     if len(last_matches) > i:
                         if (
-                            last_matches[i].x == absolute_x
-                            and last_matches[i].y == absolute_y
+                            last_matches[i].x == new_match.x
+                            and last_matches[i].y == new_match.y
                         ):
                             moving_targets = False
                         last_matches[i] = new_match
@@ -497,24 +529,176 @@ class Region(object):
                 if allow_zero:
                     return last_matches
                 else:
-                    if GlobalConfig.save_needle_on_error is True:
-                        if not os.path.exists(ImageLogger.logging_destination):
-                            os.mkdir(ImageLogger.logging_destination)
-                        dump_path = GlobalConfig.image_logging_destination
-                        hdump_path = os.path.join(
-                            dump_path, "last_finderror_haystack.png"
-                        )
-                        ndump_path = os.path.join(
-                            dump_path, "last_finderror_needle.png"
-                        )
-                        screen_capture.save(hdump_path)
-                        target.save(ndump_path)
+                    if dump_failure:
+                        ImageLogger.dump_failure(screen_capture, target)
                     raise FindError(target)
 
             else:
                 # don't hog the CPU
                 time.sleep(GlobalConfig.rescan_speed_on_find)
 
+    def find_any(
+        self, targets: list[str | Target], timeout: int = 10
+    ) -> "list[Match | None]":
+        """
+        Find any of multiple targets on the screen.
+
+        :param targets: targets to look for
+        :param timeout: timeout before giving up
+        :returns: first match for each of the targets or nothing for the
+                  targets that were not found
+        :raises: :py:class:`errors.FindError` if none of the targets is found
+
+        This method is useful to wait for one of multiple alternatives like
+        a confirmation or an error dialog, e.g.::
+
+            ok, error = region.find_any(["ok_dialog", "error_dialog"])
+
+        Targets with different finders are matched in parallel but only if
+        the image logging level is above 30 (no image logs are dumped) since
+        the finders share the image logging step and state, otherwise they
+        are matched one after the other.
+        """
+        matches = self._find_multiple(targets, timeout, False, False)
+        return [
+            target_matches[0] if target_matches else None for target_matches in matches
+        ]
+
+    def find_each(
+        self, targets: list[str | Target], timeout: int = 10, allow_zero: bool = False
+    ) -> "list[list[Match]]":
+        """
+        Find multiples of each of multiple targets on the screen.
+
+        :param targets: targets to look for
+        :param timeout: timeout before giving up
+        :param allow_zero: whether to allow zero matches for some targets or raise error
+        :returns: matches obtained for each of the targets
+        :raises: :py:class:`errors.FindError` if some of the targets is not found
+                 and zero matches are not allowed
+
+        Targets are matched in parallel only under the same image logging
+        conditions as in :py:meth:`find_any`.
+        """
+        return self._find_multiple(targets, timeout, True, allow_zero)
+
+    def _find_multiple(
+        self,
+        targets: list[str | Target],
+        timeout: int,
+        require_all: bool,
+        allow_zero: bool,
+    ) -> "list[list[Match]]":
+        if len(targets) == 0:
+            return []
+        targets = [
+            self._target_from_string(target) if isinstance(target, str) else target
+            for target in targets
+        ]
+        log.debug("Looking for targets %s", targets)
+        cv_backends = [self._determine_cv_backend(target) for target in targets]
+        dc_backend = self.dc_backend
+
+        # all targets are matched against the same capture at each rescan but
+        # targets sharing a finder also share its state and are matched serially
+        groups = {}
+        for i, cv_backend in enumerate(cv_backends):
+            groups.setdefault(id(cv_backend), []).append(i)
+        # finders dump their image logs using the shared logging step and state
+        # so they are matched concurrently only if no image logs are dumped
+        logging_level: int = GlobalConfig.image_logging_level
+        workers = len(groups) if logging_level > 30 else 1
+        relative_matches = [[] for _ in targets]
+        frame_id = None
+        screen_capture = None
+
+        def find_group(indices: list[int]) -> "list[tuple[int, list[MatchRecord]]]":
+            return [
+                (i, cv_backends[i].find(targets[i], screen_capture)) for i in indices
+            ]
+
+        timeout_limit = time.time() + timeout
+        with concurrent.futures.ThreadPoolExecutor(workers) as executor:
+            while True:
+                if frame_id is None or dc_backend.region_changed(frame_id, self):
+                    frame_id = dc_backend.frame_id
+                    screen_capture = dc_backend.capture_screen(self)
+                    for results in executor.map(find_group, groups.values()):
+                        for i, matches in results:
+                            relative_matches[i] = matches
+                else:
+                    log.log(
+                        9, "Region unchanged since frame %s, skipping rescan", frame_id
+                    )
+
+                found = [len(matches) > 0 for matches in relative_matches]
+                if all(found) if require_all else any(found):
+                    break
+                elif time.time() > timeout_limit:
+                    if allow_zero:
+                        break
+                    missing = targets[found.index(False)]
+                    ImageLogger.dump_failure(screen_capture, missing)
+                    if require_all:
+                        raise FindError(missing)
+                    log.info("None of the targets %s could be found", targets)
+                    raise FindError()
+                else:
+                    # don't hog the CPU
+                    time.sleep(GlobalConfig.rescan_speed_on_find)
+
+        last_matches = []
+        for target_matches, cv_backend in zip(relative_matches, cv_backends):
+            last_matches.append(
+                [
+                    match.promote(self.x, self.y, dc=dc_backend, cv=cv_backend)
+                    for match in target_matches
+                ]
+            )
+            if len(last_matches[-1]) > 0:
+                self._last_match = last_matches[-1][-1]
+        return last_matches
+
+    def _find_in_changes(
+        self,
+        target: Target,
+        cv_backend: Finder,
+        capture: Image,
+        last_capture: Image | None,
+    ) -> "list[MatchRecord]":
+        # a full rescan is needed without a comparable capture lacking matches
+        if last_capture is None or (
+            last_capture.pil_image.size != capture.pil_image.size
+        ):
+            return cv_backend.find(target, capture)
+        import numpy
+
+        capture = Frame.from_image(capture)
+        last_capture = Frame.from_image(last_capture)
+        changed = numpy.any(capture.rgb != last_capture.rgb, axis=-1)
+        changed_rows = numpy.flatnonzero(changed.any(axis=1))
+        if len(changed_rows) == 0:
+            log.log(9, "Captured region is unchanged, skipping rescan")
+            return []
+        if not cv_backend.local_matching or not isinstance(target, Image):
+            return cv_backend.find(target, capture)
+
+        # any new match has to overlap with the bounding box of all changes
+        changed_cols = numpy.flatnonzero(changed.any(axis=0))
+        left = max(0, int(changed_cols[0]) - target.width + 1)
+        top = max(0, int(changed_rows[0]) - target.height + 1)
+        right = min(capture.width, int(changed_cols[-1]) + target.width)
+        bottom = min(capture.height, int(changed_rows[-1]) + target.height)
+        if right - left == capture.width and bottom - top == capture.height:
+            return cv_backend.find(target, capture)
+        log.log(9, "Rescanning only the changed area %s", (left, top, right, bottom))
+        changed_capture = Frame("", capture.pil_image.crop((left, top, right, bottom)))
+        matches = cv_backend.find(target, changed_capture)
+        for match in matches:
+            match.x += left
+            match.y += top
+        return matches
+
     def _target_from_string(self, target_str: str) -> Target:
         # handle some specific target types
         try:
@@ -581,10 +765,11 @@ class Region(object):
                   or nothing if no match is found
         """
         log.info("Checking if %s is present", target)
-        try:
-            return self.find(target, timeout)
-        except FindError:
-            log.info("%s is not present", target)
+        # a missing target is not a failure here so nothing is dumped for it
+        matches = self.find_all(target, timeout, allow_zero=True)
+        if len(matches) > 0:
+            return matches[0]
+        log.info("%s is not present", target)
         return None
 
     def wait(self, target: str | Target, timeout: int = 30) -> "Match":
@@ -622,6 +807,7 @@ class Region(object):
             time.sleep(GlobalConfig.rescan_speed_on_find)
 
         # target is still there
+        ImageLogger.dump_buffered()
         raise NotFindError(target)
 
     def wait_vanish(self, target: str | Target, timeout: int = 30) -> "Region":
@@ -809,7 +995,10 @@ class Region(object):
                 log.info("Retrying the mouse click (%s of %s)", i + 1, retries)
             self.click(click_image_or_location, modifiers=modifiers)
             try:
-                return self.find(expect_target, timeout)
+                matches = self._find_all(
+                    expect_target, timeout, False, i == retries - 1
+                )
+                return matches[0]
             except FindError as error:
                 self.hover(Location(0, 0))
                 if i == retries - 1:
@@ -1131,7 +1320,10 @@ class Region(object):
                 log.info("Retrying the key press (%s of %s)", i + 1, retries)
             self.press_keys(keys)
             try:
-                return self.find(expect_target, timeout)
+                matches = self._find_all(
+                    expect_target, timeout, False, i == retries - 1
+                )
+                return matches[0]
             except FindError as error:
                 if i == retries - 1:
                     raise error
@@ -26,10 +26,11 @@ INTERFACE
 """
 
 import copy
+import hashlib
 import os
 import re
 import PIL.Image
-from typing import Iterator
+from typing import Any, Callable, Iterator
 
 from .config import GlobalConfig
 from .location import Location
@@ -38,7 +39,7 @@ from .finder import *
 from .errors import *
 
 
-__all__ = ["Target", "Image", "Text", "Pattern", "Chain"]
+__all__ = ["Target", "Image", "Frame", "Text", "Pattern", "Chain"]
 
 
 class Target(object):
@@ -363,6 +364,120 @@ class Image(Target):
         return new_image
 
 
+class Frame(Image):
+    """
+    Haystack image caching any of its derived views for all finders.
+
+    Views like the numpy RGB, grayscale, pyramid levels, or binarized
+    versions of the image are computed on first use and then shared by
+    all finders and targets using the same frame so they are read-only.
+    """
+
+    def __init__(
+        self,
+        image_filename: str = "",
+        pil_image: PIL.Image.Image = None,
+        match_settings: "Finder" = None,
+        use_cache: bool = True,
+    ) -> None:
+        """
+        Build a frame object.
+
+        See base method for details.
+        """
+        super(Frame, self).__init__(
+            image_filename, pil_image, match_settings, use_cache
+        )
+        self._views: dict[Any, Any] = {}
+
+    @staticmethod
+    def from_image(image: Image) -> "Frame":
+        """
+        Obtain a frame from an image without copying its image data.
+
+        :param image: image to obtain a frame for
+        :returns: the image itself if already a frame or a new frame sharing its data
+        """
+        if isinstance(image, Frame):
+            return image
+        frame = Frame("", image.pil_image)
+        frame._filename = image.filename
+        return frame
+
+    def view(self, key: Any, build: Callable[[], Any]) -> Any:
+        """
+        Get a derived view of the frame building it only on first use.
+
+        :param key: hashable identifier of the view and everything it depends on
+        :param build: function without arguments building the view
+        :returns: the cached view
+        """
+        if key not in self._views:
+            view = build()
+            # the view is shared by all users of the frame
+            if hasattr(view, "flags"):
+                view.flags.writeable = False
+            self._views[key] = view
+        return self._views[key]
+
+    def get_rgb(self) -> "Matlike":
+        """
+        Getter for readonly attribute.
+
+        :returns: RGB numpy array of the frame
+        """
+        import numpy
+
+        return self.view("rgb", lambda: numpy.array(self.pil_image))
+
+    rgb = property(fget=get_rgb)
+
+    def get_gray(self) -> "Matlike":
+        """
+        Getter for readonly attribute.
+
+        :returns: grayscale numpy array of the frame
+        """
+        import cv2
+
+        return self.view("gray", lambda: cv2.cvtColor(self.rgb, cv2.COLOR_RGB2GRAY))
+
+    gray = property(fget=get_gray)
+
+    def get_digest(self) -> str:
+        """
+        Getter for readonly attribute.
+
+        :returns: hash of the frame contents identifying equal frames
+        """
+
+        def build() -> str:
+            digest = hashlib.blake2b(self.rgb.tobytes(), digest_size=16)
+            digest.update(str(self.rgb.shape).encode())
+            return digest.hexdigest()
+
+        return self.view("digest", build)
+
+    digest = property(fget=get_digest)
+
+    def pyramid(self, level: int, gray: bool = True) -> "Matlike":
+        """
+        Get a level of the Gaussian image pyramid of the frame.
+
+        :param level: pyramid level where each level halves the previous one
+        :param gray: whether to use grayscale or RGB images
+        :returns: numpy array of the image at the given pyramid level
+        """
+        if level == 0:
+            return self.gray if gray else self.rgb
+        import cv2
+
+        return self.view(
+            ("pyramid", level, gray),
+            lambda: cv2.pyrDown(self.pyramid(level - 1, gray)),
+        )
+
+
 class Text(Target):
     """Container for text data which is visually identified using OCR or general text detection methods."""
 
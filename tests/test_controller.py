@@ -15,12 +15,16 @@
 # along with guibot.  If not, see <http://www.gnu.org/licenses/>.
 
 import os
+import sys
 import stat
 import time
 import shutil
 import unittest
 import subprocess
 from typing import Any
+from unittest.mock import MagicMock, patch
+
+import numpy
 
 import common_test
 from guibot.errors import *
@@ -105,6 +109,11 @@ class ControllerTest(unittest.TestCase):
             self.backends += [AutoPyController()]
         if os.environ.get('DISABLE_XDOTOOL', "0") == "0":
             self.backends += [XDoToolController()]
+            xdotool = XDoToolController(synchronize=False)
+            xdotool.params["xdotool"]["capture"] = "xlib"
+            xdotool.params["xdotool"]["input"] = "xtest"
+            xdotool.synchronize_backend()
+            self.backends += [xdotool]
         if os.environ.get('DISABLE_PYAUTOGUI', "0") == "0":
             self.backends += [PyAutoGUIController()]
         if os.environ.get('DISABLE_VNCDOTOOL', "0") == "0":
@@ -387,5 +396,152 @@ class ControllerTest(unittest.TestCase):
                 shutil.rmtree(self.logpath)
 
 
+class ControllerCaptureTest(unittest.TestCase):
+
+    class BufferController(Controller):
+
+        def __init__(self) -> None:
+            super().__init__()
+            self._width, self._height = 64, 48
+            self.buffer = numpy.zeros((48, 64, 3), dtype=numpy.uint8)
+            self.buffer[10:20, 30:40] = (255, 0, 0)
+
+        def capture_raw(self, *args: "list[int] | Region | None") -> numpy.ndarray:
+            xpos, ypos, width, height = self._region_from_args(*args)
+            return self.buffer[ypos:ypos + height, xpos:xpos + width]
+
+    def test_region_args(self) -> None:
+        """Check clipping of capture regions without any temporary files."""
+        display = self.BufferController()
+        self.assertEqual((0, 0, 64, 48), display._region_from_args())
+        self.assertEqual((5, 6, 7, 8), display._region_from_args(5, 6, 7, 8))
+        self.assertEqual((60, 40, 4, 8), display._region_from_args(60, 40, 80, 90))
+        self.assertEqual((63, 47, 1, 1), display._region_from_args(600, 400, 80, 90))
+
+    def test_capture_from_raw(self) -> None:
+        """Check that captured images are built from the raw in-memory buffers."""
+        display = self.BufferController()
+
+        captured = display.capture_screen()
+        self.assertEqual(64, captured.width)
+        self.assertEqual(48, captured.height)
+        self.assertEqual("RGB", captured.pil_image.mode)
+
+        captured = display.capture_screen(30, 10, 10, 10)
+        self.assertEqual(10, captured.width)
+        self.assertEqual(10, captured.height)
+        self.assertEqual((255, 0, 0), captured.pil_image.getpixel((5, 5)))
+
+    def test_capture_xlib(self) -> None:
+        """Check conversion of in-process X11 captures of a screen region."""
+        # the X server is mocked so python-xlib itself is not needed either
+        X = MagicMock(ZPixmap=2, LSBFirst=0, MSBFirst=1)
+        with patch.dict(sys.modules, {"Xlib": MagicMock(X=X), "Xlib.X": X}):
+            self._check_capture_xlib(X)
+
+    def _check_capture_xlib(self, X: Any) -> None:
+        display = XDoToolController(synchronize=False)
+        display.params["xdotool"]["capture"] = "xlib"
+        display._width, display._height = 64, 48
+        display._backend_obj = MagicMock()
+        display._backend_obj.xdisplay.info.pixmap_formats = [
+            MagicMock(depth=24, bits_per_pixel=32)
+        ]
+        display._backend_obj.xdisplay.info.image_byte_order = X.LSBFirst
+        # BGRX pixels as provided by little endian X servers
+        bgrx = numpy.zeros((10, 20, 4), dtype=numpy.uint8)
+        bgrx[:, :] = (30, 20, 10, 0)
+        display._backend_obj.xroot.get_image.return_value = MagicMock(
+            depth=24, data=bgrx.tobytes()
+        )
+
+        captured = display.capture_raw(5, 6, 20, 10)
+        display._backend_obj.xroot.get_image.assert_called_once_with(
+            5, 6, 20, 10, X.ZPixmap, 0xFFFFFFFF
+        )
+        self.assertEqual((10, 20, 3), captured.shape)
+        self.assertEqual([10, 20, 30], captured[0, 0].tolist())
+
+        display._backend_obj.xdisplay.info.image_byte_order = X.MSBFirst
+        xrgb = numpy.zeros((10, 20, 4), dtype=numpy.uint8)
+        xrgb[:, :] = (0, 10, 20, 30)
+        display._backend_obj.xroot.get_image.return_value.data = xrgb.tobytes()
+        captured = display.capture_raw(5, 6, 20, 10)
+        self.assertEqual([10, 20, 30], captured[0, 0].tolist())
+
+    def test_input_xtest(self) -> None:
+        """Check that input events are sent through a persistent XTest session."""
+        try:
+            from Xlib import X
+        except ImportError:
+            self.skipTest("Python Xlib is not available")
+        display = XDoToolController(synchronize=False)
+        display.params["xdotool"]["input"] = "xtest"
+        with patch("Xlib.display.Display") as display_mock, \
+                patch("Xlib.ext.xtest.fake_input") as fake_input, \
+                patch("subprocess.check_output") as check_output:
+            xdisplay = display_mock.return_value
+            xdisplay.screen.return_value.width_in_pixels = 640
+            xdisplay.screen.return_value.height_in_pixels = 480
+            xroot = xdisplay.screen.return_value.root
+            xroot.query_pointer.return_value = MagicMock(root_x=10, root_y=20)
+            display.synchronize_backend()
+            self.assertEqual(640, display.width)
+            self.assertEqual(480, display.height)
+            self.assertEqual((10, 20), display.mouse_location.coords)
+
+            display.mouse_down(display.mousemap.LEFT_BUTTON)
+            fake_input.assert_called_with(xdisplay, X.ButtonPress, 1)
+            display.mouse_up(display.mousemap.LEFT_BUTTON)
+            fake_input.assert_called_with(xdisplay, X.ButtonRelease, 1)
+
+            # keys available without modifiers are sent directly
+            xdisplay.keysym_to_keycode.return_value = 50
+            xdisplay.keycode_to_keysym.return_value = 0xffe1
+            display.keys_toggle([display.keymap.SHIFT], True)
+            fake_input.assert_called_with(xdisplay, X.KeyPress, 50)
+            # the rest are still handled by xdotool itself
+            xdisplay.keycode_to_keysym.return_value = 0x61
+            display.keys_toggle(["A"], True)
+            check_output.assert_called_once_with(["xdotool", "keydown", "A"],
+                                                 shell=False)
+
+    def test_incremental_framebuffer(self) -> None:
+        """Check VNC framebuffer patching and tracking of changed rectangles."""
+        import PIL.Image
+        display = VNCDoToolController(synchronize=False)
+        display.params["vncdotool"]["vnc_incremental"] = True
+        display._width, display._height = 64, 48
+        display._backend_obj = MagicMock()
+        client = display._backend_obj.protocol
+        client.screen = PIL.Image.new("RGB", (64, 48))
+        commit_update = client.commitUpdate
+
+        display._track_framebuffer()
+        display._backend_obj.framebufferUpdateRequest.assert_called_once_with(incremental=1)
+        start_id = display.frame_id
+        self.assertIsNotNone(start_id)
+        self.assertFalse(display.region_changed(start_id))
+
+        client.screen.paste((255, 0, 0), (30, 10, 40, 20))
+        client.commitUpdate([(30, 10, 10, 10), (60, 40, 16, 16)])
+        commit_update.assert_called_once_with([(30, 10, 10, 10), (60, 40, 16, 16)])
+        client.framebufferUpdateRequest.assert_called_once_with(incremental=1)
+        self.assertEqual(start_id + 1, display.frame_id)
+        # rectangles are clipped to the screen
+        self.assertEqual([(30, 10, 10, 10), (60, 40, 4, 8)],
+                         display.changed_regions(start_id))
+        self.assertEqual([], display.changed_regions(display.frame_id))
+        self.assertTrue(display.region_changed(start_id, 25, 5, 10, 10))
+        self.assertFalse(display.region_changed(start_id, 0, 0, 20, 20))
+        self.assertFalse(display.region_changed(display.frame_id, 25, 5, 10, 10))
+
+        captured = display.capture_screen(30, 10, 10, 10)
+        self.assertEqual((255, 0, 0), captured.pil_image.getpixel((5, 5)))
+        captured = display.capture_raw()
+        self.assertEqual((48, 64, 3), captured.shape)
+        self.assertEqual([0, 0, 0], captured[0, 0].tolist())
+
+
 if __name__ == '__main__':
     unittest.main()
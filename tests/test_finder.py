@@ -15,13 +15,16 @@
 # along with guibot.  If not, see <http://www.gnu.org/licenses/>.
 
 import os
+import copy
 import re
 import unittest
 import shutil
 import ssl
+from tempfile import mkdtemp
+from unittest.mock import MagicMock, patch
 
 import common_test
-from guibot.config import GlobalConfig
+from guibot.config import GlobalConfig, TemporaryConfig
 from guibot.fileresolver import FileResolver
 from guibot.imagelogger import ImageLogger
 from guibot.target import Image, Text, Pattern, Chain
@@ -286,6 +289,59 @@ class FinderTest(unittest.TestCase):
                 shutil.rmtree(self.logpath)
                 i += 1
 
+    @unittest.skipIf(os.environ.get('DISABLE_OPENCV', "0") == "1", "OpenCV disabled")
+    def test_contour_distances(self) -> None:
+        """Test that shape distances of all contour pairs agree with OpenCV."""
+        import cv2
+        import numpy
+        finder = ContourFinder()
+        finder.params["contour"]["minArea"].value = 100
+        haystack = finder._binarize_image(numpy.array(Image('all_shapes').pil_image))
+        needle = finder._binarize_image(numpy.array(Image('shape_blue_circle').pil_image))
+        hcontours = finder._extract_contours(haystack.copy())
+        ncontours = finder._extract_contours(needle.copy())
+
+        for method in (1, 2, 3):
+            finder.params["contour"]["contoursMatch"].value = method
+            distances = finder._shape_distances(hcontours, ncontours)
+            self.assertEqual(distances.shape, (len(hcontours), len(ncontours)))
+            for i, hcontour in enumerate(hcontours):
+                for j, ncontour in enumerate(ncontours):
+                    if (cv2.contourArea(hcontour) < 100 or
+                            cv2.contourArea(ncontour) < 100):
+                        self.assertEqual(distances[i, j], 1.0)
+                        continue
+                    expected = cv2.matchShapes(hcontour, ncontour, method, 0)
+                    self.assertAlmostEqual(distances[i, j], expected, places=6)
+
+    @unittest.skipIf(os.environ.get('DISABLE_OPENCV', "0") == "1", "OpenCV disabled")
+    def test_contour_assignment(self) -> None:
+        """Test the assignment of haystack to needle contours for multiple matches."""
+        import numpy
+
+        def square(x, y):
+            return numpy.array([[[x, y]], [[x + 10, y]], [[x + 10, y + 10]], [[x, y + 10]]],
+                               dtype=numpy.int32)
+        finder = ContourFinder()
+        needle_contours = [square(0, 0), square(20, 0)]
+        # two instances far apart with the better halves of each paired up
+        haystack_contours = [square(0, 0), square(20, 0), square(500, 0), square(520, 0)]
+        distances = numpy.array([[0.01, 0.5], [0.5, 0.5], [0.02, 0.5], [0.5, 0.02]])
+
+        assignments = finder._assign_contours(distances, haystack_contours,
+                                              needle_contours, 0.2)
+        self.assertEqual([rows for rows, _ in assignments], [[0, 3]])
+        self.assertAlmostEqual(assignments[0][1], 0.015)
+
+        finder.params["contour"]["groupExtent"].value = 2.0
+        assignments = finder._assign_contours(distances, haystack_contours,
+                                              needle_contours, 0.2)
+        self.assertEqual([rows for rows, _ in assignments], [[2, 3]])
+        # contours of a failed group remain available for later groups
+        assignments = finder._assign_contours(distances, haystack_contours,
+                                              needle_contours, 1.0)
+        self.assertEqual([rows for rows, _ in assignments], [[0, 1], [2, 3]])
+
     @unittest.skipIf(os.environ.get('DISABLE_OPENCV', "0") == "1", "OpenCV disabled")
     def test_template_same(self) -> None:
         """Test for successful match of same images for all template CV backends."""
@@ -398,6 +454,63 @@ class FinderTest(unittest.TestCase):
             self.assertRegex(hotmap, r".*-\d\.\d+.*")
             self.assertTrue(os.path.isfile(os.path.join(self.logpath, hotmap)))
 
+    @unittest.skipIf(os.environ.get('DISABLE_OPENCV', "0") == "1", "OpenCV disabled")
+    def test_template_pyramid(self) -> None:
+        """Test for coarse-to-fine matches of images for all template CV backends."""
+        finder = TemplateFinder()
+        finder.params["find"]["similarity"].value = 0.99
+
+        for template in finder.algorithms["template_matchers"]:
+            finder.configure_backend(template, "template")
+            for levels in range(1, 4):
+                finder.params["template"]["pyramidLevels"].value = levels
+                matches = finder.find(Image('shape_red_box'), Image('all_shapes'))
+
+                # verify match accuracy against full resolution matching
+                self.assertEqual(len(matches), 3)
+                self.assertEqual(sorted((m.x, m.y) for m in matches),
+                                 [(17, 15), (307, 106), (309, 17)])
+
+            # no coarse candidates and no fallback to full resolution
+            finder.params["template"]["pyramidFallback"].value = False
+            with patch.object(finder, "_match_template_pyramid", return_value=None):
+                matches = finder.find(Image('shape_red_box'), Image('all_shapes'))
+            self.assertEqual(len(matches), 0)
+            finder.params["template"]["pyramidFallback"].value = True
+            with patch.object(finder, "_match_template_pyramid", return_value=None):
+                matches = finder.find(Image('shape_red_box'), Image('all_shapes'))
+            self.assertEqual(len(matches), 3)
+
+    @unittest.skipIf(os.environ.get('DISABLE_OPENCV', "0") == "1", "OpenCV disabled")
+    def test_template_peaks(self) -> None:
+        """Test for extraction of separate maxima from template matching results."""
+        import numpy
+        finder = TemplateFinder()
+        result = numpy.zeros((50, 60), numpy.float32)
+        # plateau of a single maximum and a close worse maximum
+        result[10:12, 10:12] = 0.9
+        result[13, 14] = 0.8
+        # distant maxima with a negative value to rectify
+        result[40, 50] = 0.95
+        result[30, 20] = 0.7
+        result[0, 0] = -1.0
+
+        peaks = finder._extract_peaks(result, 0.75, 10, 10)
+        self.assertEqual(peaks, [(50, 40, result[40, 50]), (10, 10, result[10, 10])])
+        peaks = finder._extract_peaks(result, 0.5, 4, 4)
+        self.assertEqual([(x, y) for x, y, _ in peaks],
+                         [(50, 40), (10, 10), (14, 13), (20, 30)])
+        peaks = finder._extract_peaks(result, 0.0, 10, 10)
+        self.assertEqual([(x, y) for x, y, _ in peaks], [(50, 40)])
+        # flat results are split into maxima one suppression window apart
+        result = numpy.ones((1, 181), numpy.float32)
+        peaks = finder._extract_peaks(result, 0.9, 20, 20)
+        self.assertEqual(peaks, [(x, 0, 1.0) for x in range(0, 181, 10)])
+        result = numpy.ones((200, 300), numpy.float32)
+        peaks = finder._extract_peaks(result, 0.9, 4, 4)
+        self.assertEqual(15000, len(peaks))
+        self.assertEqual([(0, 0), (2, 0), (4, 0)], [(x, y) for x, y, _ in peaks[:3]])
+
     @unittest.skipIf(os.environ.get('DISABLE_OPENCV', "0") == "1", "OpenCV disabled")
     def test_feature_same(self) -> None:
         """Test for successful match of same images for all feature CV backends."""
@@ -537,6 +650,139 @@ class FinderTest(unittest.TestCase):
         self.assertAlmostEqual(matches[0].width, 160, delta=10)
         self.assertAlmostEqual(matches[0].height, 235, delta=10)
 
+    @unittest.skipIf(os.environ.get('DISABLE_OPENCV', "0") == "1", "OpenCV disabled")
+    def test_feature_multiple(self) -> None:
+        """Test for successful match of multiple instances for default feature CV backend."""
+        import PIL.Image
+        needle = Image('n_ibs')
+        haystack = PIL.Image.new("RGB", (3 * needle.width, needle.height + 40), "white")
+        haystack.paste(needle.pil_image, (10, 20))
+        haystack.paste(needle.pil_image, (2 * needle.width, 0))
+
+        finder = FeatureFinder()
+        finder.params["find"]["similarity"].value = 0.4
+        finder.params["feature"]["multipleInstances"].value = True
+        matches = finder.find(needle, Image(pil_image=haystack))
+        self.assertEqual(len(matches), 2)
+        matches = sorted(matches, key=lambda x: x.x)
+        self.assertAlmostEqual(matches[0].x, 10, delta=5)
+        self.assertAlmostEqual(matches[0].y, 20, delta=5)
+        self.assertAlmostEqual(matches[1].x, 2 * needle.width, delta=5)
+        self.assertAlmostEqual(matches[1].y, 0, delta=5)
+        for match in matches:
+            self.assertAlmostEqual(match.width, needle.width, delta=10)
+            self.assertAlmostEqual(match.height, needle.height, delta=10)
+
+        # instances of different scale are clustered by the scale of their features
+        scaled = needle.pil_image.resize((needle.width * 13 // 10, needle.height * 13 // 10))
+        haystack = PIL.Image.new("RGB", (4 * needle.width, 2 * needle.height), "white")
+        haystack.paste(needle.pil_image, (10, 20))
+        haystack.paste(scaled, (2 * needle.width, 10))
+        # fewer needle features are matched at a different scale
+        finder.params["find"]["similarity"].value = 0.3
+        matches = finder.find(needle, Image(pil_image=haystack))
+        self.assertEqual(len(matches), 2)
+        matches = sorted(matches, key=lambda x: x.x)
+        self.assertAlmostEqual(matches[1].x, 2 * needle.width, delta=5)
+        self.assertAlmostEqual(matches[1].y, 10, delta=5)
+        self.assertAlmostEqual(matches[1].width, scaled.width, delta=10)
+        self.assertAlmostEqual(matches[1].height, scaled.height, delta=10)
+
+    @unittest.skipIf(os.environ.get('DISABLE_OPENCV', "0") == "1", "OpenCV disabled")
+    def test_feature_backend_reuse(self) -> None:
+        """Test that feature backends are rebuilt only on configuration changes."""
+        finder = FeatureFinder()
+        detector, extractor, matcher = finder.detector, finder.extractor, finder.matcher
+        finder.find(Image('n_ibs'), Image('n_ibs'))
+        self.assertIs(finder.detector, detector)
+        self.assertIs(finder.extractor, extractor)
+        self.assertIs(finder.matcher, matcher)
+
+        finder.params["fdetect"]["MaxFeatures"].value = 100
+        finder.find(Image('n_ibs'), Image('n_ibs'))
+        self.assertIsNot(finder.detector, detector)
+        self.assertEqual(finder.detector.getMaxFeatures(), 100)
+        self.assertIs(finder.extractor, extractor)
+
+        finder.configure_backend("BruteForce-L1", "fmatch")
+        finder.find(Image('n_ibs'), Image('n_ibs'))
+        self.assertIsNot(finder.matcher, matcher)
+        self.assertIs(finder.extractor, extractor)
+
+    @unittest.skipIf(os.environ.get('DISABLE_OPENCV', "0") == "1", "OpenCV disabled")
+    def test_feature_filters(self) -> None:
+        """Test the ratio and symmetry tests of the feature matching."""
+        import cv2
+        import numpy
+        finder = FeatureFinder()
+        finder.params["fmatch"]["ratioTest"].value = True
+        finder.params["fmatch"]["symmetryTest"].value = True
+        finder.synchronize_backend(category="fmatch")
+        finder.matcher = MagicMock()
+        finder.matcher.knnMatch.side_effect = [
+            # ratio test drops the ambiguous second needle keypoint
+            [[cv2.DMatch(0, 1, 10), cv2.DMatch(0, 2, 50)],
+             [cv2.DMatch(1, 0, 40), cv2.DMatch(1, 3, 42)],
+             [cv2.DMatch(2, 2, 5)]],
+            # ratio test drops the ambiguous first haystack keypoint
+            [[cv2.DMatch(0, 1, 1), cv2.DMatch(0, 0, 1)],
+             [cv2.DMatch(1, 0, 10), cv2.DMatch(1, 2, 60)],
+             [cv2.DMatch(2, 1, 5)]],
+        ]
+        nkeypoints = [cv2.KeyPoint(i, 0, 1) for i in range(3)]
+        hkeypoints = [cv2.KeyPoint(0, i, 1) for i in range(4)]
+        finder.imglog.similarities.append(0.0)
+        # hotmaps of the detection, matching, and projection stages as in a find
+        finder.imglog.hotmaps += [numpy.zeros((10, 10, 3), numpy.uint8) for _ in range(4)]
+        mnkp, mhkp = finder._match_features(nkeypoints, None, hkeypoints, None,
+                                            finder.params["fmatch"]["backend"])
+        # only the first needle keypoint has a symmetric match
+        self.assertEqual(mnkp, [nkeypoints[0]])
+        self.assertEqual(mhkp, [hkeypoints[1]])
+        self.assertAlmostEqual(finder.imglog.similarities[-1], 1 / 3)
+        finder.imglog.clear()
+
+    @unittest.skipIf(os.environ.get('DISABLE_OPENCV', "0") == "1", "OpenCV disabled")
+    def test_feature_cache(self) -> None:
+        """Test that needle features are cached in memory and on disk."""
+        FeatureFinder.feature_cache.clear()
+        cache_dir = mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir)
+        needle_file = os.path.join(cache_dir, "n_ibs.png")
+        shutil.copy(FileResolver().search("n_ibs.png"), needle_file)
+        cache_file = os.path.join(cache_dir, "n_ibs.features.npz")
+
+        finder = FeatureFinder()
+        finder.params["find"]["similarity"].value = 0.4
+        with TemporaryConfig() as cfg:
+            cfg.feature_cache_persist = True
+            matches = repr(finder.find(Image(needle_file), Image('h_ibs_viewport')))
+            self.assertEqual(FeatureFinder.feature_cache.misses, 1)
+            self.assertTrue(os.path.exists(cache_file))
+            self.assertEqual(repr(finder.find(Image(needle_file), Image('h_ibs_viewport'))), matches)
+            self.assertEqual(FeatureFinder.feature_cache.hits, 1)
+
+            # features persisted on disk are reused after a restart
+            FeatureFinder.feature_cache.clear()
+            with patch.object(finder, "detector", wraps=finder.detector) as detector:
+                self.assertEqual(repr(finder.find(Image(needle_file), Image('h_ibs_viewport'))), matches)
+            self.assertEqual(detector.detect.call_count, 1)
+
+            # features of needles on unwritable paths are only cached in memory
+            FeatureFinder.feature_cache.clear()
+            os.remove(cache_file)
+            with patch("numpy.savez", side_effect=PermissionError("read-only")):
+                self.assertEqual(repr(finder.find(Image(needle_file), Image('h_ibs_viewport'))), matches)
+            self.assertFalse(os.path.exists(cache_file))
+            self.assertEqual(len(FeatureFinder.feature_cache), 1)
+
+        # different parameters require different features
+        finder.params["fdetect"]["MaxFeatures"].value = 100
+        finder.find(Image(needle_file), Image('h_ibs_viewport'))
+        self.assertEqual(FeatureFinder.feature_cache.misses, 2)
+        self.assertEqual(len(FeatureFinder.feature_cache), 2)
+        FeatureFinder.feature_cache.clear()
+
     @unittest.skipIf(os.environ.get('DISABLE_OPENCV', "0") == "1", "OpenCV disabled")
     def test_cascade_same(self) -> None:
         """Test for successful match of same images for the cascade CV backend."""
@@ -814,6 +1060,100 @@ class FinderTest(unittest.TestCase):
         self.assertAlmostEqual(matches[0].width, 120, delta=5)
         self.assertAlmostEqual(matches[0].height, 10, delta=5)
 
+    @unittest.skipIf(os.environ.get('DISABLE_OPENCV', "0") == "1" or
+                     os.environ.get('DISABLE_OCR', "0") == "1",
+                     "Disabled OpenCV or OCR")
+    def test_text_workers(self) -> None:
+        """Test that concurrently recognized text regions are returned in order."""
+        import time
+        import numpy
+        finder = TextFinder()
+        finder.configure_backend("pytesseract", "ocr")
+        finder.synchronize_backend("pytesseract", "ocr")
+        finder.params["ocr"]["workers"].value = 4
+
+        def image_to_string(text_img, lang, config):
+            # later regions are recognized faster
+            time.sleep(0.01 * (10 - text_img[0, 0]))
+            return "text%s\n" % text_img[0, 0]
+        finder.ocr = MagicMock()
+        finder.ocr.image_to_string.side_effect = image_to_string
+        TextFinder.ocr_cache.clear()
+        text_imgs = [numpy.full((5, 5), i, dtype=numpy.uint8) for i in range(10)]
+        outputs = finder._recognize_texts(text_imgs)
+        self.assertEqual(outputs, ["text%s" % i for i in range(10)])
+        self.assertEqual(finder.ocr.image_to_string.call_count, 10)
+        TextFinder.ocr_cache.clear()
+
+    @unittest.skipIf(os.environ.get('DISABLE_OPENCV', "0") == "1" or
+                     os.environ.get('DISABLE_OCR', "0") == "1",
+                     "Disabled OpenCV or OCR")
+    def test_text_cache(self) -> None:
+        """Test that the recognized text of unchanged text regions is cached."""
+        import numpy
+        TextFinder.ocr_cache.clear()
+        finder = TextFinder()
+        finder.configure_backend("pytesseract", "ocr")
+        finder.synchronize_backend("pytesseract", "ocr")
+        finder.ocr = MagicMock()
+        finder.ocr.image_to_string.side_effect = lambda text_img, lang, config: "text%s" % text_img[0, 0]
+        text_imgs = [numpy.full((5, 5), i, dtype=numpy.uint8) for i in range(3)]
+        self.assertEqual(finder._recognize_texts(text_imgs), ["text0", "text1", "text2"])
+        self.assertEqual((TextFinder.ocr_cache.hits, TextFinder.ocr_cache.misses), (0, 3))
+
+        text_imgs[2] = numpy.full((5, 5), 3, dtype=numpy.uint8)
+        self.assertEqual(finder._recognize_texts(text_imgs), ["text0", "text1", "text3"])
+        self.assertEqual((TextFinder.ocr_cache.hits, TextFinder.ocr_cache.misses), (2, 4))
+        self.assertEqual(finder.ocr.image_to_string.call_count, 4)
+        self.assertGreater(TextFinder.ocr_cache.nbytes, 0)
+
+        # recognition parameters are part of the cache key
+        finder.params["ocr"]["psmode"].value = 7
+        finder._recognize_texts(text_imgs)
+        self.assertEqual(finder.ocr.image_to_string.call_count, 7)
+        TextFinder.ocr_cache.clear()
+
+    @unittest.skipIf(os.environ.get('DISABLE_OPENCV', "0") == "1" or
+                     os.environ.get('DISABLE_OCR', "0") == "1",
+                     "Disabled OpenCV or OCR")
+    def test_text_index(self) -> None:
+        """Test that the recognized text of a haystack is reused for other text needles."""
+        TextFinder.text_index.clear()
+        with TemporaryConfig() as cfg:
+            # the index is only reused if no images are logged
+            cfg.image_logging_level = 40
+            finder = TextFinder()
+            finder.params["find"]["similarity"].value = 0.5
+            matches = finder.find(Text('Find the word here'), Image('sentence_sans'))
+            self.assertEqual(TextFinder.text_index.misses, 1)
+            self.assertEqual(len(TextFinder.text_index), 1)
+            self.assertGreater(TextFinder.text_index.nbytes, 0)
+
+            # same contents in a different image object
+            with patch.object(finder, "_recognize_texts") as recognize:
+                self.assertEqual(repr(finder.find(Text('Find the word here'), Image('sentence_sans'))),
+                                 repr(matches))
+                finder.find(Text('word'), Image('sentence_sans'))
+                recognize.assert_not_called()
+            self.assertEqual(TextFinder.text_index.hits, 2)
+
+            # different recognition parameters require a new index
+            finder.params["ocr"]["border_size"].value += 1
+            finder.find(Text('word'), Image('sentence_sans'))
+            self.assertEqual(TextFinder.text_index.misses, 2)
+            cfg.text_index_size = 0
+            finder.find(Text('word'), Image('sentence_sans'))
+            self.assertEqual(len(TextFinder.text_index), 0)
+            cfg.text_index_size = 10
+
+            # the text is detected again with image logging
+            cfg.image_logging_level = 10
+            finder = TextFinder()
+            finder.params["find"]["similarity"].value = 0.5
+            finder.find(Text('Find the word here'), Image('sentence_sans'))
+            self.assertEqual(TextFinder.text_index.hits, 2)
+        TextFinder.text_index.clear()
+
     @unittest.skipIf(os.environ.get('DISABLE_OPENCV', "0") == "1", "OpenCV disabled")
     def test_tempfeat_same(self) -> None:
         """Test for successful match of same images for the template-feature CV backend."""
@@ -883,6 +1223,70 @@ class FinderTest(unittest.TestCase):
             shutil.rmtree(self.logpath)
             i += 1
 
+    @unittest.skipIf(os.environ.get('DISABLE_OPENCV', "0") == "1", "OpenCV disabled")
+    def test_tempfeat_workers(self) -> None:
+        """Test concurrent verification of template candidates for the template-feature CV backend."""
+        import PIL.Image
+        needle = Image('n_ibs')
+        haystack = PIL.Image.new("RGB", (3 * needle.width, needle.height + 40), "white")
+        haystack.paste(needle.pil_image, (10, 20))
+        haystack.paste(needle.pil_image, (2 * needle.width, 0))
+        haystack = Image(pil_image=haystack)
+
+        finder = TemplateFeatureFinder()
+        finder.params["find"]["similarity"].value = 0.9
+        finder.params["tempfeat"]["workers"].value = 1
+        serial = finder.find(needle, haystack)
+        self.assertEqual(len(serial), 2)
+        self.assertEqual(len(finder._verifiers), 1)
+
+        finder.params["tempfeat"]["workers"].value = 4
+        parallel = finder.find(needle, haystack)
+        self.assertEqual(repr(parallel), repr(serial))
+        # only as many verifiers as candidates are needed
+        self.assertEqual(len(finder._verifiers), 2)
+        self.assertIsNot(finder._verifiers[0].detector, finder.detector)
+        self.assertIsNot(finder._verifiers[0].imglog, finder._verifiers[1].imglog)
+
+        finder.params["tempfeat"]["workers"].value = 1
+        finder.params["tempfeat"]["maxMatches"].value = 1
+        matches = finder.find(needle, haystack)
+        self.assertEqual(len(matches), 1)
+        self.assertEqual(repr(matches[0]), repr(serial[0]))
+
+    @unittest.skipIf(os.environ.get('DISABLE_OPENCV', "0") == "1", "OpenCV disabled")
+    def test_tempfeat_max_matches(self) -> None:
+        """Test skipping of template candidates with image logging for the template-feature CV backend."""
+        import PIL.Image
+        needle = Image('n_ibs')
+        haystack = PIL.Image.new("RGB", (3 * needle.width, needle.height + 40), "white")
+        haystack.paste(needle.pil_image, (10, 20))
+        haystack.paste(needle.pil_image, (2 * needle.width, 0))
+        haystack = Image(pil_image=haystack)
+
+        with TemporaryConfig() as cfg:
+            cfg.image_logging_level = 10
+            finder = TemplateFeatureFinder()
+            finder.params["find"]["similarity"].value = 0.9
+            finder.params["tempfeat"]["maxMatches"].value = 1
+            first = None
+            for workers in [1, 2, 2, 2]:
+                finder.params["tempfeat"]["workers"].value = workers
+                matches = finder.find(needle, haystack)
+                self.assertEqual(len(matches), 1)
+                # the best candidate is kept regardless of the verification order
+                if first is None:
+                    first = repr(matches[0])
+                self.assertEqual(repr(matches[0]), first)
+
+                # only the verified candidate is logged
+                dumps = self._verify_and_get_dumps(6, ImageLogger.step - 1)
+                hotmaps = sorted(self._get_matches_in('.*hotmap.*', dumps))
+                self.assertEqual(len(hotmaps), 3)
+                self.assertIn('1feature', hotmaps[1])
+                self.assertIn('1template', hotmaps[2])
+                shutil.rmtree(self.logpath)
+
     @unittest.skipIf(os.environ.get('DISABLE_PYTORCH', "0") == "1", "PyTorch disabled")
     def test_deep_same(self) -> None:
         """Test for successful match of same images for all deep (DL) CV backends."""
@@ -1075,6 +1479,17 @@ class CVParameterTest(unittest.TestCase):
         parsed = CVParameter.from_string("<value='123456789.' min='None' max='None' delta='1030.25' tolerance='10.2' fixed='False' enumerated='False'>")
         self.assertEqual(parsed, expected)
 
+    def test_value_version(self) -> None:
+        """Check that every value assignment changes the parameter version."""
+        param = CVParameter(3)
+        other = CVParameter(3)
+        self.assertNotEqual(param.version, other.version)
+        version = param.version
+        param.value = 4
+        self.assertNotEqual(param.version, version)
+        self.assertEqual(param.value, 4)
+        self.assertEqual(copy.deepcopy(param).version, param.version)
+
     def test_empty_value(self) -> None:
         """Check that the parser handles empty CVParameter value gracefully."""
         expected = CVParameter(
@@ -1085,5 +1500,43 @@ class CVParameterTest(unittest.TestCase):
         self.assertEqual(parsed, expected)
 
 
+class LRUCacheTest(unittest.TestCase):
+    """Tests for the LRU cache used by the CV backends."""
+
+    def test_eviction(self) -> None:
+        """Check that the least recently used entries are discarded first."""
+        cache = LRUCache(2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        self.assertEqual(cache.get("a"), 1)
+        cache.put("c", 3)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), 1)
+        self.assertEqual(cache.get("c"), 3)
+        self.assertEqual(len(cache), 2)
+        self.assertEqual((cache.hits, cache.misses), (3, 1))
+
+        cache.maxsize = 0
+        cache.put("d", 4)
+        self.assertEqual(len(cache), 0)
+        cache.clear()
+        self.assertEqual((cache.hits, cache.misses), (0, 0))
+
+    def test_memory(self) -> None:
+        """Check that entries are discarded once their memory exceeds the limit."""
+        cache = LRUCache(10, memory=1)
+        cache.put("a", 1, 512 * 1024)
+        cache.put("b", 2, 512 * 1024)
+        self.assertEqual(cache.nbytes, 1024 * 1024)
+        cache.put("b", 3, 256 * 1024)
+        self.assertEqual(cache.nbytes, 768 * 1024)
+        cache.put("c", 4, 512 * 1024)
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.get("b"), 3)
+        self.assertEqual(cache.nbytes, 768 * 1024)
+        cache.clear()
+        self.assertEqual(cache.nbytes, 0)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -15,12 +15,19 @@
 # along with guibot.  If not, see <http://www.gnu.org/licenses/>.
 
 import os
+import json
+import shutil
+import threading
 import unittest
+import numpy
+import PIL.Image
 from PIL.Image import Image
+from tempfile import mkdtemp
 from unittest.mock import MagicMock, patch
 
-from guibot.imagelogger import ImageLogger
+from guibot.imagelogger import ImageLogger, ImageRing, ImageWriter
 from guibot.config import GlobalConfig, TemporaryConfig
+from guibot.target import Image as Target
 
 
 class ImageLoggerTest(unittest.TestCase):
@@ -87,6 +94,18 @@ class ImageLoggerTest(unittest.TestCase):
             self.assertIsNone(ImageLogger().dump_matched_images())
             self.assertIsNone(ImageLogger().dump_hotmap(None, None))
 
+    def test_hotmap_canvas(self) -> None:
+        """Check that hotmap canvases are copied only if they are logged."""
+        image = MagicMock()
+        with TemporaryConfig() as cfg:
+            cfg.image_logging_level = 20
+            imglog = ImageLogger()
+            self.assertFalse(imglog.is_enabled(10))
+            self.assertTrue(imglog.is_enabled(30))
+            self.assertIs(imglog.canvas(image, 10), image)
+            self.assertIs(imglog.canvas(image), image.copy.return_value)
+        image.copy.assert_called_once_with()
+
     def test_image_dumping(self) -> None:
         """Check that images are dumped correctly."""
         ImageLogger.step = 18
@@ -110,5 +129,289 @@ class ImageLoggerTest(unittest.TestCase):
             self.mock_mkdir.assert_called_once_with(ImageLogger.logging_destination)
             image_mock.save.assert_called_once_with(path, compress_level=cfg.image_quality)
 
+
+class ImageDedupTest(unittest.TestCase):
+    """Tests for the deduplicated image dumps."""
+
+    def setUp(self) -> None:
+        self.destination = mkdtemp()
+        self.addCleanup(shutil.rmtree, self.destination)
+
+    def test_dedup_dumping(self) -> None:
+        """Check that identical images are stored once and restored per step."""
+        haystack = Target("", PIL.Image.new("RGB", (20, 10), (255, 0, 0)))
+        changed = Target("", PIL.Image.new("RGB", (20, 10), (0, 255, 0)))
+        needle = Target("", PIL.Image.new("RGB", (5, 5), (255, 0, 0)))
+        with TemporaryConfig() as cfg:
+            cfg.image_logging_level = 10
+            cfg.image_logging_destination = self.destination
+            cfg.image_logging_dedup = True
+            imglog = ImageLogger()
+            imglog.needle = needle
+            for step, image in enumerate([haystack, haystack, changed], start=2):
+                ImageLogger.step = step
+                imglog.haystack = image
+                imglog.dump_matched_images()
+
+        self.assertEqual(len(os.listdir(os.path.join(self.destination, "objects"))), 3)
+        with open(os.path.join(self.destination, "index.jsonl")) as f:
+            self.assertEqual(len(f.readlines()), 6)
+        self.assertEqual(sorted(os.listdir(self.destination)), ["index.jsonl", "objects"])
+
+        restored = ImageLogger.restore_dumps(self.destination)
+        self.assertEqual(len(restored), 6)
+        self.assertEqual(
+            os.path.basename(restored[3]), "imglog003-2haystack-%s.png" % haystack
+        )
+        for path in restored:
+            self.assertTrue(os.path.isfile(path))
+        with PIL.Image.open(restored[-1]) as image:
+            self.assertEqual(image.getpixel((0, 0)), (0, 255, 0))
+        ImageLogger.step = 1
+
+
+class ImageFormatTest(unittest.TestCase):
+    """Tests for the supported image logging formats."""
+
+    def setUp(self) -> None:
+        self.destination = mkdtemp()
+        self.addCleanup(shutil.rmtree, self.destination)
+
+    def test_invalid_format(self) -> None:
+        """Check that only supported image logging formats can be configured."""
+        with TemporaryConfig() as cfg:
+            with self.assertRaises(ValueError):
+                cfg.image_logging_format = "bmp"
+
+    def test_format_dumping(self) -> None:
+        """Check that dumps in all formats can be read back."""
+        hotmap = numpy.zeros((10, 20, 3), dtype=numpy.uint8)
+        hotmap[2:5, 3:9] = (10, 200, 30)
+        haystack = Target("", PIL.Image.fromarray(hotmap))
+        expected = {
+            "png": ["imglog002-2haystack-noname.png", "imglog002-3hotmap.png"],
+            "png-fast": ["imglog002-2haystack-noname.png", "imglog002-3hotmap.png"],
+            "webp": ["imglog002-2haystack-noname.webp", "imglog002-3hotmap.webp"],
+            "npy": ["imglog002-2haystack-noname.npy", "imglog002-3hotmap.npy"],
+        }
+        for file_format in ["png", "png-fast", "webp", "npy", "npz"]:
+            with TemporaryConfig() as cfg:
+                cfg.image_logging_level = 10
+                cfg.image_logging_destination = self.destination
+                cfg.image_logging_format = file_format
+                ImageLogger.step = 2
+                imglog = ImageLogger()
+                imglog.needle = MagicMock(use_own_settings=True)
+                imglog.haystack = haystack
+                imglog.dump_matched_images()
+                imglog.dump_hotmap("imglog002-3hotmap.png", hotmap)
+
+            if file_format == "npz":
+                path = os.path.join(self.destination, "imglog.npz")
+                dumps = [
+                    ImageLogger.load_dump(path, "imglog002-2haystack-noname"),
+                    ImageLogger.load_dump(path, "imglog002-3hotmap"),
+                ]
+            else:
+                self.assertEqual(sorted(os.listdir(self.destination)), expected[file_format])
+                dumps = [
+                    ImageLogger.load_dump(os.path.join(self.destination, name))
+                    for name in expected[file_format]
+                ]
+            for dump in dumps:
+                numpy.testing.assert_array_equal(numpy.asarray(dump.convert("RGB")), hotmap)
+            shutil.rmtree(self.destination)
+            os.mkdir(self.destination)
+        ImageLogger.step = 1
+
+    def test_dedup_needle_dumping(self) -> None:
+        """Check that needles with own settings are deduplicated next to their settings."""
+        haystack = Target("", PIL.Image.new("RGB", (20, 10), (255, 0, 0)))
+        needle = Target("", PIL.Image.new("RGB", (5, 5), (0, 0, 255)))
+        needle.use_own_settings = True
+        with TemporaryConfig() as cfg:
+            cfg.image_logging_level = 10
+            cfg.image_logging_destination = self.destination
+            cfg.image_logging_dedup = True
+            imglog = ImageLogger()
+            imglog.needle = needle
+            imglog.haystack = haystack
+            for step in [2, 3]:
+                ImageLogger.step = step
+                imglog.dump_matched_images()
+
+        self.assertEqual(len(os.listdir(os.path.join(self.destination, "objects"))), 2)
+        with open(os.path.join(self.destination, "index.jsonl")) as f:
+            names = [json.loads(line)["name"] for line in f]
+        self.assertEqual(names.count("imglog003-1needle-noname.png"), 1)
+        for step in ["002", "003"]:
+            path = os.path.join(self.destination, "imglog%s-1needle-noname" % step)
+            self.assertTrue(os.path.isfile(path + ".match"))
+            self.assertFalse(os.path.exists(path + ".png"))
+        ImageLogger.step = 1
+
+
+class ImageWriterTest(unittest.TestCase):
+    """Tests for the ImageWriter class."""
+
+    def _blocked_writer(self, policy: str) -> tuple[ImageWriter, threading.Event]:
+        writer = ImageWriter(2, policy)
+        self.addCleanup(writer.close)
+        release = threading.Event()
+        started = threading.Event()
+
+        def blocking_job() -> None:
+            started.set()
+            release.wait()
+
+        writer.submit(blocking_job)
+        started.wait()
+        return writer, release
+
+    def test_invalid_policy(self) -> None:
+        """Check that unknown backpressure policies are rejected."""
+        with self.assertRaises(ValueError):
+            ImageWriter(2, "drop_all")
+
+    def test_drop_newest(self) -> None:
+        """Check that new dumps are dropped once the queue is full."""
+        writer, release = self._blocked_writer("drop_newest")
+        jobs = [MagicMock() for _ in range(3)]
+        self.assertEqual([writer.submit(job) for job in jobs], [True, True, False])
+        self.assertEqual(writer.queued, 2)
+        release.set()
+        self.assertTrue(writer.flush(timeout=5))
+        jobs[0].assert_called_once_with()
+        jobs[1].assert_called_once_with()
+        jobs[2].assert_not_called()
+        self.assertEqual((writer.submitted, writer.written, writer.dropped), (3, 3, 1))
+
+    def test_drop_oldest(self) -> None:
+        """Check that old dumps are dropped once the queue is full."""
+        writer, release = self._blocked_writer("drop_oldest")
+        jobs = [MagicMock() for _ in range(3)]
+        self.assertEqual([writer.submit(job) for job in jobs], [True, True, True])
+        release.set()
+        writer.close(timeout=5)
+        jobs[0].assert_not_called()
+        jobs[1].assert_called_once_with()
+        jobs[2].assert_called_once_with()
+        self.assertEqual((writer.submitted, writer.written, writer.dropped), (4, 3, 1))
+        with self.assertRaises(RuntimeError):
+            writer.submit(MagicMock())
+
+    def test_block(self) -> None:
+        """Check that submitting dumps waits for a free slot in a full queue."""
+        writer, release = self._blocked_writer("block")
+        writer.submit(MagicMock())
+        writer.submit(MagicMock(side_effect=IOError("disk full")))
+        submitted = threading.Event()
+        job = MagicMock()
+        threading.Thread(target=lambda: writer.submit(job) and submitted.set()).start()
+        self.assertFalse(submitted.wait(0.1))
+        release.set()
+        self.assertTrue(submitted.wait(5))
+        self.assertTrue(writer.flush(timeout=5))
+        self.assertEqual((writer.written, writer.failed, writer.dropped), (3, 1, 0))
+
+    def test_background_dumping(self) -> None:
+        """Check that hotmaps are written by the background writer if configured."""
+        with TemporaryConfig() as cfg:
+            cfg.image_logging_level = 10
+            cfg.image_logging_queue_size = 4
+            imglog = ImageLogger()
+            self.assertIsNotNone(ImageLogger.writer)
+            image_mock = MagicMock(Image)
+            image_mock.copy.return_value = MagicMock(Image)
+            with patch("os.path.exists", return_value=True):
+                imglog.dump_hotmap("some_name", image_mock)
+            self.assertTrue(ImageLogger.flush(timeout=5))
+            image_mock.copy.return_value.save.assert_called_once()
+            image_mock.save.assert_not_called()
+            ImageLogger.close()
+        self.assertIsNone(ImageLogger.writer)
+
+
+class ImageRingTest(unittest.TestCase):
+    """Tests for the ImageRing class."""
+
+    def test_step_limit(self) -> None:
+        """Check that only the dumps of the last steps are kept."""
+        ring = ImageRing(2)
+        jobs = [MagicMock() for _ in range(4)]
+        ring.append(1, jobs[0], 10)
+        ring.append(2, jobs[1], 10)
+        ring.append(2, jobs[2], 10)
+        self.assertEqual(ring.nbytes, 30)
+        ring.append(3, jobs[3], 10)
+        self.assertEqual(ring.nbytes, 30)
+        self.assertEqual(ring.pop_all(), jobs[1:])
+        self.assertEqual(ring.nbytes, 0)
+        self.assertEqual(ring.pop_all(), [])
+
+    def test_memory_limit(self) -> None:
+        """Check that old steps are discarded to fit the memory limit."""
+        ring = ImageRing(10, 1)
+        jobs = [MagicMock() for _ in range(3)]
+        ring.append(1, jobs[0], 512 * 1024)
+        ring.append(2, jobs[1], 512 * 1024)
+        ring.append(3, jobs[2], 2 * 1024 * 1024)
+        # the last step is kept even if too large
+        self.assertEqual(ring.pop_all(), jobs[2:])
+
+    def test_buffered_dumping(self) -> None:
+        """Check that dumps are written only once the buffer is dumped."""
+        with TemporaryConfig() as cfg, patch("os.mkdir") as mock_mkdir:
+            cfg.image_logging_level = 10
+            cfg.image_logging_ring_steps = 2
+            imglog = ImageLogger()
+            self.assertIsNotNone(ImageLogger.ring)
+            imglog.needle = MagicMock(use_own_settings=False)
+            imglog.haystack = MagicMock(use_own_settings=False)
+            image_mock = MagicMock(Image)
+            image_mock.copy.return_value = MagicMock(Image)
+            imglog.dump_matched_images()
+            imglog.dump_hotmap("some_name", image_mock)
+            mock_mkdir.assert_not_called()
+            image_mock.copy.return_value.save.assert_not_called()
+
+            with patch("os.path.exists", return_value=False):
+                ImageLogger.dump_failure(MagicMock(), MagicMock())
+            mock_mkdir.assert_called_once_with(ImageLogger.logging_destination)
+            image_mock.copy.return_value.save.assert_called_once()
+            self.assertEqual(ImageLogger.ring.pop_all(), [])
+
+            cfg.image_logging_ring_steps = 0
+            ImageLogger()
+        self.assertIsNone(ImageLogger.ring)
+
+    def test_buffered_dumping_cleanup(self) -> None:
+        """Check that old dumps are removed only before writing buffered ones."""
+        with TemporaryConfig() as cfg, patch("os.mkdir") as mock_mkdir, \
+                patch("shutil.rmtree") as mock_rmtree, \
+                patch("os.path.exists", return_value=True):
+            cfg.image_logging_level = 10
+            cfg.image_logging_ring_steps = 2
+            imglog = ImageLogger()
+            imglog.needle = MagicMock(use_own_settings=False)
+            imglog.haystack = MagicMock(use_own_settings=False)
+            imglog.dump_matched_images()
+            mock_rmtree.assert_not_called()
+
+            ImageLogger.dump_failure(MagicMock(), MagicMock())
+            mock_rmtree.assert_called_once_with(ImageLogger.logging_destination)
+            mock_mkdir.assert_called_once_with(ImageLogger.logging_destination)
+            imglog.needle.save.assert_called_once()
+
+            # later failures of the same run keep the earlier dumps
+            ImageLogger.step = 2
+            imglog.dump_matched_images()
+            ImageLogger.dump_failure(MagicMock(), MagicMock())
+            mock_rmtree.assert_called_once()
+            self.assertEqual(2, imglog.needle.save.call_count)
+
+            cfg.image_logging_ring_steps = 0
+            ImageLogger()
+
 if __name__ == '__main__':
     unittest.main()
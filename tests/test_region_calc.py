@@ -16,9 +16,18 @@
 
 import os
 import unittest
+from unittest.mock import MagicMock, patch
+
+import PIL.Image
 
 import common_test
+from guibot import inputmap
+from guibot.target import Image
 from guibot.region import Region
+from guibot.match import Match, MatchRecord
+from guibot.finder import Finder
+from guibot.errors import FindError
+from guibot.config import TemporaryConfig
 from guibot.controller import Controller, AutoPyController
 
 
@@ -237,5 +246,131 @@ class RegionTest(unittest.TestCase):
         self.assertEqual(screen_width - region.x, region.width)
         self.assertEqual(10, region.height)
 
+
+class MatchRecordTest(unittest.TestCase):
+
+    def test_record_target(self) -> None:
+        """Test target location of a lightweight match record."""
+        record = MatchRecord(10, 20, 30, 40, 5, -5, 0.9)
+        self.assertEqual(10, record.x)
+        self.assertEqual(20, record.y)
+        self.assertEqual(0.9, record.similarity)
+        self.assertEqual(30, record.target.x)
+        self.assertEqual(35, record.target.y)
+        # no per-instance dictionary is allocated for records
+        self.assertFalse(hasattr(record, "__dict__"))
+
+    def test_record_promote(self) -> None:
+        """Test promotion of a match record to a full match."""
+        screen, finder = Controller(), Finder()
+        record = MatchRecord(10, 20, 30, 40, 5, -5, 0.9)
+        match = record.promote(100, 200, dc=screen, cv=finder)
+        self.assertIsInstance(match, Match)
+        self.assertEqual(110, match.x)
+        self.assertEqual(220, match.y)
+        self.assertEqual(30, match.width)
+        self.assertEqual(40, match.height)
+        self.assertEqual(0.9, match.similarity)
+        self.assertIs(match.dc_backend, screen)
+        self.assertIs(match.cv_backend, finder)
+        self.assertEqual(record.target.x + 100, match.target.x)
+        self.assertEqual(record.target.y + 200, match.target.y)
+
+    def test_input_map_sharing(self) -> None:
+        """Test that input map constants are obtained from the DC backend."""
+        screen = Controller()
+        region = Region(0, 0, 10, 10, dc=screen, cv=Finder())
+        with self.assertRaises(AttributeError):
+            region.ENTER
+
+        screen._keymap = inputmap.XDoToolKey()
+        screen._modmap = inputmap.XDoToolKeyModifier()
+        screen._mousemap = inputmap.XDoToolMouseButton()
+        self.assertEqual(screen.keymap.ENTER, region.ENTER)
+        self.assertEqual(screen.modmap.MOD_CTRL, region.MOD_CTRL)
+        self.assertEqual(screen.mousemap.LEFT_BUTTON, region.LEFT_BUTTON)
+        self.assertNotIn("ENTER", region.__dict__)
+        with self.assertRaises(AttributeError):
+            region.to_string
+        with self.assertRaises(AttributeError):
+            region.NONEXISTENT_KEY
+
+
+class RegionRescanTest(unittest.TestCase):
+
+    def test_skip_unchanged_rescan(self) -> None:
+        """Test that unchanged regions are not matched again."""
+        screen = MagicMock(width=100, height=100, frame_id=1)
+        screen.region_changed.return_value = False
+        finder = MagicMock()
+        finder.find.return_value = []
+        region = Region(0, 0, 50, 50, dc=screen, cv=finder)
+
+        with TemporaryConfig() as config:
+            config.rescan_speed_on_find = 0.01
+            config.save_needle_on_error = False
+            with self.assertRaises(FindError):
+                region.find_all(MagicMock(use_own_settings=False), timeout=0.1)
+        self.assertEqual(1, screen.capture_screen.call_count)
+        self.assertEqual(1, finder.find.call_count)
+        screen.region_changed.assert_called_with(1, region)
+
+    def test_skip_identical_rescan(self) -> None:
+        """Test that identical captures are not matched again."""
+        screen = MagicMock(width=100, height=100, frame_id=None)
+        screen.capture_screen.return_value = Image("", PIL.Image.new("RGB", (50, 50)))
+        finder = MagicMock()
+        finder.find.return_value = []
+        region = Region(0, 0, 50, 50, dc=screen, cv=finder)
+
+        with TemporaryConfig() as config:
+            config.rescan_speed_on_find = 0.01
+            region.find_all(MagicMock(use_own_settings=False), timeout=0.1,
+                            allow_zero=True)
+        self.assertGreater(screen.capture_screen.call_count, 1)
+        self.assertEqual(1, finder.find.call_count)
+
+    def test_rescan_changed_area(self) -> None:
+        """Test that only changed areas are matched again by local finders."""
+        screen = MagicMock(width=100, height=100, frame_id=None)
+        first_capture = PIL.Image.new("RGB", (50, 50))
+        second_capture = first_capture.copy()
+        second_capture.paste((255, 255, 255), (20, 30, 22, 32))
+        screen.capture_screen.side_effect = [Image("", first_capture),
+                                             Image("", second_capture)]
+        finder = MagicMock(local_matching=True)
+        finder.find.side_effect = [[], [MatchRecord(3, 4, 5, 5)]]
+        region = Region(10, 10, 50, 50, dc=screen, cv=finder)
+        needle = Image("", PIL.Image.new("RGB", (5, 5)))
+
+        matches = region.find_all(needle, timeout=1)
+        self.assertEqual(2, finder.find.call_count)
+        haystack = finder.find.call_args[0][1]
+        # the changed area is extended by the needle size
+        self.assertEqual((10, 10), haystack.pil_image.size)
+        self.assertEqual(1, len(matches))
+        self.assertEqual(10 + 16 + 3, matches[0].x)
+        self.assertEqual(10 + 26 + 4, matches[0].y)
+
+    def test_failure_dumps(self) -> None:
+        """Test that only failures leaving a find write the failure dumps."""
+        screen = MagicMock(width=100, height=100, frame_id=None)
+        screen.capture_screen.return_value = Image("", PIL.Image.new("RGB", (50, 50)))
+        finder = MagicMock()
+        finder.find.return_value = []
+        region = Region(0, 0, 50, 50, dc=screen, cv=finder)
+        target = MagicMock(use_own_settings=False)
+
+        with patch("guibot.region.ImageLogger.dump_failure") as dump_failure:
+            self.assertIsNone(region.exists(target))
+            dump_failure.assert_not_called()
+            with self.assertRaises(FindError):
+                region.press_expect("a", target, timeout=0, retries=2)
+            dump_failure.assert_called_once()
+            with self.assertRaises(FindError):
+                region.find(target, timeout=0)
+            self.assertEqual(2, dump_failure.call_count)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -18,15 +18,19 @@ import os
 import unittest
 import time
 import shutil
+import threading
 import subprocess
 from typing import Any
+from unittest.mock import MagicMock
+
+import PIL.Image
 
 import common_test
 from guibot.config import GlobalConfig, TemporaryConfig
 from guibot.fileresolver import FileResolver
 from guibot.location import Location
 from guibot.region import Region
-from guibot.match import Match
+from guibot.match import Match, MatchRecord
 from guibot.target import Image, Text
 from guibot.inputmap import Key
 from guibot.finder import AutoPyFinder, TemplateFinder, TextFinder
@@ -250,8 +254,8 @@ class RegionTest(unittest.TestCase):
 
     def test_find_in_animation(self) -> None:
         """Test a switch where a moving match is actually matched when stopping."""
-        match_frames = [Match(0, 0, 10, 20, 0, 0, 1.0), Match(30, 30, 10, 20, 0, 0, 1.0),
-                        Match(30, 45, 10, 20, 0, 0, 1.0), Match(30, 45, 10, 20, 0, 0, 1.0)]
+        match_frames = [MatchRecord(0, 0, 10, 20, 0, 0, 1.0), MatchRecord(30, 30, 10, 20, 0, 0, 1.0),
+                        MatchRecord(30, 45, 10, 20, 0, 0, 1.0), MatchRecord(30, 45, 10, 20, 0, 0, 1.0)]
         self.region.cv_backend.find = lambda x, y: [match_frames.pop(0)]
 
         with TemporaryConfig() as config:
@@ -412,5 +416,84 @@ class RegionTest(unittest.TestCase):
         self.assertTrue(self.region.wait_vanish('all_shapes', timeout=10))
 
 
+class RegionMultiTargetTest(unittest.TestCase):
+
+    def test_find_any(self) -> None:
+        """Test that alternative targets are matched in the same capture."""
+        screen = MagicMock(width=100, height=100, frame_id=None)
+        capture = Image("", PIL.Image.new("RGB", (50, 50)))
+        screen.capture_screen.return_value = capture
+        finder = MagicMock()
+        finder.find.side_effect = [[], [], [], [MatchRecord(3, 4, 5, 5)]]
+        region = Region(10, 10, 50, 50, dc=screen, cv=finder)
+        targets = [MagicMock(use_own_settings=False) for _ in range(2)]
+
+        with TemporaryConfig() as config:
+            config.rescan_speed_on_find = 0.01
+            matches = region.find_any(targets, timeout=1)
+        self.assertEqual(2, screen.capture_screen.call_count)
+        self.assertEqual(4, finder.find.call_count)
+        for args, _ in finder.find.call_args_list:
+            self.assertIs(capture, args[1])
+        self.assertIsNone(matches[0])
+        self.assertEqual(13, matches[1].x)
+        self.assertEqual(14, matches[1].y)
+        self.assertIs(matches[1], region.last_match)
+
+        finder.find.side_effect = None
+        finder.find.return_value = []
+        with TemporaryConfig() as config:
+            config.rescan_speed_on_find = 0.01
+            config.save_needle_on_error = False
+            with self.assertRaises(FindError):
+                region.find_any(targets, timeout=0.1)
+
+    def test_find_each(self) -> None:
+        """Test that targets with own finders are all matched in the same capture."""
+        screen = MagicMock(width=100, height=100, frame_id=None)
+        capture = Image("", PIL.Image.new("RGB", (50, 50)))
+        screen.capture_screen.return_value = capture
+        targets = []
+        for i in range(3):
+            finder = MagicMock()
+            finder.find.return_value = [MatchRecord(i, i, 5, 5)] if i > 0 else []
+            targets.append(MagicMock(use_own_settings=True, match_settings=finder))
+        region = Region(0, 0, 50, 50, dc=screen, cv=MagicMock())
+
+        with TemporaryConfig() as config:
+            config.rescan_speed_on_find = 0.01
+            config.save_needle_on_error = False
+            with self.assertRaises(FindError):
+                region.find_each(targets, timeout=0.1)
+            matches = region.find_each(targets, timeout=0, allow_zero=True)
+        self.assertEqual([0, 1, 1], [len(m) for m in matches])
+        self.assertEqual(2, matches[2][0].x)
+        for target in targets:
+            target.match_settings.find.assert_called_with(target, capture)
+
+    def test_find_multiple_logging(self) -> None:
+        """Test that targets are matched serially if image logs are dumped."""
+        screen = MagicMock(width=100, height=100, frame_id=None)
+        screen.capture_screen.return_value = Image("", PIL.Image.new("RGB", (50, 50)))
+        threads = []
+        targets = []
+        for i in range(3):
+            finder = MagicMock()
+            finder.find.side_effect = lambda *_: threads.append(
+                threading.current_thread()
+            ) or [MatchRecord(0, 0, 5, 5)]
+            targets.append(MagicMock(use_own_settings=True, match_settings=finder))
+        region = Region(0, 0, 50, 50, dc=screen, cv=MagicMock())
+
+        with TemporaryConfig() as config:
+            config.image_logging_level = 10
+            matches = region.find_each(targets, timeout=0)
+        self.assertEqual([1, 1, 1], [len(m) for m in matches])
+        self.assertEqual(1, len(set(threads)))
+
+        self.assertEqual([], region.find_any([]))
+        self.assertEqual([], region.find_each([]))
+
+
 if __name__ == '__main__':
     unittest.main()
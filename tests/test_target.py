@@ -20,7 +20,7 @@ from unittest.mock import Mock, patch, call
 from tempfile import NamedTemporaryFile, mkdtemp, mkstemp, gettempdir
 
 import common_test
-from guibot.target import Chain, Image, Pattern, Text
+from guibot.target import Chain, Frame, Image, Pattern, Text
 from guibot.finder import Finder, CVParameter
 from guibot.errors import FileNotFoundError, UnsupportedBackendError
 from guibot.fileresolver import FileResolver
@@ -157,6 +157,48 @@ class ImageTest(unittest.TestCase):
         self.assertIsNot(image.pil_image, third_image.pil_image)
 
 
+class FrameTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.file_all_shapes = os.path.join(common_test.unittest_dir, 'images', 'all_shapes.png')
+
+    def test_from_image(self) -> None:
+        """Test frame creation from an image without copying its data."""
+        image = Image(self.file_all_shapes)
+        frame = Frame.from_image(image)
+
+        self.assertIsInstance(frame, Frame)
+        self.assertIs(frame.pil_image, image.pil_image)
+        self.assertEqual(frame.filename, image.filename)
+        self.assertIs(Frame.from_image(frame), frame)
+
+    def test_views(self) -> None:
+        """Test lazily derived views are computed once and read-only."""
+        frame = Frame(self.file_all_shapes)
+
+        self.assertIs(frame.rgb, frame.rgb)
+        self.assertEqual(frame.rgb.shape, (300, 400, 3))
+        self.assertFalse(frame.rgb.flags.writeable)
+        self.assertIs(frame.gray, frame.gray)
+        self.assertEqual(frame.gray.shape, (300, 400))
+        self.assertFalse(frame.gray.flags.writeable)
+
+        build = Mock(return_value="view")
+        self.assertEqual(frame.view("custom", build), "view")
+        self.assertEqual(frame.view("custom", build), "view")
+        build.assert_called_once_with()
+
+    def test_pyramid(self) -> None:
+        """Test pyramid levels of a frame."""
+        frame = Frame(self.file_all_shapes)
+
+        self.assertIs(frame.pyramid(0), frame.gray)
+        self.assertIs(frame.pyramid(0, gray=False), frame.rgb)
+        self.assertEqual(frame.pyramid(1).shape, (150, 200))
+        self.assertEqual(frame.pyramid(2, gray=False).shape, (75, 100, 3))
+        self.assertIs(frame.pyramid(2), frame.pyramid(2))
+
+
 class ChainTest(unittest.TestCase):
     """Tests for the chain target (series of steps)."""
 